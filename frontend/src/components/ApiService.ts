@@ -13,6 +13,15 @@ export interface IAnnouncementsResponse {
   announcements: IAnnouncementEntry[];
 }
 
+export interface IBulkSessionAccessRequest {
+  api_key: string;
+  entries: ISessionAccessEntry[];
+}
+
+export interface IBulkSessionAccessResponse {
+  results: ISuccessResponse[];
+}
+
 export interface IChangeEmailRequest {
   email: string;
 }
@@ -55,6 +64,7 @@ export interface IGhostFileResponseEntry {
 
 export interface IGhostFilesResponse {
   files: IGhostFileResponseEntry[];
+  next_cursor: string | null;
 }
 
 export interface IGhostInfoRequest {
@@ -64,6 +74,15 @@ export interface IGhostInfoRequest {
   tags: number[];
 }
 
+export interface IGhostsQuery {
+  cursor: string | null;
+  finish_type: string | null;
+  level_id: number | null;
+  limit: number | null;
+  tags: number[];
+  username: string | null;
+}
+
 export interface ILevelInfo {
   id: number;
   identifier: string;
@@ -116,6 +135,12 @@ export interface ISession {
   time: ITimeSpan | null;
 }
 
+export interface ISessionAccessEntry {
+  auth_token: string;
+  session_id: string;
+  username: string;
+}
+
 export interface ISessionAccessRequest {
   api_key: string;
   auth_token: string;
@@ -217,6 +242,53 @@ function validateAnnouncementsResponse(data: IAnnouncementsResponse): void {
   }
 }
 
+function validateBulkSessionAccessRequest(
+  data: IBulkSessionAccessRequest,
+): void {
+  if (data.api_key === undefined) {
+    throw new SchemaValidationError(
+      "BulkSessionAccessRequest.api_key is undefined",
+    );
+  }
+  if (data.api_key === null) {
+    throw new SchemaValidationError("BulkSessionAccessRequest.api_key is null");
+  }
+  if (data.api_key.length < 1) {
+    throw new SchemaValidationError(
+      "BulkSessionAccessRequest.api_key is too short",
+    );
+  }
+  if (data.entries === undefined) {
+    throw new SchemaValidationError(
+      "BulkSessionAccessRequest.entries is undefined",
+    );
+  }
+  if (data.entries === null) {
+    throw new SchemaValidationError("BulkSessionAccessRequest.entries is null");
+  }
+  for (const fieldData of data.entries) {
+    validateSessionAccessEntry(fieldData);
+  }
+}
+
+function validateBulkSessionAccessResponse(
+  data: IBulkSessionAccessResponse,
+): void {
+  if (data.results === undefined) {
+    throw new SchemaValidationError(
+      "BulkSessionAccessResponse.results is undefined",
+    );
+  }
+  if (data.results === null) {
+    throw new SchemaValidationError(
+      "BulkSessionAccessResponse.results is null",
+    );
+  }
+  for (const fieldData of data.results) {
+    validateSuccessResponse(fieldData);
+  }
+}
+
 function validateChangeEmailRequest(data: IChangeEmailRequest): void {
   if (data.email === undefined) {
     throw new SchemaValidationError("ChangeEmailRequest.email is undefined");
@@ -462,6 +534,19 @@ function validateGhostFilesResponse(data: IGhostFilesResponse): void {
   for (const fieldData of data.files) {
     validateGhostFileResponseEntry(fieldData);
   }
+
+  if (data.next_cursor === undefined) {
+    throw new SchemaValidationError(
+      "GhostFilesResponse.next_cursor is undefined",
+    );
+  }
+  if (data.next_cursor !== null) {
+    if (data.next_cursor.length < 1) {
+      throw new SchemaValidationError(
+        "GhostFilesResponse.next_cursor is too short",
+      );
+    }
+  }
 }
 
 function validateGhostInfoRequest(data: IGhostInfoRequest): void {
@@ -501,6 +586,68 @@ function validateGhostInfoRequest(data: IGhostInfoRequest): void {
   }
 }
 
+function validateGhostsQuery(data: IGhostsQuery): void {
+  if (data.cursor === undefined) {
+    throw new SchemaValidationError("GhostsQuery.cursor is undefined");
+  }
+  if (data.cursor !== null) {
+    if (data.cursor.length < 1) {
+      throw new SchemaValidationError("GhostsQuery.cursor is too short");
+    }
+  }
+  if (data.finish_type === undefined) {
+    throw new SchemaValidationError("GhostsQuery.finish_type is undefined");
+  }
+  if (data.finish_type !== null) {
+    if (data.finish_type.length < 1) {
+      throw new SchemaValidationError("GhostsQuery.finish_type is too short");
+    }
+  }
+  if (data.level_id === undefined) {
+    throw new SchemaValidationError("GhostsQuery.level_id is undefined");
+  }
+  if (data.level_id !== null) {
+  }
+  if (data.limit === undefined) {
+    throw new SchemaValidationError("GhostsQuery.limit is undefined");
+  }
+  if (data.limit !== null) {
+    if (data.limit < 1) {
+      throw new SchemaValidationError(
+        "GhostsQuery.limit has a value below minimum",
+      );
+    }
+    if (data.limit > 100) {
+      throw new SchemaValidationError(
+        "GhostsQuery.limit has a value above maximum",
+      );
+    }
+  }
+  if (data.tags === undefined) {
+    throw new SchemaValidationError("GhostsQuery.tags is undefined");
+  }
+  if (data.tags === null) {
+    throw new SchemaValidationError("GhostsQuery.tags is null");
+  }
+  for (const fieldData of data.tags) {
+    if (fieldData === undefined) {
+      throw new SchemaValidationError("GhostsQuery.tags is undefined");
+    }
+    if (fieldData === null) {
+      throw new SchemaValidationError("GhostsQuery.tags is null");
+    }
+  }
+
+  if (data.username === undefined) {
+    throw new SchemaValidationError("GhostsQuery.username is undefined");
+  }
+  if (data.username !== null) {
+    if (data.username.length < 1) {
+      throw new SchemaValidationError("GhostsQuery.username is too short");
+    }
+  }
+}
+
 function validateIsoDateTime(data?: string | null): void {
   if (data === undefined) {
     throw new SchemaValidationError("IsoDateTime is undefined");
@@ -821,6 +968,44 @@ function validateSession(data: ISession): void {
   }
 }
 
+function validateSessionAccessEntry(data: ISessionAccessEntry): void {
+  if (data.auth_token === undefined) {
+    throw new SchemaValidationError(
+      "SessionAccessEntry.auth_token is undefined",
+    );
+  }
+  if (data.auth_token === null) {
+    throw new SchemaValidationError("SessionAccessEntry.auth_token is null");
+  }
+  if (data.auth_token.length < 1) {
+    throw new SchemaValidationError(
+      "SessionAccessEntry.auth_token is too short",
+    );
+  }
+  if (data.session_id === undefined) {
+    throw new SchemaValidationError(
+      "SessionAccessEntry.session_id is undefined",
+    );
+  }
+  if (data.session_id === null) {
+    throw new SchemaValidationError("SessionAccessEntry.session_id is null");
+  }
+  if (data.session_id.length < 1) {
+    throw new SchemaValidationError(
+      "SessionAccessEntry.session_id is too short",
+    );
+  }
+  if (data.username === undefined) {
+    throw new SchemaValidationError("SessionAccessEntry.username is undefined");
+  }
+  if (data.username === null) {
+    throw new SchemaValidationError("SessionAccessEntry.username is null");
+  }
+  if (data.username.length < 1) {
+    throw new SchemaValidationError("SessionAccessEntry.username is too short");
+  }
+}
+
 function validateSessionAccessRequest(data: ISessionAccessRequest): void {
   if (data.api_key === undefined) {
     throw new SchemaValidationError(
@@ -1103,6 +1288,18 @@ export async function checkSessionAccess(
   return result;
 }
 
+export async function checkBulkSessionAccess(
+  body: IBulkSessionAccessRequest,
+): Promise<IBulkSessionAccessResponse> {
+  validateBulkSessionAccessRequest(body);
+  const result = (await doPost(
+    `/api/v0/sessions/check-access-bulk`,
+    body,
+  )) as IBulkSessionAccessResponse;
+  validateBulkSessionAccessResponse(result);
+  return result;
+}
+
 export async function updateSessionsPlayers(
   body: ISessionsPlayersRequest,
 ): Promise<IEmpty> {
@@ -1196,8 +1393,13 @@ export async function logout(): Promise<IEmpty> {
   return result;
 }
 
-export async function getGhosts(): Promise<IGhostFilesResponse> {
-  const result = (await doGet(`/api/v0/ghosts`)) as IGhostFilesResponse;
+export async function getGhosts(
+  query: IGhostsQuery,
+): Promise<IGhostFilesResponse> {
+  validateGhostsQuery(query);
+  const result = (await doGet(
+    `/api/v0/ghosts?${toQueryString(query)}`,
+  )) as IGhostFilesResponse;
   validateGhostFilesResponse(result);
   return result;
 }
@@ -1261,6 +1463,12 @@ export async function getGhostsQuota(): Promise<IQuotaResponse> {
   return result;
 }
 
+export async function getGhostLevels(): Promise<ILevelsResponse> {
+  const result = (await doGet(`/api/v0/ghosts/levels`)) as ILevelsResponse;
+  validateLevelsResponse(result);
+  return result;
+}
+
 export async function getAlternativeLevels(
   identifier: string,
 ): Promise<ILevelsResponse> {
@@ -1293,6 +1501,23 @@ function getCsrfHeader(): Headers {
   return headers;
 }
 
+function toQueryString(query: object): string {
+  const params = new URLSearchParams();
+  for (const [name, value] of Object.entries(query)) {
+    if (value === null || value === undefined) {
+      continue;
+    }
+    if (Array.isArray(value)) {
+      for (const entry of value) {
+        params.append(name, String(entry));
+      }
+    } else {
+      params.append(name, String(value));
+    }
+  }
+  return params.toString();
+}
+
 export async function doGet(url: string): Promise<object> {
   return await fetch(`${env.VITE_APP_SERVER_URL}${url}`, {
     credentials: "include",
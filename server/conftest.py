@@ -0,0 +1,95 @@
+from datetime import timedelta
+
+import pytest
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+
+from hsutils.test_utils import ObjectStorageStandIn
+
+
+@pytest.fixture(scope="session")
+def django_db_modify_db_settings(django_db_modify_db_settings_parallel_suffix, tmp_path_factory):
+    # in-memory SQLite databases fail on locks instead of waiting for them, which breaks testing concurrent transactions
+    if settings.DATABASES["default"]["ENGINE"] == "django.db.backends.sqlite3":
+        settings.DATABASES["default"]["TEST"]["NAME"] = str(tmp_path_factory.mktemp("db") / "test.sqlite3")
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    # committed test data is removed without signals, so the level ids remembered for it must be forgotten explicitly
+    from ghost_sharing.models import Level
+
+    cache.clear()
+    Level.forget_ids()
+    yield
+    cache.clear()
+    Level.forget_ids()
+
+
+@pytest.fixture
+def object_storage(settings):
+    with ObjectStorageStandIn() as storage:
+        settings.MINIO_URL = storage.endpoint
+        settings.MINIO_SECURE = False
+        settings.MINIO_REGION = "us-east-1"
+        yield storage
+
+
+@pytest.fixture
+def create_users(django_user_model):
+    # active users named user<i>, created with a single query
+    def create(count: int, offset: int = 0) -> list:
+        return django_user_model.objects.bulk_create(
+            django_user_model(is_active=True, username=f"user{i}", email=f"user{i}@example.com")
+            for i in range(offset, offset + count)
+        )
+
+    return create
+
+
+@pytest.fixture
+def create_tags():
+    from haunted_sessions.models import Tag
+
+    def create(count: int) -> list[Tag]:
+        return [Tag.objects.get_or_create(name=f"tag{i}", description="")[0] for i in range(count)]
+
+    return create
+
+
+@pytest.fixture
+def create_levels():
+    from ghost_sharing.models import Gameflow, Level
+
+    # levels LEVEL<i> of the given gameflow, which is created if needed
+    def create(count: int, gameflow: str = "gameflow") -> list[Level]:
+        gameflow, _ = Gameflow.objects.get_or_create(identifier=gameflow, defaults={"title": gameflow.capitalize()})
+        return Level.objects.bulk_create(
+            Level(gameflow=gameflow, identifier=f"LEVEL{i}", title=f"Level {i}") for i in range(count)
+        )
+
+    return create
+
+
+@pytest.fixture
+def build_ghost():
+    from ghost_sharing.models import Ghost, GhostFinishType
+
+    # an unsaved ghost, published unless told otherwise, for save() or bulk_create()
+    def build(**fields) -> Ghost:
+        published = fields.pop("published", True)
+        return Ghost(
+            **{
+                "published": published,
+                "unpublished_at": None if published else timezone.now(),
+                "data_size": 1,
+                "duration": timedelta(seconds=1),
+                "finish_type": GhostFinishType.completed,
+                "original_filename": "ghost.tar.xz",
+                "description": "ghost",
+                **fields,
+            },
+        )
+
+    return build
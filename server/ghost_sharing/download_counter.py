@@ -0,0 +1,118 @@
+import logging
+from collections import defaultdict
+from typing import Iterable
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import F
+from django.db.transaction import atomic
+from django.utils import timezone
+
+from .models import Ghost
+
+# With GHOST_DOWNLOADS_BUFFERED, downloads are accumulated in the cache and written to the ghosts in bulk by
+# flush_downloads, so that downloading never waits for a lock on the ghost row.
+#
+# The cache cannot hold a set of ids, so the ghosts with pending downloads are appended to a log of numbered slots
+# instead. A ghost is logged by the download which brings its counter from zero to one, or by the flush which leaves
+# downloads counted meanwhile in its counter, so each flush only reads the ghosts downloaded since the last one.
+
+_FLUSH_BATCH_SIZE = 1000
+_PENDING_LOG_END_KEY = "ghost-downloads-pending:end"
+_PENDING_LOG_FLUSHED_KEY = "ghost-downloads-pending:flushed"
+# the slot at which the last flush stopped because it was not written yet
+_PENDING_LOG_STALLED_KEY = "ghost-downloads-pending:stalled"
+
+
+def _downloads_cache_key(ghost_id: int) -> str:
+    return f"ghost-downloads:{ghost_id}"
+
+
+def _pending_slot_cache_key(slot: int) -> str:
+    return f"ghost-downloads-pending:{slot}"
+
+
+def _add_downloads(ghost_ids: Iterable[int], downloads: int):
+    Ghost.objects.filter(id__in=ghost_ids).update(downloads=F("downloads") + downloads, updated_at=timezone.now())
+
+
+def _log_pending(ghost_id: int):
+    cache.add(_PENDING_LOG_END_KEY, 0, timeout=None)
+    slot = cache.incr(_PENDING_LOG_END_KEY)
+    cache.set(_pending_slot_cache_key(slot), ghost_id, timeout=None)
+
+
+def count_download(ghost_id: int):
+    if not settings.GHOST_DOWNLOADS_BUFFERED:
+        _add_downloads([ghost_id], 1)
+        return
+
+    key = _downloads_cache_key(ghost_id)
+    try:
+        downloads = cache.incr(key)
+    except ValueError:
+        # incr only works on existing keys, and another worker may have created it in the meantime
+        downloads = 1 if cache.add(key, 1, timeout=None) else cache.incr(key)
+    if downloads == 1:
+        _log_pending(ghost_id)
+
+
+def _read_pending_log() -> tuple[set[int], int]:
+    # returns the logged ghost ids and the last slot read
+    flushed = cache.get(_PENDING_LOG_FLUSHED_KEY, 0)
+    end = cache.get(_PENDING_LOG_END_KEY, 0)
+    stalled = cache.get(_PENDING_LOG_STALLED_KEY)
+    ghost_ids = set()
+    for batch_start in range(flushed + 1, end + 1, _FLUSH_BATCH_SIZE):
+        slots = range(batch_start, min(batch_start + _FLUSH_BATCH_SIZE, end + 1))
+        logged = cache.get_many([_pending_slot_cache_key(slot) for slot in slots])
+        for slot in slots:
+            ghost_id = logged.get(_pending_slot_cache_key(slot))
+            if ghost_id is not None:
+                ghost_ids.add(ghost_id)
+            elif slot == stalled:
+                # still missing after a whole flush interval, so it is not going to be written anymore
+                logging.warning("skipping unwritten pending download slot %d", slot)
+            else:
+                # a download may have taken the slot without having written it yet
+                cache.set(_PENDING_LOG_STALLED_KEY, slot, timeout=None)
+                return ghost_ids, slot - 1
+    return ghost_ids, end
+
+
+def flush_downloads() -> int:
+    flushed = cache.get(_PENDING_LOG_FLUSHED_KEY, 0)
+    ghost_ids, last_slot = _read_pending_log()
+
+    ghost_ids_by_downloads: dict[int, list[int]] = defaultdict(list)
+    ghost_id_list = sorted(ghost_ids)
+    for batch_start in range(0, len(ghost_id_list), _FLUSH_BATCH_SIZE):
+        batch = ghost_id_list[batch_start : batch_start + _FLUSH_BATCH_SIZE]
+        pending = cache.get_many([_downloads_cache_key(ghost_id) for ghost_id in batch])
+        for ghost_id in batch:
+            downloads = pending.get(_downloads_cache_key(ghost_id))
+            if downloads is None:
+                logging.warning("download counter of ghost %d was evicted from the cache", ghost_id)
+            elif downloads:
+                ghost_ids_by_downloads[downloads].append(ghost_id)
+
+    # ghosts with the same number of new downloads share one update; the counters are only reduced once the downloads
+    # are stored, so a failing update keeps them for the next flush
+    with atomic():
+        for downloads, downloaded_ids in ghost_ids_by_downloads.items():
+            _add_downloads(downloaded_ids, downloads)
+
+    for downloads, downloaded_ids in ghost_ids_by_downloads.items():
+        for ghost_id in downloaded_ids:
+            # only take what was written, downloads counted meanwhile stay for the next flush
+            try:
+                remaining = cache.decr(_downloads_cache_key(ghost_id), downloads)
+            except ValueError:
+                logging.warning("download counter of ghost %d was evicted from the cache", ghost_id)
+                continue
+            if remaining > 0:
+                _log_pending(ghost_id)
+
+    cache.delete_many([_pending_slot_cache_key(slot) for slot in range(flushed + 1, last_slot + 1)])
+    cache.set(_PENDING_LOG_FLUSHED_KEY, last_slot, timeout=None)
+    return sum(downloads * len(downloaded_ids) for downloads, downloaded_ids in ghost_ids_by_downloads.items())
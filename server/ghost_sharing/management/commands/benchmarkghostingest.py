@@ -0,0 +1,85 @@
+import random
+import tarfile
+import time
+from io import BytesIO
+from pathlib import Path
+from typing import Callable
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from ghost_sharing.views import _inspect_ghost_archive, _read_ghost_metadata
+
+# about 33 KiB, including a tag the metadata parser has to ignore
+_SYNTHETIC_METADATA = (
+    b"ghost:\n  level: LEVEL1\n  duration: 54000\n  finishState: Completed\n  unknownTag: !foo bar\n"
+    + b"".join(b"  extra%d: %d\n" % (i, i) for i in range(2000))
+)
+
+
+def _synthetic_archive(rnd: random.Random, frame_size: int) -> bytes:
+    # frame records of slowly changing values, like recorded positions, so they compress like real ghosts do
+    state = [rnd.randrange(2**16) for _ in range(16)]
+    frames = bytearray()
+    deltas = iter(rnd.choices(range(-3, 4), k=frame_size // 2 + 16))
+    while len(frames) < frame_size:
+        state = [(value + next(deltas)) & 0xFFFF for value in state]
+        frames += b"".join(value.to_bytes(2, "little") for value in state)
+
+    data = BytesIO()
+    with tarfile.open(fileobj=data, mode="w:xz") as archive:
+        for name, content in (("ghost.yml", _SYNTHETIC_METADATA), ("ghost.bin", bytes(frames))):
+            info = tarfile.TarInfo(name)
+            info.size = len(content)
+            archive.addfile(info, BytesIO(content))
+    return data.getvalue()
+
+
+def _best_cpu_time(repeat: int, run: Callable[[], None]) -> float:
+    # the CPU time of this process, as the inspection runs in an ingest process when uploading
+    best = None
+    for _ in range(repeat):
+        started = time.process_time()
+        run()
+        elapsed = time.process_time() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+class Command(BaseCommand):
+    help = "Measures the CPU time of inspecting uploaded ghost archives, without storing anything"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "archives",
+            nargs="*",
+            type=Path,
+            help="Ghost archives to inspect instead of generated ones",
+        )
+        parser.add_argument("--count", type=int, default=6, help="Number of archives to generate")
+        parser.add_argument("--frame-size", type=int, default=15, help="MiB of frame data per generated archive")
+        parser.add_argument("--repeat", type=int, default=3, help="Runs of which the fastest one is reported")
+
+    def handle(self, *args, archives: list[Path], count: int, frame_size: int, repeat: int, **options):
+        if archives:
+            sources = [path.read_bytes() for path in archives]
+        else:
+            rnd = random.Random(1)
+            sources = [_synthetic_archive(rnd, frame_size * 2**20) for _ in range(count)]
+        self.stdout.write(f"{len(sources)} archives, {sum(map(len, sources)) // len(sources) // 1024} KiB on average")
+
+        def inspect():
+            for source in sources:
+                result = _inspect_ghost_archive(
+                    source,
+                    "ghost.tar.xz",
+                    settings.GHOST_ARCHIVE_MAX_MEMBERS,
+                    settings.GHOST_ARCHIVE_MAX_UNPACKED_SIZE,
+                )
+                if isinstance(result, tuple):
+                    raise CommandError(f"archive rejected: {result[1].message}")
+
+        self.stdout.write(f"Inspection: {_best_cpu_time(repeat, inspect) / len(sources) * 1000:.1f} ms per archive")
+        if not archives:
+            metadata_time = _best_cpu_time(repeat, lambda: _read_ghost_metadata(BytesIO(_SYNTHETIC_METADATA)))
+            self.stdout.write(f"Metadata parsing: {metadata_time * 1000:.1f} ms per archive")
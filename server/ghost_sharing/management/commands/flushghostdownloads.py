@@ -0,0 +1,10 @@
+from django.core.management.base import BaseCommand
+
+from ghost_sharing.download_counter import flush_downloads
+
+
+class Command(BaseCommand):
+    help = "Writes the buffered ghost download counts to the database"
+
+    def handle(self, *args, **options):
+        self.stdout.write(f"Flushed {flush_downloads()} downloads")
@@ -0,0 +1,52 @@
+from typing import Optional
+
+from django.core.management.base import BaseCommand
+from django.db.transaction import on_commit
+from minio import S3Error
+
+from ghost_sharing.models import Ghost, GhostBlob
+from hsutils.minio import copy_ghost_data_to_blob, delete_ghost, hash_ghost_data
+from hsutils.transaction import immediate_atomic
+
+
+@immediate_atomic()
+def _migrate(ghost_id: int) -> Optional[bool]:
+    # publishing moves the data stored per ghost, so the ghost must not change meanwhile
+    ghost = Ghost.objects.select_for_update().filter(id=ghost_id, blob__isnull=True).first()
+    if ghost is None:
+        return None
+    data_hash = hash_ghost_data(ghost)
+    if data_hash is None:
+        return None
+    blob, created = GhostBlob.objects.select_for_update().get_or_create(
+        hash=data_hash,
+        defaults={"size": ghost.data_size},
+    )
+    if created:
+        copy_ghost_data_to_blob(ghost, blob)
+
+    Ghost.objects.filter(id=ghost.id).update(blob=blob, hash=blob.hash)
+    GhostBlob.apply(blob.hash, 1)
+    # the instance still refers to the data stored per ghost, which is only removed once the ghost does not anymore
+    on_commit(lambda: delete_ghost(ghost))
+    return not created
+
+
+class Command(BaseCommand):
+    help = "Moves the data of ghosts uploaded before deduplication to the shared blobs"
+
+    def handle(self, *args, **options):
+        migrated = 0
+        shared = 0
+        for ghost_id in list(Ghost.objects.filter(blob__isnull=True).order_by("id").values_list("id", flat=True)):
+            try:
+                result = _migrate(ghost_id)
+            except S3Error as e:
+                # the data vanished while migrating, which reconcileghosts takes care of
+                if e.code != "NoSuchKey":
+                    raise
+                result = None
+            if result is not None:
+                migrated += 1
+                shared += result
+        self.stdout.write(f"Migrated {migrated} ghosts, {shared} of them to existing blobs")
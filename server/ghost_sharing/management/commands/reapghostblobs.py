@@ -0,0 +1,23 @@
+from django.core.management.base import BaseCommand
+
+from ghost_sharing.models import GhostBlob
+from hsutils.minio import delete_ghost_blob
+from hsutils.transaction import immediate_atomic
+
+
+class Command(BaseCommand):
+    help = "Removes ghost data which is not referenced by any ghost anymore"
+
+    def handle(self, *args, **options):
+        deleted = 0
+        for blob_hash in list(GhostBlob.objects.filter(references=0).values_list("hash", flat=True)):
+            with immediate_atomic():
+                # uploads of the same content lock the blob as well, so it cannot be referenced again meanwhile; the
+                # data is removed first, so an upload waiting for the lock stores it anew
+                blob = GhostBlob.objects.select_for_update().filter(hash=blob_hash, references=0).first()
+                if blob is None or blob.ghosts.exists():
+                    continue
+                delete_ghost_blob(blob)
+                blob.delete()
+                deleted += 1
+        self.stdout.write(f"Deleted {deleted} unreferenced blobs")
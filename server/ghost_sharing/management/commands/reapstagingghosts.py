@@ -0,0 +1,35 @@
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from ghost_sharing.models import Ghost
+from hsutils.minio import STAGING_GHOST_LIFETIME, get_missing_staging_ghost_data
+
+
+class Command(BaseCommand):
+    help = "Removes staging ghosts whose data has expired"
+
+    def handle(self, *args, **options):
+        # deduplicated data does not expire with the staging bucket, so those ghosts expire a while after they were
+        # uploaded or unpublished instead
+        expired_ids = list(
+            Ghost.objects.filter(
+                published=False,
+                blob__isnull=False,
+                unpublished_at__lte=timezone.now() - STAGING_GHOST_LIFETIME,
+            ).values_list("id", flat=True),
+        )
+        # the ghosts are read before listing the bucket; their data is stored before they are committed, so ghosts
+        # uploaded in the meantime cannot be mistaken for expired ones
+        staging_ghosts = list(
+            Ghost.objects.filter(published=False, blob__isnull=True).only(
+                "id",
+                "owner_id",
+                "file_id",
+                "original_filename",
+            ),
+        )
+        if staging_ghosts:
+            expired_ids += [ghost.id for ghost in get_missing_staging_ghost_data(staging_ghosts)]
+        total_deleted, objects_deleted = Ghost.objects.filter(id__in=expired_ids).delete()
+        ghosts_deleted = objects_deleted.get(Ghost._meta.label, 0)
+        self.stdout.write(f"Deleted {total_deleted} objects, {ghosts_deleted} staging ghosts")
@@ -0,0 +1,75 @@
+from datetime import timedelta
+from itertools import chain
+from typing import Iterator
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from ghost_sharing.models import Ghost, GhostBlob
+from hsutils.minio import (
+    OrphanedGhostData,
+    find_orphaned_ghost_blobs,
+    find_orphaned_ghost_data,
+    remove_orphaned_ghost_data,
+)
+
+_BATCH_SIZE = 1000
+
+
+def _find_orphaned_blob_ghosts(min_age: timedelta) -> Iterator[Ghost | OrphanedGhostData]:
+    blobs = GhostBlob.objects.order_by("hash").only("hash", "updated_at").iterator(chunk_size=_BATCH_SIZE)
+    for orphan in find_orphaned_ghost_blobs(blobs, min_age):
+        if isinstance(orphan, OrphanedGhostData):
+            yield orphan
+        else:
+            # the blob itself is removed by the reapghostblobs command once its ghosts are gone
+            yield from orphan.ghosts.only("id", "original_filename")
+
+
+class Command(BaseCommand):
+    help = "Finds ghosts without data and data without ghosts, and optionally deletes them"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--delete", action="store_true", help="Delete the orphans instead of only reporting them")
+        parser.add_argument(
+            "--min-age",
+            type=int,
+            default=24,
+            help="Ignore ghosts and data changed within this many hours",
+        )
+
+    def handle(self, *args, delete: bool, min_age: int, **options):
+        ghosts = (
+            Ghost.objects.order_by("owner_id")
+            .only("id", "owner_id", "file_id", "blob_id", "original_filename", "published", "updated_at")
+            .iterator(chunk_size=_BATCH_SIZE)
+        )
+        orphaned_ghost_ids = []
+        orphaned_data = []
+        total_orphaned_data = 0
+        for orphan in chain(
+            find_orphaned_ghost_data(ghosts, timedelta(hours=min_age)),
+            _find_orphaned_blob_ghosts(timedelta(hours=min_age)),
+        ):
+            if isinstance(orphan, OrphanedGhostData):
+                bucket = settings.MINIO_GHOST_BUCKET if orphan.published else settings.MINIO_GHOST_BUCKET_STAGING
+                self.stdout.write(f"Data without ghost: {bucket}/{orphan.object_name}")
+                total_orphaned_data += 1
+                orphaned_data.append(orphan)
+                if delete and len(orphaned_data) >= _BATCH_SIZE:
+                    remove_orphaned_ghost_data(orphaned_data)
+                    orphaned_data = []
+            else:
+                self.stdout.write(f"Ghost without data: {orphan.id} ({orphan.original_filename})")
+                orphaned_ghost_ids.append(orphan.id)
+
+        if delete:
+            remove_orphaned_ghost_data(orphaned_data)
+            # the ghosts are only deleted once they are not iterated anymore
+            for batch_start in range(0, len(orphaned_ghost_ids), _BATCH_SIZE):
+                Ghost.objects.filter(id__in=orphaned_ghost_ids[batch_start : batch_start + _BATCH_SIZE]).delete()
+
+        self.stdout.write(
+            f"{'Deleted' if delete else 'Found'} {len(orphaned_ghost_ids)} ghosts without data"
+            f" and {total_orphaned_data} objects without ghosts",
+        )
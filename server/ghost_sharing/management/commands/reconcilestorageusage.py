@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from ghost_sharing.models import StorageUsage
+
+
+class Command(BaseCommand):
+    help = "Recomputes the storage usage of all users from their ghosts"
+
+    def handle(self, *args, **options):
+        corrected = StorageUsage.reconcile()
+        self.stdout.write(f"Corrected {corrected} storage usages")
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.18 on 2026-10-18 13:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("ghost_sharing", "0003_remove_ghost_level_new_alter_ghost_level"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="ghost",
+            index=models.Index(fields=["published", "-created_at", "-id"], name="ghost_published_created_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="ghost",
+            index=models.Index(fields=["level", "published", "-created_at"], name="ghost_level_created_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="ghost",
+            index=models.Index(fields=["finish_type", "published", "-created_at"], name="ghost_finish_created_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="ghost",
+            index=models.Index(fields=["owner", "published", "-created_at"], name="ghost_owner_created_idx"),
+        ),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 5.2.18 on 2026-10-18 14:00
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("ghost_sharing", "0005_storageusage"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="GhostBlob",
+            fields=[
+                ("created_at", models.DateTimeField(default=django.utils.timezone.now, editable=False)),
+                ("updated_at", models.DateTimeField(default=django.utils.timezone.now, editable=False)),
+                ("hash", models.CharField(max_length=64, primary_key=True, serialize=False)),
+                ("size", models.PositiveIntegerField()),
+                ("references", models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                "ordering": ("created_at",),
+                "get_latest_by": "created_at",
+                "abstract": False,
+            },
+        ),
+        migrations.AddField(
+            model_name="ghost",
+            name="blob",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.PROTECT,
+                related_name="ghosts",
+                to="ghost_sharing.ghostblob",
+            ),
+        ),
+    ]
@@ -0,0 +1,55 @@
+# Generated by Django 5.2.18 on 2026-10-18 14:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("ghost_sharing", "0006_ghostblob"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="ghost",
+            index=models.Index(
+                condition=models.Q(("published", True)), fields=["-created_at", "-id"], name="ghost_published_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="ghost",
+            index=models.Index(
+                condition=models.Q(("published", True)),
+                fields=["level", "-created_at", "-id"],
+                name="ghost_published_level_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="ghost",
+            index=models.Index(
+                condition=models.Q(("published", True)),
+                fields=["finish_type", "-created_at", "-id"],
+                name="ghost_published_finish_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="ghost",
+            index=models.Index(fields=["published", "updated_at"], name="ghost_published_updated_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="ghost",
+            index=models.Index(
+                condition=models.Q(("published", False)), fields=["created_at"], name="ghost_staging_created_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="ghostblob",
+            index=models.Index(
+                condition=models.Q(("references", 0)), fields=["references"], name="ghostblob_unreferenced_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="level",
+            index=models.Index(fields=["identifier"], name="level_identifier_idx"),
+        ),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 5.2.18 on 2026-10-18 15:19
+
+from django.db import migrations, models
+from django.db.models import F
+
+
+def backfill_unpublished_at(apps, schema_editor):
+    # the last change of an unpublished ghost is no earlier than its unpublishing, so none of them expires early
+    Ghost = apps.get_model("ghost_sharing", "Ghost")
+    Ghost.objects.using(schema_editor.connection.alias).filter(published=False).update(unpublished_at=F("updated_at"))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("ghost_sharing", "0007_query_indexes"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="ghost",
+            name="ghost_staging_created_idx",
+        ),
+        migrations.AddField(
+            model_name="ghost",
+            name="unpublished_at",
+            field=models.DateTimeField(blank=True, default=None, null=True),
+        ),
+        migrations.RunPython(
+            code=backfill_unpublished_at,
+            reverse_code=migrations.RunPython.noop,
+        ),
+        migrations.AddIndex(
+            model_name="ghost",
+            index=models.Index(
+                condition=models.Q(("published", False)),
+                fields=["unpublished_at"],
+                name="ghost_staging_unpublished_idx",
+            ),
+        ),
+    ]
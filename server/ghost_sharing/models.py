@@ -1,10 +1,22 @@
+import threading
 import uuid
+from collections import OrderedDict
+from functools import partial
+from typing import Iterable
 
 from django.contrib.auth import get_user_model
 from django.db import models
+from django.db.models import F, Q, Sum
+from django.db.models.functions import Greatest
+from django.db.models.signals import post_delete, post_save
+from django.db.transaction import on_commit
+from django.dispatch import receiver
+from django.utils import timezone
 
+from haunted_auth.models import get_stored_user_state
 from haunted_sessions.models import Tag
 from hsutils import TimestampedModel
+from hsutils.transaction import immediate_atomic
 
 User = get_user_model()
 
@@ -33,18 +45,207 @@ class Level(TimestampedModel):
 
     class Meta:
         unique_together = ("gameflow", "identifier")
+        indexes = [
+            # the unique constraint starts with the gameflow, so it does not help finding a level in all gameflows
+            models.Index(fields=["identifier"], name="level_identifier_idx"),
+        ]
+
+    @classmethod
+    def ids_of(cls, gameflow_identifier: str, identifiers: Iterable[str]) -> dict[str, int]:
+        # unknown gameflows and levels are created with their identifiers as titles; resolved ids are remembered once
+        # they are committed, so uploads of known levels do not need any query
+        ids = {}
+        missing = []
+        with _level_ids_lock:
+            for identifier in set(identifiers):
+                key = (gameflow_identifier, identifier)
+                if key in _level_ids:
+                    _level_ids.move_to_end(key)
+                    ids[identifier] = _level_ids[key]
+                else:
+                    missing.append(identifier)
+        if not missing:
+            return ids
+
+        gameflow, _ = Gameflow.objects.get_or_create(
+            identifier=gameflow_identifier,
+            defaults={"title": gameflow_identifier},
+        )
+        resolved = dict(cls.objects.filter(gameflow=gameflow, identifier__in=missing).values_list("identifier", "id"))
+        for identifier in missing:
+            if identifier not in resolved:
+                # the unique constraint decides between concurrent uploads creating the same level
+                level, _ = cls.objects.get_or_create(
+                    gameflow=gameflow,
+                    identifier=identifier,
+                    defaults={"title": identifier},
+                )
+                resolved[identifier] = level.id
+        on_commit(partial(_remember_level_ids, gameflow_identifier, resolved))
+        return ids | resolved
+
+    @classmethod
+    def forget_ids(cls):
+        with _level_ids_lock:
+            _level_ids.clear()
+
+
+_LEVEL_IDS_CACHE_SIZE = 1024
+_level_ids: OrderedDict[tuple[str, str], int] = OrderedDict()
+_level_ids_lock = threading.Lock()
+
+
+def _remember_level_ids(gameflow_identifier: str, ids: dict[str, int]):
+    with _level_ids_lock:
+        for identifier, level_id in ids.items():
+            _level_ids[(gameflow_identifier, identifier)] = level_id
+            _level_ids.move_to_end((gameflow_identifier, identifier))
+        while len(_level_ids) > _LEVEL_IDS_CACHE_SIZE:
+            _level_ids.popitem(last=False)
+
+
+class GhostBlob(TimestampedModel):
+    # archive data stored once for all ghosts uploaded with the same content, keyed by its SHA-256; the references are
+    # kept up to date by the receivers below, unreferenced blobs are removed by the reapghostblobs command
+    hash = models.CharField(max_length=64, primary_key=True)
+    size = models.PositiveIntegerField()
+    references = models.PositiveIntegerField(default=0)
+
+    class Meta(TimestampedModel.Meta):
+        indexes = [
+            # only the few unreferenced blobs are of interest to the reaper; without support for index conditions, this
+            # is a plain index on the references
+            models.Index(fields=["references"], condition=Q(references=0), name="ghostblob_unreferenced_idx"),
+        ]
+
+    def __str__(self):
+        return self.hash
+
+    @classmethod
+    def apply(cls, blob_hash: str, references: int):
+        cls.objects.filter(hash=blob_hash).update(
+            references=Greatest(F("references") + references, 0),
+            updated_at=timezone.now(),
+        )
 
 
 class Ghost(TimestampedModel):
     owner = models.ForeignKey(to=User, on_delete=models.deletion.PROTECT)
     file_id = models.UUIDField(default=uuid.uuid4, unique=True, editable=False)
+    # None for ghosts uploaded before deduplication, whose data is stored per ghost
+    blob = models.ForeignKey(to=GhostBlob, related_name="ghosts", null=True, blank=True, on_delete=models.PROTECT)
     level = models.ForeignKey(to=Level, related_name="ghosts", null=False, on_delete=models.PROTECT)
     tags = models.ManyToManyField(to=Tag, related_name="ghosts")
     hash = models.CharField(max_length=64, blank=True, null=False)
     published = models.BooleanField()
+    # when the ghost was uploaded or unpublished; unpublished ghosts expire a while after it
+    unpublished_at = models.DateTimeField(null=True, blank=True, default=None)
     downloads = models.PositiveIntegerField(default=0)
     data_size = models.PositiveIntegerField()
     finish_type = models.CharField(max_length=16, null=True, choices=GhostFinishType.choices)
     duration = models.DurationField()
     original_filename = models.CharField(max_length=64, blank=False)
     description = models.CharField(blank=False, null=False, max_length=512)
+
+    class Meta(TimestampedModel.Meta):
+        indexes = [
+            # the published listing pages through these; MySQL ignores index conditions, so it uses the plain ones
+            # instead, while SQLite only matches a boolean filter against the condition of an index, not against its
+            # columns, so it needs the partial ones
+            models.Index(fields=["published", "-created_at", "-id"], name="ghost_published_created_idx"),
+            models.Index(fields=["level", "published", "-created_at"], name="ghost_level_created_idx"),
+            models.Index(fields=["finish_type", "published", "-created_at"], name="ghost_finish_created_idx"),
+            models.Index(fields=["-created_at", "-id"], condition=Q(published=True), name="ghost_published_idx"),
+            models.Index(
+                fields=["level", "-created_at", "-id"],
+                condition=Q(published=True),
+                name="ghost_published_level_idx",
+            ),
+            models.Index(
+                fields=["finish_type", "-created_at", "-id"],
+                condition=Q(published=True),
+                name="ghost_published_finish_idx",
+            ),
+            models.Index(fields=["owner", "published", "-created_at"], name="ghost_owner_created_idx"),
+            # covers the version of the published listing, so it does not need to read the ghosts themselves
+            models.Index(fields=["published", "updated_at"], name="ghost_published_updated_idx"),
+            # staging ghosts are few and short-lived, so this stays small
+            models.Index(fields=["unpublished_at"], condition=Q(published=False), name="ghost_staging_unpublished_idx"),
+        ]
+
+
+class StorageUsage(models.Model):
+    # the total data size of a user's ghosts, kept up to date by the receivers below, so quota checks are O(1); it is
+    # computed when first needed, and reconcile() corrects anything bypassing model signals (e.g. QuerySet.update())
+    owner = models.OneToOneField(to=User, primary_key=True, related_name="storage_usage", on_delete=models.CASCADE)
+    used = models.PositiveBigIntegerField(default=0)
+
+    @staticmethod
+    def _computed(owner_id: int) -> int:
+        return Ghost.objects.filter(owner_id=owner_id).aggregate(Sum("data_size"))["data_size__sum"] or 0
+
+    @classmethod
+    def of(cls, owner: User, lock: bool = False) -> int:
+        # with lock, the row stays locked until the end of the transaction, so concurrent uploads of the same owner
+        # cannot all pass the quota check before any of them is counted
+        queryset = cls.objects.select_for_update() if lock else cls.objects
+        usage, _ = queryset.get_or_create(owner_id=owner.id, defaults={"used": lambda: cls._computed(owner.id)})
+        return usage.used
+
+    @classmethod
+    @immediate_atomic()
+    def reconcile(cls) -> int:
+        computed = dict(Ghost.objects.order_by().values_list("owner_id").annotate(Sum("data_size")))
+        corrected = []
+        for usage in cls.objects.select_for_update().order_by("owner_id"):
+            used = computed.get(usage.owner_id) or 0
+            if usage.used != used:
+                usage.used = used
+                corrected.append(usage)
+        cls.objects.bulk_update(corrected, ["used"], batch_size=1000)
+        return len(corrected)
+
+    @classmethod
+    def apply(cls, owner_id: int, delta: int):
+        # owners without a row are computed from scratch when first needed
+        if delta:
+            cls.objects.filter(owner_id=owner_id).update(used=Greatest(F("used") + delta, 0))
+
+
+@receiver(post_save, sender=Gameflow)
+@receiver(post_delete, sender=Gameflow)
+@receiver(post_save, sender=Level)
+@receiver(post_delete, sender=Level)
+def forget_level_ids(sender, instance: Gameflow | Level, **kwargs):
+    Level.forget_ids()
+
+
+@receiver(post_save, sender=Ghost)
+def count_created_ghost_size(sender, instance: Ghost, created: bool, **kwargs):
+    if created:
+        StorageUsage.apply(instance.owner_id, instance.data_size)
+
+
+@receiver(post_delete, sender=Ghost)
+def count_deleted_ghost_size(sender, instance: Ghost, **kwargs):
+    StorageUsage.apply(instance.owner_id, -instance.data_size)
+
+
+@receiver(post_save, sender=Ghost)
+def reference_ghost_blob(sender, instance: Ghost, created: bool, **kwargs):
+    if created and instance.blob_id is not None:
+        GhostBlob.apply(instance.blob_id, 1)
+
+
+@receiver(post_delete, sender=Ghost)
+def release_ghost_blob(sender, instance: Ghost, **kwargs):
+    if instance.blob_id is not None:
+        GhostBlob.apply(instance.blob_id, -1)
+
+
+@receiver(post_save, sender=User)
+def touch_renamed_owner_ghosts(sender, instance: User, **kwargs):
+    # the ghosts show the username, so their versions must change
+    stored = get_stored_user_state(instance)
+    if stored is not None and stored["username"] != instance.username:
+        Ghost.objects.filter(owner=instance).update(updated_at=timezone.now())
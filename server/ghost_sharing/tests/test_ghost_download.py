@@ -0,0 +1,291 @@
+import os
+from http import HTTPStatus
+from io import StringIO
+from urllib.parse import parse_qs, urlsplit
+from urllib.request import Request, urlopen
+
+import pytest
+from django.conf import settings
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import DatabaseError, connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+
+from ghost_sharing import download_counter
+from ghost_sharing.download_counter import count_download, flush_downloads
+from ghost_sharing.models import Ghost
+from hsutils import minio
+from hsutils.test_utils import ObjectStorageStandIn
+from hsutils.viewmodels import download_ghost
+
+GHOST_DATA = os.urandom(3 * 2**20 + 123)
+
+
+@pytest.fixture
+def ghost(object_storage: ObjectStorageStandIn, create_users, create_levels, build_ghost) -> Ghost:
+    (owner,) = create_users(1)
+    (level,) = create_levels(1)
+    ghost = build_ghost(owner=owner, level=level, data_size=len(GHOST_DATA))
+    ghost.save()
+    object_storage.objects[(settings.MINIO_GHOST_BUCKET, minio._object_name_of(ghost))] = GHOST_DATA
+    return ghost
+
+
+def _download(client: Client, ghost: Ghost, **headers):
+    return client.get("/" + download_ghost.path.replace("<int:id>", str(ghost.id)), headers=headers)
+
+
+@pytest.mark.django_db
+def test_download_is_streamed_in_chunks(client: Client, ghost: Ghost):
+    response = _download(client, ghost)
+    assert response.status_code == HTTPStatus.OK
+    assert response.streaming
+    assert int(response.headers["Content-Length"]) == len(GHOST_DATA)
+    assert response.headers["Accept-Ranges"] == "bytes"
+    assert "ETag" in response.headers
+    assert response.headers["Content-Disposition"] == 'attachment; filename="ghost.tar.xz"'
+
+    chunks = list(response.streaming_content)
+    assert max(len(chunk) for chunk in chunks) <= settings.GHOST_DOWNLOAD_CHUNK_SIZE
+    assert b"".join(chunks) == GHOST_DATA
+
+    ghost.refresh_from_db()
+    assert ghost.downloads == 1
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "byte_range,first,last",
+    [
+        ("bytes=0-99", 0, 99),
+        ("bytes=1000-", 1000, len(GHOST_DATA) - 1),
+        ("bytes=-500", len(GHOST_DATA) - 500, len(GHOST_DATA) - 1),
+        (f"bytes=100-{len(GHOST_DATA) * 2}", 100, len(GHOST_DATA) - 1),
+    ],
+)
+def test_range_is_served_partially(client: Client, ghost: Ghost, byte_range: str, first: int, last: int):
+    response = _download(client, ghost, Range=byte_range)
+    assert response.status_code == HTTPStatus.PARTIAL_CONTENT
+    assert response.headers["Content-Range"] == f"bytes {first}-{last}/{len(GHOST_DATA)}"
+    assert int(response.headers["Content-Length"]) == last - first + 1
+    assert b"".join(response.streaming_content) == GHOST_DATA[first : last + 1]
+
+    # only the download starting at the beginning is counted
+    ghost.refresh_from_db()
+    assert ghost.downloads == (1 if first == 0 else 0)
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("byte_range", [f"bytes={len(GHOST_DATA)}-", "bytes=-0"])
+def test_unsatisfiable_range_is_rejected(client: Client, ghost: Ghost, byte_range: str):
+    response = _download(client, ghost, Range=byte_range)
+    assert response.status_code == HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE
+    assert response.headers["Content-Range"] == f"bytes */{len(GHOST_DATA)}"
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("byte_range", ["bytes=0-1,5-6", "bytes=10-5", "items=0-1"])
+def test_unsupported_range_serves_whole_file(client: Client, ghost: Ghost, byte_range: str):
+    response = _download(client, ghost, Range=byte_range)
+    assert response.status_code == HTTPStatus.OK
+    assert b"".join(response.streaming_content) == GHOST_DATA
+
+
+@pytest.mark.django_db
+def test_if_range_resumes_only_unchanged_data(client: Client, ghost: Ghost):
+    response = _download(client, ghost)
+    etag = response.headers["ETag"]
+    last_modified = response.headers["Last-Modified"]
+    b"".join(response.streaming_content)
+
+    for validator in (etag, last_modified):
+        response = _download(client, ghost, Range="bytes=10-19", If_Range=validator)
+        assert response.status_code == HTTPStatus.PARTIAL_CONTENT
+        assert b"".join(response.streaming_content) == GHOST_DATA[10:20]
+
+    for validator in ('"outdated"', 'W/"weak"', "Thu, 01 Jan 1970 00:00:00 GMT"):
+        response = _download(client, ghost, Range="bytes=10-19", If_Range=validator)
+        assert response.status_code == HTTPStatus.OK
+        assert b"".join(response.streaming_content) == GHOST_DATA
+
+
+@pytest.mark.django_db
+def test_missing_data_removes_ghost(client: Client, object_storage: ObjectStorageStandIn, ghost: Ghost):
+    object_storage.objects.clear()
+    assert _download(client, ghost).status_code == HTTPStatus.NOT_FOUND
+    assert not Ghost.objects.filter(id=ghost.id).exists()
+
+
+@pytest.mark.django_db
+def test_presigned_download_redirects_to_object_storage(
+    client: Client,
+    object_storage: ObjectStorageStandIn,
+    ghost: Ghost,
+    settings,
+):
+    settings.GHOST_DOWNLOAD_PRESIGNED = True
+    object_storage.requests.clear()
+    response = _download(client, ghost)
+    assert response.status_code == HTTPStatus.FOUND
+    assert "no-store" in response.headers["Cache-Control"]
+
+    url = urlsplit(response.headers["Location"])
+    assert url.netloc == object_storage.endpoint
+    query = parse_qs(url.query)
+    assert query["X-Amz-Expires"] == [str(int(settings.GHOST_DOWNLOAD_PRESIGNED_EXPIRY.total_seconds()))]
+    assert query["response-content-disposition"] == ['attachment; filename="ghost.tar.xz"']
+    # nothing but the existence check went to object storage
+    assert [method for method, _ in object_storage.requests] == ["HEAD"]
+
+    with urlopen(Request(response.headers["Location"], headers={"Range": "bytes=5-9"})) as redirected:
+        assert redirected.status == HTTPStatus.PARTIAL_CONTENT
+        assert redirected.read() == GHOST_DATA[5:10]
+
+    ghost.refresh_from_db()
+    assert ghost.downloads == 1
+    assert _download(client, ghost, Range="bytes=100-").status_code == HTTPStatus.FOUND
+    ghost.refresh_from_db()
+    assert ghost.downloads == 1
+
+
+def _ghost_updates(context: CaptureQueriesContext) -> list[str]:
+    return [
+        query["sql"] for query in context.captured_queries if query["sql"].startswith('UPDATE "ghost_sharing_ghost"')
+    ]
+
+
+@pytest.mark.django_db
+def test_download_increments_counter_in_place(client: Client, ghost: Ghost):
+    with CaptureQueriesContext(connection) as context:
+        b"".join(_download(client, ghost).streaming_content)
+    (update,) = _ghost_updates(context)
+    assert '"description"' not in update
+
+    ghost.refresh_from_db()
+    assert ghost.downloads == 1
+
+
+@pytest.mark.django_db
+def test_buffered_downloads_are_flushed_in_bulk(client: Client, ghost: Ghost, settings, build_ghost):
+    settings.GHOST_DOWNLOADS_BUFFERED = True
+    other = build_ghost(owner=ghost.owner, level=ghost.level, original_filename="other.tar.xz")
+    other.save()
+
+    with CaptureQueriesContext(connection) as context:
+        for _ in range(3):
+            b"".join(_download(client, ghost).streaming_content)
+    assert _ghost_updates(context) == []
+    for _ in range(3):
+        count_download(other.id)
+
+    # both ghosts got the same number of downloads, so a single update suffices
+    with CaptureQueriesContext(connection) as context:
+        assert flush_downloads() == 6
+    assert len(_ghost_updates(context)) == 1
+    assert list(Ghost.objects.order_by("id").values_list("downloads", flat=True)) == [3, 3]
+
+    count_download(ghost.id)
+    out = StringIO()
+    call_command("flushghostdownloads", stdout=out)
+    assert out.getvalue() == "Flushed 1 downloads\n"
+    assert flush_downloads() == 0
+    ghost.refresh_from_db()
+    assert ghost.downloads == 4
+
+
+def _ghost_queries(context: CaptureQueriesContext) -> list[str]:
+    return [
+        query["sql"].split(" ", 1)[0] for query in context.captured_queries if "ghost_sharing_ghost" in query["sql"]
+    ]
+
+
+@pytest.mark.django_db
+def test_flush_only_reads_downloaded_ghosts(ghost: Ghost, settings):
+    settings.GHOST_DOWNLOADS_BUFFERED = True
+    for _ in range(2):
+        count_download(ghost.id)
+
+    with CaptureQueriesContext(connection) as context:
+        assert flush_downloads() == 2
+    assert _ghost_queries(context) == ["UPDATE"]
+    # the log of pending ghosts is consumed, so nothing is read again
+    with CaptureQueriesContext(connection) as context:
+        assert flush_downloads() == 0
+    assert _ghost_queries(context) == []
+
+    count_download(ghost.id)
+    assert flush_downloads() == 1
+    ghost.refresh_from_db()
+    assert ghost.downloads == 3
+
+
+@pytest.mark.django_db
+def test_flush_waits_for_unwritten_pending_slots(ghost: Ghost, settings):
+    settings.GHOST_DOWNLOADS_BUFFERED = True
+    # a download which took the first slot, but did not write it yet
+    cache.add(download_counter._PENDING_LOG_END_KEY, 0, timeout=None)
+    cache.incr(download_counter._PENDING_LOG_END_KEY)
+    count_download(ghost.id)
+
+    assert flush_downloads() == 0
+    # the slot is given up once it stays unwritten for a whole flush interval
+    assert flush_downloads() == 1
+    ghost.refresh_from_db()
+    assert ghost.downloads == 1
+
+
+@pytest.mark.django_db
+def test_failed_flush_keeps_downloads(ghost: Ghost, settings, monkeypatch):
+    settings.GHOST_DOWNLOADS_BUFFERED = True
+    for _ in range(3):
+        count_download(ghost.id)
+
+    def fail(*args):
+        raise DatabaseError("unavailable")
+
+    with monkeypatch.context() as patched:
+        patched.setattr("ghost_sharing.download_counter._add_downloads", fail)
+        with pytest.raises(DatabaseError):
+            flush_downloads()
+    assert flush_downloads() == 3
+    ghost.refresh_from_db()
+    assert ghost.downloads == 3
+
+
+@pytest.mark.django_db
+def test_downloads_during_flush_are_kept(ghost: Ghost, settings, monkeypatch):
+    settings.GHOST_DOWNLOADS_BUFFERED = True
+    count_download(ghost.id)
+
+    add_downloads = download_counter._add_downloads
+
+    def add_downloads_while_downloading(ghost_ids, downloads):
+        count_download(ghost.id)
+        add_downloads(ghost_ids, downloads)
+
+    with monkeypatch.context() as patched:
+        patched.setattr("ghost_sharing.download_counter._add_downloads", add_downloads_while_downloading)
+        assert flush_downloads() == 1
+    assert flush_downloads() == 1
+    ghost.refresh_from_db()
+    assert ghost.downloads == 2
+
+
+@pytest.mark.django_db
+def test_download_needs_a_single_storage_request(
+    client: Client,
+    object_storage: ObjectStorageStandIn,
+    ghost: Ghost,
+    settings,
+):
+    object_storage.requests.clear()
+    b"".join(_download(client, ghost, Range="bytes=0-9").streaming_content)
+    assert [method for method, _ in object_storage.requests] == ["GET"]
+
+    # after the first check, redirects do not need object storage at all
+    settings.GHOST_DOWNLOAD_PRESIGNED = True
+    object_storage.requests.clear()
+    for _ in range(3):
+        assert _download(client, ghost).status_code == HTTPStatus.FOUND
+    assert [method for method, _ in object_storage.requests] == ["HEAD"]
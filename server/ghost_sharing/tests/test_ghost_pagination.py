@@ -0,0 +1,113 @@
+from datetime import timedelta
+from http import HTTPStatus
+
+import pytest
+from django.test import Client
+from django.utils import timezone
+
+from ghost_sharing.models import Ghost, GhostFinishType, Level
+from haunted_sessions.models import Tag
+
+FINISH_TYPES = [GhostFinishType.completed, GhostFinishType.death, GhostFinishType.unfinished]
+
+
+@pytest.fixture
+def ghosts(create_users, create_tags, create_levels, build_ghost) -> list[Ghost]:
+    owners = create_users(2)
+    tags = create_tags(2)
+    levels = create_levels(2)
+    # some ghosts share their creation time to exercise the id tie-breaker
+    now = timezone.now()
+    result = []
+    for i in range(25):
+        ghost = build_ghost(
+            owner=owners[i % 2],
+            level=levels[i % 2],
+            duration=timedelta(seconds=i),
+            finish_type=FINISH_TYPES[i % 3],
+            description=f"ghost {i}",
+            created_at=now - timedelta(minutes=i // 3),
+        )
+        ghost.save()
+        ghost.tags.set(tags[: i % 3])
+        result.append(ghost)
+    return result
+
+
+def _get_all_pages(client: Client, **params) -> list[int]:
+    ids = []
+    cursor = None
+    while True:
+        response = client.get("/api/v0/ghosts", {**params, **({"cursor": cursor} if cursor else {})})
+        assert response.status_code == HTTPStatus.OK
+        data = response.json()
+        ids += [ghost["id"] for ghost in data["files"]]
+        cursor = data["next_cursor"]
+        if cursor is None:
+            return ids
+
+
+def _expected_ids(ghosts: list[Ghost]) -> list[int]:
+    return [ghost.id for ghost in sorted(ghosts, key=lambda g: (g.created_at, g.id), reverse=True)]
+
+
+@pytest.mark.django_db
+def test_pages_cover_all_ghosts_once(client: Client, ghosts: list[Ghost]):
+    response = client.get("/api/v0/ghosts", {"limit": 10})
+    assert len(response.json()["files"]) == 10
+    assert response.json()["next_cursor"] is not None
+
+    assert _get_all_pages(client, limit=4) == _expected_ids(ghosts)
+    assert _get_all_pages(client) == _expected_ids(ghosts)
+
+
+@pytest.mark.django_db
+def test_filters(client: Client, ghosts: list[Ghost]):
+    level = ghosts[1].level
+    assert _get_all_pages(client, limit=3, level_id=level.id) == _expected_ids(
+        [ghost for ghost in ghosts if ghost.level == level],
+    )
+    assert _get_all_pages(client, limit=3, finish_type=GhostFinishType.death) == _expected_ids(
+        [ghost for ghost in ghosts if ghost.finish_type == GhostFinishType.death],
+    )
+    assert _get_all_pages(client, username="user1") == _expected_ids(
+        [ghost for ghost in ghosts if ghost.owner.username == "user1"],
+    )
+
+    tag_ids = [tag.id for tag in Tag.objects.order_by("id")]
+    assert _get_all_pages(client, limit=3, tags=tag_ids) == _expected_ids(
+        [ghost for ghost in ghosts if ghost.tags.count() == 2],
+    )
+    assert _get_all_pages(client, tags=tag_ids[:1], username="user0") == _expected_ids(
+        [ghost for ghost in ghosts if ghost.tags.count() >= 1 and ghost.owner.username == "user0"],
+    )
+
+
+@pytest.mark.django_db
+def test_unpublished_ghosts_are_not_listed(client: Client, ghosts: list[Ghost]):
+    Ghost.objects.filter(id__in=[ghost.id for ghost in ghosts[:5]]).update(published=False)
+    assert _get_all_pages(client, limit=7) == _expected_ids(ghosts[5:])
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("params", [{"cursor": "invalid"}, {"limit": 0}, {"limit": 101}, {"level_id": "x"}])
+def test_invalid_queries_are_rejected(client: Client, ghosts: list[Ghost], params: dict):
+    response = client.get("/api/v0/ghosts", params)
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+
+
+@pytest.mark.django_db
+def test_level_options_cover_all_pages(client: Client, ghosts: list[Ghost]):
+    # the only published ghost of the second level is the oldest one, so it is missing from the first page
+    Ghost.objects.filter(level=ghosts[1].level).exclude(id=ghosts[23].id).update(published=False)
+    assert {ghost["level_id"] for ghost in client.get("/api/v0/ghosts", {"limit": 3}).json()["files"]} == {
+        ghosts[0].level.id,
+    }
+
+    Level.objects.create(gameflow=ghosts[0].level.gameflow, identifier="UNUSED", title="Unused")
+    response = client.get("/api/v0/ghosts/levels")
+    assert response.status_code == HTTPStatus.OK
+    assert response.json()["levels"] == [
+        {"id": level.id, "identifier": level.identifier, "title": f"Gameflow - {level.title}"}
+        for level in (ghosts[0].level, ghosts[1].level)
+    ]
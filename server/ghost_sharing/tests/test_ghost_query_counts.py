@@ -0,0 +1,64 @@
+from datetime import timedelta
+from http import HTTPStatus
+
+import pytest
+from django.test import Client
+
+from ghost_sharing.models import Ghost
+from hsutils.test_utils import count_test_url_queries
+from hsutils.viewmodels import ghosts, staging_ghosts
+
+
+@pytest.fixture
+def create_ghosts(create_users, create_tags, create_levels, build_ghost):
+    # every ghost has its own owner and gameflow, and some tags
+    def create(count: int, published: bool):
+        offset = Ghost.objects.count()
+        tags = create_tags(3)
+        for i, owner in enumerate(create_users(count, offset), start=offset):
+            (level,) = create_levels(1, gameflow=f"gameflow{i}")
+            ghost = build_ghost(owner=owner, level=level, published=published, duration=timedelta(seconds=i))
+            ghost.save()
+            ghost.tags.set(tags[: i % len(tags) + 1])
+
+    return create
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("path,published", [(ghosts.path, True), (staging_ghosts.path, False)])
+def test_ghost_listing_query_count_is_constant(
+    client: Client,
+    create_ghosts,
+    django_assert_num_queries,
+    path: str,
+    published: bool,
+):
+    create_ghosts(1, published)
+    client.force_login(Ghost.objects.first().owner)
+    expected_queries = count_test_url_queries(client, path)
+
+    create_ghosts(20, published)
+    with django_assert_num_queries(expected_queries):
+        response = client.get("/" + path)
+    assert len(response.json()["files"]) == 21
+
+
+@pytest.mark.django_db
+def test_single_ghost_query_count(client: Client, create_ghosts, django_assert_num_queries):
+    create_ghosts(1, True)
+    (ghost,) = Ghost.objects.all()
+    # the ghost with its owner and level, and its tags
+    with django_assert_num_queries(2):
+        response = client.get(f"/api/v0/ghosts/{ghost.id}")
+    assert response.status_code == HTTPStatus.OK
+    assert response.json()["ghost"]["level_display"] == "Gameflow0 - Level 0"
+
+
+@pytest.mark.django_db
+def test_alternative_levels_query_count_is_constant(client: Client, create_ghosts, django_assert_num_queries):
+    create_ghosts(20, True)
+    # the versions of the levels and gameflows, and the levels with their gameflows
+    with django_assert_num_queries(3):
+        response = client.get("/api/v0/levels/LEVEL0")
+    assert response.status_code == HTTPStatus.OK
+    assert len(response.json()["levels"]) == 20
@@ -0,0 +1,98 @@
+from datetime import timedelta
+from http import HTTPStatus
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+
+from ghost_sharing.models import Ghost, GhostBlob, GhostFinishType, Level
+from hsutils.test_utils import (
+    ObjectStorageStandIn,
+    find_table_scans,
+    requires_query_plans,
+)
+from hsutils.viewmodels import ghost_levels, ghosts, levels, staging_ghosts
+
+# tables growing with the number of users; the game content tables stay small enough to be read as a whole
+_USER_DATA_TABLES = ("auth_user", "ghost_sharing_ghost", "ghost_sharing_ghost_tags", "ghost_sharing_ghostblob")
+
+pytestmark = requires_query_plans
+
+
+@pytest.fixture
+def ghost_data(create_users, create_levels, build_ghost):
+    users = create_users(2000)
+    level_list = create_levels(100)
+    blobs = GhostBlob.objects.bulk_create(
+        GhostBlob(hash=f"{i:064x}", size=1, references=0 if i % 50 == 0 else 1) for i in range(2000)
+    )
+    # most ghosts are published, staging ghosts are either published or expire soon
+    Ghost.objects.bulk_create(
+        build_ghost(
+            owner=users[i % len(users)],
+            level=level_list[i % len(level_list)],
+            blob=blobs[i % len(blobs)],
+            published=i % 20 != 0,
+            duration=timedelta(seconds=i),
+            finish_type=GhostFinishType.completed if i % 3 else GhostFinishType.death,
+            description=f"ghost {i}",
+        )
+        for i in range(5000)
+    )
+    return users
+
+
+def _get(client: Client, path: str, **params) -> CaptureQueriesContext:
+    with CaptureQueriesContext(connection) as context:
+        response = client.get("/" + path, params)
+    assert response.status_code == HTTPStatus.OK
+    return context
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "params",
+    [{}, {"level_id": "LEVEL3"}, {"finish_type": GhostFinishType.death.value}, {"username": "user5"}, {"limit": 10}],
+)
+def test_published_listing_uses_indexes(client: Client, ghost_data, params: dict):
+    if "level_id" in params:
+        params["level_id"] = Level.objects.get(identifier=params["level_id"]).id
+    context = _get(client, ghosts.path, **params)
+    assert find_table_scans(context.captured_queries, _USER_DATA_TABLES) == []
+
+
+@pytest.mark.django_db
+def test_next_page_uses_indexes(client: Client, ghost_data):
+    cursor = client.get("/" + ghosts.path, {"limit": 10}).json()["next_cursor"]
+    context = _get(client, ghosts.path, cursor=cursor)
+    assert find_table_scans(context.captured_queries, _USER_DATA_TABLES) == []
+
+
+@pytest.mark.django_db
+def test_staging_listing_uses_indexes(client: Client, ghost_data):
+    client.force_login(ghost_data[0])
+    context = _get(client, staging_ghosts.path)
+    assert find_table_scans(context.captured_queries, _USER_DATA_TABLES) == []
+
+
+@pytest.mark.django_db
+def test_ghost_levels_use_indexes(client: Client, ghost_data):
+    context = _get(client, ghost_levels.path)
+    assert find_table_scans(context.captured_queries, _USER_DATA_TABLES) == []
+
+
+@pytest.mark.django_db
+def test_alternative_levels_use_indexes(client: Client, ghost_data):
+    context = _get(client, levels.path.replace("<str:identifier>", "LEVEL3"))
+    assert find_table_scans(context.captured_queries, ("ghost_sharing_level",)) == []
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("command", ["reapstagingghosts", "reapghostblobs"])
+def test_reapers_use_indexes(object_storage: ObjectStorageStandIn, ghost_data, command: str):
+    with CaptureQueriesContext(connection) as context:
+        call_command(command, stdout=StringIO())
+    assert find_table_scans(context.captured_queries, _USER_DATA_TABLES) == []
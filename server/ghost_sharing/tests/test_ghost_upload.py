@@ -0,0 +1,458 @@
+import hashlib
+import os
+import tarfile
+import threading
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+from io import BytesIO, StringIO
+from pathlib import Path
+
+import pytest
+from django import db
+from django.conf import settings
+from django.core.files.uploadedfile import SimpleUploadedFile, TemporaryUploadedFile
+from django.core.management import call_command
+from django.db import connection
+from django.db.transaction import atomic, set_rollback
+from django.test import Client, RequestFactory
+from django.test.utils import CaptureQueriesContext
+
+from ghost_sharing import views
+from ghost_sharing.models import Ghost, GhostBlob, GhostFinishType, Level, StorageUsage
+from ghost_sharing.views import get_quota, upload
+from hsutils import minio
+from hsutils.test_utils import ObjectStorageStandIn
+from hsutils.viewmodels import QuotaResponse, SuccessResponse, download_ghost
+
+GHOST_YML = b"""ghost:
+  level: LEVEL1
+  duration: 300
+  finishState: Completed
+  unknownTag: !foo bar
+"""
+
+
+def make_ghost_archive(path: Path, bin_size: int, members: dict[str, bytes] | None = None):
+    if members is None:
+        members = {"ghost.yml": GHOST_YML}
+    with tarfile.open(path, "w:xz", preset=0) as archive:
+        for name, content in members.items():
+            info = tarfile.TarInfo(name)
+            info.size = len(content)
+            archive.addfile(info, BytesIO(content))
+        if bin_size:
+            info = tarfile.TarInfo("ghost.bin")
+            info.size = bin_size
+            archive.addfile(info, BytesIO(os.urandom(bin_size)))
+
+
+def make_uploaded_file(path: Path) -> TemporaryUploadedFile:
+    uploaded = TemporaryUploadedFile(path.name, "application/x-xz", path.stat().st_size, None)
+    with path.open("rb") as f:
+        while chunk := f.read(2**16):
+            uploaded.write(chunk)
+    uploaded.seek(0)
+    return uploaded
+
+
+class BlobStorage:
+    def __init__(self):
+        self.objects: dict[str, tuple[str, int]] = {}
+        self.puts = 0
+
+    def put_ghost_blob(self, blob: GhostBlob, data, length: int):
+        data_hash = hashlib.sha256()
+        received = 0
+        while chunk := data.read(2**16):
+            data_hash.update(chunk)
+            received += len(chunk)
+        assert received == length
+        self.objects[blob.hash] = (data_hash.hexdigest(), received)
+        self.puts += 1
+
+
+@pytest.fixture
+def blob_storage(monkeypatch) -> BlobStorage:
+    storage = BlobStorage()
+    monkeypatch.setattr("ghost_sharing.views.put_ghost_blob", storage.put_ghost_blob)
+    return storage
+
+
+@pytest.fixture
+def uploader(django_user_model):
+    return django_user_model.objects.create_user(
+        is_active=True,
+        username="uploader",
+        email="uploader@example.com",
+        password="password!!!",
+    )
+
+
+def _upload(user, *uploaded: TemporaryUploadedFile):
+    request = RequestFactory().post("/")
+    request.user = user
+    return upload(request, {file.name: file for file in uploaded})
+
+
+def _make_uploaded_files(tmp_path: Path, count: int) -> list[TemporaryUploadedFile]:
+    uploaded = []
+    for i in range(count):
+        archive_path = tmp_path / f"ghost{i}.tar.xz"
+        make_ghost_archive(archive_path, 2**10)
+        uploaded.append(make_uploaded_file(archive_path))
+    return uploaded
+
+
+def _get_quota(user) -> QuotaResponse:
+    request = RequestFactory().get("/")
+    request.user = user
+    return get_quota(request)
+
+
+@pytest.mark.django_db
+def test_upload_stages_ghost(tmp_path: Path, uploader, blob_storage: BlobStorage):
+    archive_path = tmp_path / "ghost.tar.xz"
+    make_ghost_archive(archive_path, 2**16)
+    expected_hash = hashlib.sha256(archive_path.read_bytes()).hexdigest()
+
+    response = _upload(uploader, make_uploaded_file(archive_path))
+    assert response == SuccessResponse(success=True, message="")
+
+    (ghost,) = Ghost.objects.all()
+    assert ghost.owner == uploader
+    assert ghost.published is False
+    assert ghost.unpublished_at is not None
+    assert ghost.hash == expected_hash
+    assert ghost.data_size == archive_path.stat().st_size
+    assert ghost.level.identifier == "LEVEL1"
+    assert ghost.duration.total_seconds() == 10
+    assert ghost.finish_type == GhostFinishType.completed
+    assert ghost.original_filename == "ghost.tar.xz"
+    assert ghost.blob_id == expected_hash
+    assert blob_storage.objects == {expected_hash: (expected_hash, ghost.data_size)}
+
+
+@pytest.mark.django_db
+def test_identical_uploads_share_their_data(tmp_path: Path, uploader, blob_storage: BlobStorage, django_user_model):
+    archive_path = tmp_path / "ghost.tar.xz"
+    make_ghost_archive(archive_path, 2**10)
+    mirror = django_user_model.objects.create_user(is_active=True, username="mirror", email="mirror@example.com")
+    for user in (uploader, uploader, mirror):
+        assert _upload(user, make_uploaded_file(archive_path)).success is True
+
+    assert blob_storage.puts == 1
+    (blob,) = GhostBlob.objects.all()
+    assert blob.references == 3
+    assert set(Ghost.objects.values_list("blob_id", flat=True)) == {blob.hash}
+    # the quota is still per ghost
+    assert _get_quota(uploader).current == 2 * blob.size
+
+    Ghost.objects.filter(owner=uploader).delete()
+    blob.refresh_from_db()
+    assert blob.references == 1
+
+
+@pytest.mark.django_db
+def test_upload_rejects_invalid_archives(tmp_path: Path, uploader, blob_storage: BlobStorage):
+    archive_path = tmp_path / "ghost.tar.xz"
+    make_ghost_archive(archive_path, 0, {"ghost.yml": GHOST_YML, "ghost.exe": b"MZ"})
+    status, response = _upload(uploader, make_uploaded_file(archive_path))
+    assert status == HTTPStatus.BAD_REQUEST
+    assert "ghost.exe" in response.message
+
+    make_ghost_archive(archive_path, 2**10, {})
+    status, response = _upload(uploader, make_uploaded_file(archive_path))
+    assert status == HTTPStatus.BAD_REQUEST
+    assert response.success is False
+
+    make_ghost_archive(archive_path, 0, {"ghost.yml": b"ghost:\n  level: LEVEL1\n"})
+    status, response = _upload(uploader, make_uploaded_file(archive_path))
+    assert (status, response.message) == (HTTPStatus.BAD_REQUEST, "invalid ghost metadata in ghost.tar.xz")
+
+    archive_path.write_bytes(b"not an archive")
+    status, response = _upload(uploader, make_uploaded_file(archive_path))
+    assert (status, response.message) == (HTTPStatus.BAD_REQUEST, "invalid archive ghost.tar.xz")
+
+    assert Ghost.objects.count() == 0
+    assert not blob_storage.objects
+
+
+@pytest.mark.django_db
+def test_upload_rejects_decompression_bombs(tmp_path: Path, uploader, blob_storage: BlobStorage, settings):
+    settings.GHOST_ARCHIVE_MAX_MEMBERS = 3
+    settings.GHOST_ARCHIVE_MAX_UNPACKED_SIZE = 2**20
+    archive_path = tmp_path / "ghost.tar.xz"
+
+    make_ghost_archive(archive_path, 2**10, {"ghost.yml": GHOST_YML, "ghost1.bin": b"", "ghost2.bin": b""})
+    status, response = _upload(uploader, make_uploaded_file(archive_path))
+    assert (status, response.message) == (HTTPStatus.BAD_REQUEST, "archive ghost.tar.xz is too large when unpacked")
+
+    make_ghost_archive(archive_path, 2**20)
+    status, response = _upload(uploader, make_uploaded_file(archive_path))
+    assert (status, response.message) == (HTTPStatus.BAD_REQUEST, "archive ghost.tar.xz is too large when unpacked")
+
+    make_ghost_archive(archive_path, 2**20 - len(GHOST_YML))
+    assert _upload(uploader, make_uploaded_file(archive_path)) == SuccessResponse(success=True, message="")
+    assert Ghost.objects.count() == 1
+
+
+@pytest.mark.django_db
+def test_in_memory_upload_is_inspected(tmp_path: Path, uploader, blob_storage: BlobStorage):
+    archive_path = tmp_path / "ghost.tar.xz"
+    make_ghost_archive(archive_path, 2**10)
+    uploaded = SimpleUploadedFile(archive_path.name, archive_path.read_bytes(), "application/x-xz")
+    assert _upload(uploader, uploaded) == SuccessResponse(success=True, message="")
+    assert blob_storage.objects[Ghost.objects.get().blob_id][1] == uploaded.size
+
+
+def _level_queries(context: CaptureQueriesContext) -> list[str]:
+    return [
+        query["sql"]
+        for query in context.captured_queries
+        if '"ghost_sharing_level"' in query["sql"].split(" WHERE ")[0]
+        or '"ghost_sharing_gameflow"' in query["sql"].split(" WHERE ")[0]
+    ]
+
+
+@pytest.mark.django_db
+def test_levels_are_resolved_once_per_upload(
+    tmp_path: Path,
+    uploader,
+    blob_storage: BlobStorage,
+    django_capture_on_commit_callbacks,
+):
+    uploaded = []
+    for i in range(6):
+        archive_path = tmp_path / f"ghost{i}.tar.xz"
+        make_ghost_archive(archive_path, 2**10, {"ghost.yml": GHOST_YML.replace(b"LEVEL1", f"LEVEL{i % 2}".encode())})
+        uploaded.append(make_uploaded_file(archive_path))
+
+    with CaptureQueriesContext(connection) as context, django_capture_on_commit_callbacks(execute=True):
+        assert _upload(uploader, *uploaded[:3]) == SuccessResponse(success=True, message="")
+    # the gameflow, the known levels, and the creation of each of the two levels
+    assert len(_level_queries(context)) < 10
+    assert sorted(Level.objects.filter(gameflow__identifier="unknown").values_list("identifier", "title")) == [
+        ("LEVEL0", "LEVEL0"),
+        ("LEVEL1", "LEVEL1"),
+    ]
+
+    with CaptureQueriesContext(connection) as context:
+        assert _upload(uploader, *uploaded[3:]) == SuccessResponse(success=True, message="")
+    assert _level_queries(context) == []
+    assert sorted(Ghost.objects.values_list("level__identifier", flat=True)) == ["LEVEL0"] * 3 + ["LEVEL1"] * 3
+
+
+@pytest.mark.django_db
+def test_rolled_back_levels_are_not_remembered(django_capture_on_commit_callbacks):
+    with django_capture_on_commit_callbacks(execute=True) as callbacks:
+        with atomic():
+            Level.ids_of("unknown", ["NEWLEVEL"])
+            set_rollback(True)
+    assert callbacks == []
+    assert not Level.objects.filter(identifier="NEWLEVEL").exists()
+
+    with django_capture_on_commit_callbacks(execute=True):
+        level_ids = Level.ids_of("unknown", ["NEWLEVEL"])
+    assert level_ids == {"NEWLEVEL": Level.objects.get(identifier="NEWLEVEL").id}
+
+
+@pytest.mark.django_db
+def test_files_are_processed_concurrently(tmp_path: Path, uploader, blob_storage: BlobStorage, monkeypatch, settings):
+    settings.GHOST_UPLOAD_WORKERS = 3
+    uploaded = _make_uploaded_files(tmp_path, 3)
+
+    # each step only passes the barrier if all files are processed at the same time
+    def concurrently(step):
+        barrier = threading.Barrier(len(uploaded), timeout=10)
+
+        def wait_for_others(*args):
+            barrier.wait()
+            return step(*args)
+
+        return wait_for_others
+
+    monkeypatch.setattr("ghost_sharing.views._inspect_ghost_tarfile", concurrently(views._inspect_ghost_tarfile))
+    monkeypatch.setattr("ghost_sharing.views.put_ghost_blob", concurrently(blob_storage.put_ghost_blob))
+    assert _upload(uploader, *uploaded) == SuccessResponse(success=True, message="")
+    assert sorted(Ghost.objects.values_list("original_filename", flat=True)) == [file.name for file in uploaded]
+    assert blob_storage.puts == 3
+
+
+@pytest.mark.django_db
+def test_failed_upload_keeps_nothing(tmp_path: Path, uploader, blob_storage: BlobStorage, settings):
+    uploaded = _make_uploaded_files(tmp_path, 3)
+    settings.GHOST_QUOTA = sum(file.size for file in uploaded) - 1
+    status, response = _upload(uploader, *uploaded)
+    assert (status, response.message) == (HTTPStatus.BAD_REQUEST, "Quota exceeded")
+
+    invalid_path = tmp_path / "invalid.tar.xz"
+    make_ghost_archive(invalid_path, 0, {"ghost.yml": GHOST_YML, "ghost.exe": b"MZ"})
+    settings.GHOST_QUOTA = 2**30
+    status, response = _upload(uploader, *uploaded, make_uploaded_file(invalid_path))
+    assert status == HTTPStatus.BAD_REQUEST
+    assert "ghost.exe" in response.message
+
+    assert not Ghost.objects.exists()
+    assert not GhostBlob.objects.exists()
+    assert blob_storage.puts == 0
+    assert _get_quota(uploader).current == 0
+
+
+@pytest.mark.django_db(transaction=True)
+def test_data_is_stored_outside_of_transactions(tmp_path: Path, uploader, blob_storage: BlobStorage, monkeypatch):
+    def put_ghost_blob(*args):
+        # the write lock of the upload is not held while sending the data
+        assert not connection.in_atomic_block
+        blob_storage.put_ghost_blob(*args)
+
+    monkeypatch.setattr("ghost_sharing.views.put_ghost_blob", put_ghost_blob)
+    assert _upload(uploader, *_make_uploaded_files(tmp_path, 2)) == SuccessResponse(success=True, message="")
+    assert blob_storage.puts == 2
+    assert sorted(GhostBlob.objects.values_list("hash", flat=True)) == sorted(blob_storage.objects)
+
+
+@pytest.mark.django_db
+def test_failed_storage_keeps_no_ghost(tmp_path: Path, uploader, monkeypatch):
+    def put_ghost_blob(*args):
+        raise OSError("storage unavailable")
+
+    monkeypatch.setattr("ghost_sharing.views.put_ghost_blob", put_ghost_blob)
+    with pytest.raises(OSError):
+        _upload(uploader, *_make_uploaded_files(tmp_path, 2))
+    assert not Ghost.objects.exists()
+    assert not GhostBlob.objects.exists()
+
+
+@pytest.mark.django_db
+def test_upload_memory_is_bounded(tmp_path: Path, uploader, blob_storage: BlobStorage, settings):
+    settings.MAX_GHOST_SIZE = 64 * 2**20
+    settings.GHOST_QUOTA = 64 * 2**20
+
+    archive_path = tmp_path / "ghost.tar.xz"
+    make_ghost_archive(archive_path, 16 * 2**20)
+    uploaded = make_uploaded_file(archive_path)
+    assert uploaded.size > 16 * 2**20
+
+    tracemalloc.start()
+    try:
+        # uploads are inspected in an ingest process, which is not traced here, so the inspection is run directly
+        archive = views._inspect_ghost_archive(
+            uploaded.temporary_file_path(),
+            uploaded.name,
+            settings.GHOST_ARCHIVE_MAX_MEMBERS,
+            settings.GHOST_ARCHIVE_MAX_UNPACKED_SIZE,
+        )
+        _, inspection_peak = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        response = _upload(uploader, uploaded)
+        _, upload_peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert isinstance(archive, views._GhostArchive)
+    assert response.success is True
+    assert Ghost.objects.count() == 1
+    # a fraction of the file size, independent of it
+    assert inspection_peak < 2**20
+    assert upload_peak < 2**20
+
+
+@pytest.mark.django_db
+def test_quota_is_tracked_incrementally(tmp_path: Path, uploader, blob_storage: BlobStorage, settings):
+    archive_path = tmp_path / "ghost.tar.xz"
+    make_ghost_archive(archive_path, 2**10)
+    size = archive_path.stat().st_size
+    settings.GHOST_QUOTA = 2 * size
+
+    for _ in range(2):
+        assert _upload(uploader, make_uploaded_file(archive_path)).success is True
+    assert StorageUsage.objects.get(owner=uploader).used == 2 * size
+    status, response = _upload(uploader, make_uploaded_file(archive_path))
+    assert status == HTTPStatus.BAD_REQUEST
+    assert response.message == "Quota exceeded"
+
+    # checking the quota does not depend on the number of ghosts
+    with CaptureQueriesContext(connection) as context:
+        assert _get_quota(uploader) == QuotaResponse(max=2 * size, current=2 * size)
+    assert len(context.captured_queries) == 1
+
+    Ghost.objects.first().delete()
+    assert _get_quota(uploader).current == size
+
+    # corrections bypassing the model signals are picked up by reconciling
+    Ghost.objects.update(data_size=1)
+    out = StringIO()
+    call_command("reconcilestorageusage", stdout=out)
+    assert out.getvalue() == "Corrected 1 storage usages\n"
+    assert _get_quota(uploader).current == 1
+
+
+@pytest.mark.django_db(transaction=True)
+def test_parallel_uploads_cannot_overshoot_quota(tmp_path: Path, uploader, blob_storage: BlobStorage, settings):
+    archive_path = tmp_path / "ghost.tar.xz"
+    make_ghost_archive(archive_path, 2**10)
+    settings.GHOST_QUOTA = 3 * archive_path.stat().st_size
+    uploads = 8
+    barrier = threading.Barrier(uploads)
+
+    def parallel_upload():
+        try:
+            uploaded = make_uploaded_file(archive_path)
+            barrier.wait()
+            return _upload(uploader, uploaded)
+        finally:
+            db.connections.close_all()
+
+    with ThreadPoolExecutor(uploads) as executor:
+        results = list(executor.map(lambda _: parallel_upload(), range(uploads)))
+
+    assert sum(result == SuccessResponse(success=True, message="") for result in results) == 3
+    assert Ghost.objects.count() == 3
+    assert StorageUsage.objects.get(owner=uploader).used == settings.GHOST_QUOTA
+
+
+def _reap_blobs() -> str:
+    out = StringIO()
+    call_command("reapghostblobs", stdout=out)
+    return out.getvalue()
+
+
+@pytest.mark.django_db
+def test_shared_data_outlives_its_ghosts(
+    client: Client,
+    object_storage: ObjectStorageStandIn,
+    django_user_model,
+    tmp_path: Path,
+):
+    archive_path = tmp_path / "ghost.tar.xz"
+    make_ghost_archive(archive_path, 2**10)
+    owner = django_user_model.objects.create_user(is_active=True, username="owner", email="owner@example.com")
+    for _ in range(2):
+        assert _upload(owner, make_uploaded_file(archive_path)).success is True
+
+    (blob,) = GhostBlob.objects.all()
+    object_key = (settings.MINIO_GHOST_BUCKET, minio._blob_object_name(blob.hash))
+    assert set(object_storage.objects) == {object_key}
+    assert [method for method, _ in object_storage.requests] == ["PUT"]
+
+    # publishing does not move shared data around
+    first, second = Ghost.objects.order_by("id")
+    object_storage.requests.clear()
+    minio.publish_ghost(first)
+    first.save()
+    assert object_storage.requests == []
+    for ghost in (first, second):
+        response = client.get("/" + download_ghost.path.replace("<int:id>", str(ghost.id)))
+        assert b"".join(response.streaming_content) == archive_path.read_bytes()
+
+    minio.delete_ghost(first)
+    first.delete()
+    assert _reap_blobs() == "Deleted 0 unreferenced blobs\n"
+    assert set(object_storage.objects) == {object_key}
+
+    minio.delete_ghost(second)
+    second.delete()
+    assert _reap_blobs() == "Deleted 1 unreferenced blobs\n"
+    assert object_storage.objects == {}
+    assert not GhostBlob.objects.exists()
@@ -0,0 +1,66 @@
+import hashlib
+from datetime import timedelta
+from io import StringIO
+
+import pytest
+from django.conf import settings
+from django.core.management import call_command
+
+from ghost_sharing.models import Gameflow, Ghost, GhostBlob, GhostFinishType, Level
+from hsutils import minio
+from hsutils.test_utils import ObjectStorageStandIn
+
+
+@pytest.mark.django_db
+def test_migration_moves_data_to_shared_blobs(
+    object_storage: ObjectStorageStandIn,
+    django_user_model,
+    django_capture_on_commit_callbacks,
+):
+    owner = django_user_model.objects.create(is_active=True, username="owner", email="owner@example.com")
+    level = Level.objects.create(
+        gameflow=Gameflow.objects.create(identifier="gameflow", title="Gameflow"),
+        identifier="LEVEL",
+        title="Level",
+    )
+    ghosts = []
+    for published, data in ((True, b"shared"), (False, b"shared"), (True, b"other"), (True, None)):
+        ghost = Ghost.objects.create(
+            owner=owner,
+            level=level,
+            published=published,
+            data_size=0 if data is None else len(data),
+            duration=timedelta(seconds=1),
+            finish_type=GhostFinishType.completed,
+            original_filename="ghost.tar.xz",
+            description="ghost",
+        )
+        if data is not None:
+            object_storage.objects[(minio._bucket_of(published), minio._object_name_of(ghost))] = data
+        ghosts.append(ghost)
+
+    out = StringIO()
+    with django_capture_on_commit_callbacks(execute=True):
+        call_command("migrateghostdata", stdout=out)
+    assert out.getvalue() == "Migrated 3 ghosts, 1 of them to existing blobs\n"
+
+    shared_hash, other_hash = hashlib.sha256(b"shared").hexdigest(), hashlib.sha256(b"other").hexdigest()
+    assert object_storage.objects == {
+        (settings.MINIO_GHOST_BUCKET, minio._blob_object_name(shared_hash)): b"shared",
+        (settings.MINIO_GHOST_BUCKET, minio._blob_object_name(other_hash)): b"other",
+    }
+    assert list(Ghost.objects.order_by("id").values_list("blob_id", "hash")) == [
+        (shared_hash, shared_hash),
+        (shared_hash, shared_hash),
+        (other_hash, other_hash),
+        (None, ""),
+    ]
+    assert dict(GhostBlob.objects.values_list("hash", "references")) == {shared_hash: 2, other_hash: 1}
+
+    # toggling the publication does not touch object storage anymore
+    object_storage.requests.clear()
+    ghost = Ghost.objects.get(id=ghosts[1].id)
+    minio.publish_ghost(ghost)
+    ghost.save()
+    assert object_storage.requests == []
+    assert minio.open_ghost_data(ghost).read() == b"shared"
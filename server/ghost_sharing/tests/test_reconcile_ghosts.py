@@ -0,0 +1,113 @@
+import uuid
+from datetime import timedelta
+from io import StringIO
+
+import pytest
+from django.conf import settings
+from django.core.management import call_command
+from django.utils import timezone
+
+from ghost_sharing.models import Gameflow, Ghost, GhostBlob, GhostFinishType, Level
+from hsutils import minio
+from hsutils.test_utils import ObjectStorageStandIn
+
+
+def _reconcile(*args: str) -> list[str]:
+    out = StringIO()
+    call_command("reconcileghosts", *args, stdout=out)
+    return out.getvalue().splitlines()
+
+
+@pytest.fixture
+def ghosts(object_storage: ObjectStorageStandIn, django_user_model) -> dict[str, Ghost]:
+    # owner ids which sort differently as numbers and as object name prefixes
+    owners = {
+        owner_id: django_user_model.objects.create(
+            id=owner_id,
+            is_active=True,
+            username=f"user{owner_id}",
+            email=f"user{owner_id}@example.com",
+        )
+        for owner_id in (2, 7, 10, 11)
+    }
+    level = Level.objects.create(
+        gameflow=Gameflow.objects.create(identifier="gameflow", title="Gameflow"),
+        identifier="LEVEL",
+        title="Level",
+    )
+
+    def create_ghost(owner_id: int, published: bool, stored_in: bool | None) -> Ghost:
+        ghost = Ghost.objects.create(
+            owner=owners[owner_id],
+            level=level,
+            published=published,
+            data_size=1,
+            duration=timedelta(seconds=1),
+            finish_type=GhostFinishType.completed,
+            original_filename="ghost.tar.xz",
+            description="ghost",
+        )
+        if stored_in is not None:
+            bucket = settings.MINIO_GHOST_BUCKET if stored_in else settings.MINIO_GHOST_BUCKET_STAGING
+            object_storage.objects[(bucket, minio._object_name_of(ghost))] = b"data"
+        return ghost
+
+    ghosts = {
+        "stored": create_ghost(2, True, True),
+        "misplaced": create_ghost(2, True, False),
+        "missing": create_ghost(10, False, None),
+        "staged": create_ghost(11, False, False),
+    }
+    Ghost.objects.update(updated_at=timezone.now() - timedelta(days=2))
+    for object_name in (f"10/{uuid.uuid4().hex}/ghost.tar.xz", f"7/{uuid.uuid4().hex}/ghost.tar.xz", "junk/file"):
+        object_storage.objects[(settings.MINIO_GHOST_BUCKET, object_name)] = b"data"
+    return ghosts
+
+
+@pytest.mark.django_db
+def test_reconciliation_reports_orphans(object_storage: ObjectStorageStandIn, ghosts: dict[str, Ghost]):
+    objects = dict(object_storage.objects)
+    lines = _reconcile("--min-age", "0")
+    assert sorted(line for line in lines if line.startswith("Ghost without data")) == sorted(
+        f"Ghost without data: {ghosts[name].id} (ghost.tar.xz)" for name in ("misplaced", "missing")
+    )
+    assert sorted(line.split("/", 1)[1] for line in lines if line.startswith("Data without ghost")) == sorted(
+        [
+            minio._object_name_of(ghosts["misplaced"]),
+            *(bucket_object[1] for bucket_object in objects if bucket_object[1].startswith(("10/", "7/", "junk/"))),
+        ],
+    )
+    assert lines[-1] == "Found 2 ghosts without data and 4 objects without ghosts"
+    assert object_storage.objects == objects
+    assert Ghost.objects.count() == 4
+
+    # the objects were just stored, so they might belong to ghosts which are not committed yet
+    assert _reconcile()[-1] == "Found 2 ghosts without data and 0 objects without ghosts"
+
+
+@pytest.mark.django_db
+def test_reconciliation_deletes_orphans(object_storage: ObjectStorageStandIn, ghosts: dict[str, Ghost]):
+    assert _reconcile("--min-age", "0", "--delete")[-1] == "Deleted 2 ghosts without data and 4 objects without ghosts"
+    assert set(Ghost.objects.values_list("id", flat=True)) == {ghosts["stored"].id, ghosts["staged"].id}
+    assert set(object_storage.objects) == {
+        (settings.MINIO_GHOST_BUCKET, minio._object_name_of(ghosts["stored"])),
+        (settings.MINIO_GHOST_BUCKET_STAGING, minio._object_name_of(ghosts["staged"])),
+    }
+    assert _reconcile("--min-age", "0") == ["Found 0 ghosts without data and 0 objects without ghosts"]
+
+
+@pytest.mark.django_db
+def test_reconciliation_covers_deduplicated_data(object_storage: ObjectStorageStandIn, ghosts: dict[str, Ghost]):
+    stored, missing = GhostBlob.objects.create(hash="1" * 64, size=1), GhostBlob.objects.create(hash="2" * 64, size=1)
+    Ghost.objects.filter(id=ghosts["stored"].id).update(blob=stored)
+    Ghost.objects.filter(id=ghosts["staged"].id).update(blob=missing)
+    GhostBlob.objects.update(updated_at=timezone.now() - timedelta(days=2))
+    for blob_hash in (stored.hash, "3" * 64):
+        object_storage.objects[(settings.MINIO_GHOST_BUCKET, minio._blob_object_name(blob_hash))] = b"data"
+
+    lines = _reconcile("--min-age", "0")
+    assert f"Ghost without data: {ghosts['staged'].id} (ghost.tar.xz)" in lines
+    assert f"Data without ghost: {settings.MINIO_GHOST_BUCKET}/{minio._blob_object_name('3' * 64)}" in lines
+    # the data stored per ghost is not used anymore by ghosts with a blob
+    assert f"Data without ghost: {settings.MINIO_GHOST_BUCKET}/{minio._object_name_of(ghosts['stored'])}" in lines
+    assert lines[-1] == "Found 3 ghosts without data and 7 objects without ghosts"
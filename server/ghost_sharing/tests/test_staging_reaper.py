@@ -0,0 +1,125 @@
+from datetime import timedelta
+from http import HTTPStatus
+from io import StringIO
+
+import pytest
+from django.conf import settings
+from django.core.management import call_command
+from django.test import Client
+from django.utils import timezone
+
+from ghost_sharing.models import Gameflow, Ghost, GhostBlob, GhostFinishType, Level
+from hsutils import minio
+from hsutils.test_utils import ObjectStorageStandIn, post_test_url
+from hsutils.viewmodels import (
+    GhostInfoRequest,
+    SuccessResponse,
+    single_ghost,
+    staging_ghosts,
+)
+
+
+def _create_staging_ghosts(django_user_model, count: int) -> list[Ghost]:
+    owner = django_user_model.objects.create(is_active=True, username="owner", email="owner@example.com")
+    level = Level.objects.create(
+        gameflow=Gameflow.objects.create(identifier="gameflow", title="Gameflow"),
+        identifier="LEVEL",
+        title="Level",
+    )
+    return [
+        Ghost.objects.create(
+            owner=owner,
+            level=level,
+            published=False,
+            unpublished_at=timezone.now(),
+            data_size=1,
+            duration=timedelta(seconds=i),
+            finish_type=GhostFinishType.completed,
+            original_filename=f"ghost{i}.tar.xz",
+            description=f"ghost {i}",
+        )
+        for i in range(count)
+    ]
+
+
+@pytest.mark.django_db
+def test_reaper_removes_ghosts_without_data(object_storage: ObjectStorageStandIn, django_user_model):
+    ghosts = _create_staging_ghosts(django_user_model, 10)
+    for ghost in ghosts[:4]:
+        object_storage.objects[(settings.MINIO_GHOST_BUCKET_STAGING, minio._object_name_of(ghost))] = b"data"
+    # published data does not keep staging ghosts alive
+    object_storage.objects[(settings.MINIO_GHOST_BUCKET, minio._object_name_of(ghosts[4]))] = b"data"
+
+    out = StringIO()
+    call_command("reapstagingghosts", stdout=out)
+    assert out.getvalue() == "Deleted 6 objects, 6 staging ghosts\n"
+    assert set(Ghost.objects.values_list("id", flat=True)) == {ghost.id for ghost in ghosts[:4]}
+    # a single listing instead of a request per ghost
+    assert object_storage.requests == [("GET", f"{settings.MINIO_GHOST_BUCKET_STAGING}/")]
+
+
+@pytest.mark.django_db
+def test_staging_listing_does_not_touch_storage(
+    client: Client,
+    object_storage: ObjectStorageStandIn,
+    django_user_model,
+):
+    expired, current, recently_unpublished = _create_staging_ghosts(django_user_model, 3)
+    long_ago = timezone.now() - 2 * minio.STAGING_GHOST_LIFETIME
+    Ghost.objects.filter(id=expired.id).update(unpublished_at=timezone.now() - minio.STAGING_GHOST_LIFETIME)
+    # uploaded long ago, but unpublished just now
+    Ghost.objects.filter(id=recently_unpublished.id).update(created_at=long_ago)
+    client.force_login(current.owner)
+
+    response = client.get("/" + staging_ghosts.path)
+    assert response.status_code == HTTPStatus.OK
+    assert [ghost["id"] for ghost in response.json()["files"]] == [current.id, recently_unpublished.id]
+    assert object_storage.requests == []
+    assert Ghost.objects.count() == 3
+
+
+@pytest.mark.django_db
+def test_reaper_expires_deduplicated_ghosts_by_age(object_storage: ObjectStorageStandIn, django_user_model):
+    blob = GhostBlob.objects.create(hash="0" * 64, size=1)
+    expired, current = _create_staging_ghosts(django_user_model, 2)
+    Ghost.objects.update(blob=blob)
+    Ghost.objects.filter(id=expired.id).update(unpublished_at=timezone.now() - minio.STAGING_GHOST_LIFETIME)
+
+    out = StringIO()
+    call_command("reapstagingghosts", stdout=out)
+    assert out.getvalue() == "Deleted 1 objects, 1 staging ghosts\n"
+    assert list(Ghost.objects.values_list("id", flat=True)) == [current.id]
+    # shared data does not expire with the staging bucket, so it does not need to be listed
+    assert object_storage.requests == []
+
+
+@pytest.mark.django_db
+def test_unpublished_ghosts_expire_after_unpublishing(
+    client: Client,
+    object_storage: ObjectStorageStandIn,
+    django_user_model,
+):
+    blob = GhostBlob.objects.create(hash="0" * 64, size=1, references=1)
+    (ghost,) = _create_staging_ghosts(django_user_model, 1)
+    # uploaded and published long ago
+    long_ago = timezone.now() - 2 * minio.STAGING_GHOST_LIFETIME
+    Ghost.objects.filter(id=ghost.id).update(blob=blob, published=True, unpublished_at=None, created_at=long_ago)
+    client.force_login(ghost.owner)
+
+    status, _ = post_test_url(
+        client,
+        single_ghost.path.replace("<int:id>", str(ghost.id)),
+        GhostInfoRequest(description="ghost", level_id=ghost.level_id, published=False, tags=[]),
+        SuccessResponse,
+    )
+    assert status == HTTPStatus.OK
+    call_command("reapstagingghosts", stdout=StringIO())
+    ghost.refresh_from_db()
+    assert not ghost.published
+    assert ghost.unpublished_at > long_ago
+    blob.refresh_from_db()
+    assert blob.references == 1
+
+    Ghost.objects.filter(id=ghost.id).update(unpublished_at=timezone.now() - minio.STAGING_GHOST_LIFETIME)
+    call_command("reapstagingghosts", stdout=StringIO())
+    assert not Ghost.objects.filter(id=ghost.id).exists()
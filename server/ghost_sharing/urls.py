@@ -1,11 +1,22 @@
 from hsutils.viewmodels import download_ghost as download_ghost_endpoint
-from hsutils.viewmodels import ghosts, levels, quota, single_ghost, staging_ghosts
+from hsutils.viewmodels import (
+    ghost_levels,
+    ghosts,
+    levels,
+    quota,
+    single_ghost,
+    staging_ghosts,
+)
 
 from .views import (
     delete_single_ghost,
     download_ghost,
     get_alternative_levels,
+    get_alternative_levels_version,
+    get_ghost_levels,
+    get_ghost_levels_version,
     get_published_ghosts,
+    get_published_ghosts_version,
     get_quota,
     get_single_ghost,
     get_staging_ghosts,
@@ -14,7 +25,7 @@ from .views import (
 )
 
 urlpatterns = [
-    ghosts.wrap(get_handler=get_published_ghosts, post_handler=upload),
+    ghosts.wrap(get_handler=get_published_ghosts, get_version=get_published_ghosts_version, post_handler=upload),
     quota.wrap(get_handler=get_quota),
     staging_ghosts.wrap(get_handler=get_staging_ghosts),
     single_ghost.wrap(
@@ -23,5 +34,6 @@ urlpatterns = [
         delete_handler=delete_single_ghost,
     ),
     download_ghost_endpoint.wrap(get_handler=download_ghost),
-    levels.wrap(get_handler=get_alternative_levels),
+    ghost_levels.wrap(get_handler=get_ghost_levels, get_version=get_ghost_levels_version),
+    levels.wrap(get_handler=get_alternative_levels, get_version=get_alternative_levels_version),
 ]
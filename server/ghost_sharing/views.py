@@ -1,35 +1,59 @@
+import base64
+import binascii
 import hashlib
 import logging
+import lzma
+import multiprocessing
+import os
+import re
 import tarfile
+import threading
 import uuid
-from datetime import timedelta
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from datetime import datetime, timedelta
 from http import HTTPStatus
 from io import BytesIO
 from pathlib import Path
 from tarfile import TarInfo
+from typing import BinaryIO
 
+import django
 import yaml
 from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.core.files.uploadedfile import UploadedFile
-from django.db.models import Sum
-from django.db.transaction import atomic
-from django.http import FileResponse, HttpRequest
+from django.db.models import Exists, OuterRef, Q, QuerySet
+from django.db.transaction import set_rollback
+from django.http import FileResponse, HttpRequest, HttpResponseRedirect
+from django.utils import timezone
+from django.utils.cache import add_never_cache_headers
+from django.utils.http import http_date, parse_http_date_safe
+from minio import S3Error
+from minio.datatypes import Object
 
 from hsutils.auth import require_authenticated
+from hsutils.conditional import ResourceVersion, queryset_version
 from hsutils.minio import (
+    STAGING_GHOST_LIFETIME,
+    GhostDataStream,
     delete_ghost,
-    get_ghost_data,
     ghost_data_exists,
+    open_ghost_data,
+    presigned_ghost_url,
     publish_ghost,
-    put_staging_ghost,
+    put_ghost_blob,
+    stat_ghost_data,
     unpublish_ghost,
 )
+from hsutils.transaction import immediate_atomic
 from hsutils.viewmodels import (
     GhostFileResponse,
     GhostFileResponseEntry,
     GhostFilesResponse,
     GhostInfoRequest,
+    GhostsQuery,
     LevelInfo,
     LevelsResponse,
     QuotaResponse,
@@ -37,13 +61,19 @@ from hsutils.viewmodels import (
     Tag,
 )
 
-from .models import Gameflow, Ghost, GhostFinishType, Level
+from .download_counter import count_download
+from .models import Gameflow, Ghost, GhostBlob, GhostFinishType, Level, StorageUsage
 from .models import Tag as TagModel
 
 User = get_user_model()
 
+_DEFAULT_GHOST_PAGE_SIZE = 50
 
-class SafeLoaderIgnoreUnknown(yaml.SafeLoader):
+_BYTE_RANGE_PATTERN = re.compile(r"bytes=([0-9]*)-([0-9]*)")
+
+
+# libyaml's parser is several times faster than the pure Python one, but it is an optional part of PyYAML
+class SafeLoaderIgnoreUnknown(getattr(yaml, "CSafeLoader", yaml.SafeLoader)):
     def ignore_unknown(self, node):
         if isinstance(node, yaml.ScalarNode):
             return node.value
@@ -53,17 +83,11 @@ class SafeLoaderIgnoreUnknown(yaml.SafeLoader):
 SafeLoaderIgnoreUnknown.add_constructor(None, SafeLoaderIgnoreUnknown.ignore_unknown)
 
 
-def _remove_expired_staging_ghosts(request: HttpRequest):
-    for ghost in Ghost.objects.filter(published=False, owner=request.user).all():
-        if not ghost_data_exists(ghost):
-            ghost.delete()
-
-
 @require_authenticated(response=QuotaResponse(max=0, current=0))
 def get_quota(request: HttpRequest) -> QuotaResponse:
     return QuotaResponse(
         max=settings.GHOST_QUOTA,
-        current=Ghost.objects.filter(owner=request.user).all().aggregate(Sum("data_size"))["data_size__sum"] or 0,
+        current=StorageUsage.of(request.user),
     )
 
 
@@ -85,96 +109,241 @@ def _verify_ghost_data_archive_member_type(member: TarInfo) -> tuple[int, Succes
     return None
 
 
-def _process_ghost_tarfile(ghost_data_file: BytesIO, data_size: int, data_hash: str, filename: str, owner: User):
-    with tarfile.open(fileobj=ghost_data_file) as archive:
-        for archive_member in archive.getmembers():
-            if result := _verify_ghost_data_extension(archive_member.name):
-                return result
-            if result := _verify_ghost_data_archive_member_type(archive_member):
-                return result
-            if Path(archive_member.name).suffix == ".yml":
-                with archive.extractfile(archive_member) as extracted:
-                    yml_data = yaml.load(extracted, Loader=SafeLoaderIgnoreUnknown)
-                staging_ghost = _parse_ghost_data_yml(
-                    yml_data=yml_data,
-                    data_size=data_size,
-                    data_hash=data_hash,
-                    filename=filename,
-                    owner=owner,
-                )
-    put_staging_ghost(staging_ghost, ghost_data_file)
-    return None
+_UPLOAD_CHUNK_SIZE = 64 * 2**10
+
+
+# feeds everything read through it into the hash, so hashing and archive inspection share a single pass over the file
+class _HashingReader:
+    def __init__(self, fileobj: BinaryIO, file_hash):
+        self._fileobj = fileobj
+        self._hash = file_hash
+
+    def read(self, size: int = -1) -> bytes:
+        data = self._fileobj.read(size)
+        self._hash.update(data)
+        return data
+
+    def drain(self):
+        while self.read(_UPLOAD_CHUNK_SIZE):
+            pass
+
+
+@dataclass(frozen=True)
+class _GhostArchive:
+    level: str
+    duration: int
+    finish_state: str
+    data_hash: str
+
+
+def _read_ghost_metadata(yml_file: BinaryIO) -> tuple[str, int, str] | None:
+    try:
+        ghost = yaml.load(yml_file, Loader=SafeLoaderIgnoreUnknown)["ghost"]
+        return str(ghost["level"]), int(ghost["duration"]), str(ghost["finishState"])
+    except (yaml.YAMLError, TypeError, KeyError, ValueError):
+        return None
+
+
+def _inspect_ghost_archive(
+    source: str | bytes,
+    filename: str,
+    max_members: int,
+    max_unpacked_size: int,
+) -> _GhostArchive | tuple[int, SuccessResponse]:
+    # runs in an ingest process, so it gets the path of the uploaded file or its contents instead of the upload itself
+    unpacked_size = 0
+    with open(source, "rb") if isinstance(source, str) else BytesIO(source) as ghost_data_file:
+        file_hash = hashlib.sha256()
+        reader = _HashingReader(ghost_data_file, file_hash)
+        metadata = None
+        try:
+            # every member has to be verified, so the archive is decompressed to its end anyway, but only the first
+            # metadata file is parsed
+            with tarfile.open(fileobj=reader, mode="r|xz") as archive:
+                for member_count, archive_member in enumerate(archive, start=1):
+                    # checked before anything is extracted, so a decompression bomb is rejected by its headers
+                    unpacked_size += archive_member.size
+                    if member_count > max_members or unpacked_size > max_unpacked_size:
+                        return HTTPStatus.BAD_REQUEST, SuccessResponse(
+                            success=False,
+                            message=f"archive {filename} is too large when unpacked",
+                        )
+                    if result := _verify_ghost_data_extension(Path(archive_member.name)):
+                        return result
+                    if result := _verify_ghost_data_archive_member_type(archive_member):
+                        return result
+                    if metadata is None and Path(archive_member.name).suffix == ".yml":
+                        with archive.extractfile(archive_member) as extracted:
+                            metadata = _read_ghost_metadata(extracted)
+                        if metadata is None:
+                            return HTTPStatus.BAD_REQUEST, SuccessResponse(
+                                success=False,
+                                message=f"invalid ghost metadata in {filename}",
+                            )
+        except (tarfile.TarError, EOFError, lzma.LZMAError):
+            return HTTPStatus.BAD_REQUEST, SuccessResponse(success=False, message=f"invalid archive {filename}")
+        # the tar stream stops reading at the end-of-archive marker, but the hash must cover the whole file
+        reader.drain()
+
+    if metadata is None:
+        return HTTPStatus.BAD_REQUEST, SuccessResponse(
+            success=False,
+            message=f"no ghost metadata found in {filename}",
+        )
+    level, duration, finish_state = metadata
+    return _GhostArchive(level=level, duration=duration, finish_state=finish_state, data_hash=file_hash.hexdigest())
+
+
+_ingest_executor: ProcessPoolExecutor | None = None
+_ingest_executor_pid: int | None = None
+_ingest_executor_lock = threading.Lock()
+
+
+def _get_ingest_executor() -> ProcessPoolExecutor:
+    # decompressing archives is CPU-bound and would hold the GIL of the server worker, so it happens in a pool of
+    # processes shared by all requests of this worker; the processes are spawned, because forking a process which
+    # runs threads is unsafe
+    global _ingest_executor, _ingest_executor_pid
+    with _ingest_executor_lock:
+        if _ingest_executor is None or _ingest_executor_pid != os.getpid():
+            _ingest_executor = ProcessPoolExecutor(
+                max_workers=settings.GHOST_INGEST_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=django.setup,
+            )
+            _ingest_executor_pid = os.getpid()
+        return _ingest_executor
+
+
+def _reset_ingest_executor(executor: ProcessPoolExecutor):
+    global _ingest_executor
+    with _ingest_executor_lock:
+        if _ingest_executor is executor:
+            _ingest_executor = None
+    executor.shutdown(wait=False)
+
+
+def _inspect_ghost_tarfile(ghost_data_file: UploadedFile, filename: str) -> _GhostArchive | tuple[int, SuccessResponse]:
+    # runs concurrently for all files of an upload, so it must not touch the database
+    ghost_data_file.seek(0)
+    if hasattr(ghost_data_file, "temporary_file_path"):
+        source = ghost_data_file.temporary_file_path()
+    else:
+        source = ghost_data_file.read()
+
+    executor = _get_ingest_executor()
+    try:
+        return executor.submit(
+            _inspect_ghost_archive,
+            source,
+            filename,
+            settings.GHOST_ARCHIVE_MAX_MEMBERS,
+            settings.GHOST_ARCHIVE_MAX_UNPACKED_SIZE,
+        ).result()
+    except BrokenProcessPool:
+        # an ingest process died, e.g. because it was killed; the next upload gets a fresh pool
+        _reset_ingest_executor(executor)
+        raise
+
+
+def _store_ghost_blob(blob: GhostBlob, ghost_data_file: UploadedFile):
+    ghost_data_file.seek(0)
+    put_ghost_blob(blob, ghost_data_file, ghost_data_file.size)
+
+
+def _upload_executor(files: dict[str, UploadedFile]) -> ThreadPoolExecutor:
+    return ThreadPoolExecutor(max_workers=max(1, min(len(files), settings.GHOST_UPLOAD_WORKERS)))
 
 
 @require_authenticated(response=SuccessResponse(success=False, message="not authorized"))
-@atomic
 def upload(request: HttpRequest, files: dict[str, UploadedFile]) -> SuccessResponse | tuple[int, SuccessResponse]:
     for filename, data in files.items():
         if not filename.endswith(".tar.xz"):
             return HTTPStatus.BAD_REQUEST, SuccessResponse(success=False, message="Invalid file format")
         elif data.size > settings.MAX_GHOST_SIZE:
             return HTTPStatus.BAD_REQUEST, SuccessResponse(success=False, message="File too large")
-        elif (
-            data.size
-            + (Ghost.objects.filter(owner=request.user).all().aggregate(Sum("data_size"))["data_size__sum"] or 0)
-            > settings.GHOST_QUOTA
-        ):
+
+    try:
+        with _upload_executor(files) as executor:
+            archives = list(executor.map(_inspect_ghost_tarfile, files.values(), files.keys()))
+        for result in archives:
+            if not isinstance(result, _GhostArchive):
+                return result
+
+        # checked again while locked below; this only avoids storing the data of uploads which cannot fit anyway, and
+        # does not create the usage, which only happens while locked
+        used = StorageUsage.objects.filter(owner_id=request.user.id).values_list("used", flat=True).first() or 0
+        if sum(data.size for data in files.values()) + used > settings.GHOST_QUOTA:
             return HTTPStatus.BAD_REQUEST, SuccessResponse(success=False, message="Quota exceeded")
 
-        with BytesIO() as tmp_file:
-            try:
-                file_hash = hashlib.md5()
-                for chunk in data.chunks():
-                    file_hash.update(chunk)
-                    tmp_file.write(chunk)
-                data_hash = file_hash.hexdigest()
-            except Exception:
-                logging.fatal("File save failed", exc_info=True)
-                raise
-
-            tmp_file.seek(0)
-
-            try:
-                if result := _process_ghost_tarfile(
-                    ghost_data_file=tmp_file,
+        level_ids = Level.ids_of("unknown", (archive.level for archive in archives))
+        # the data is stored before any ghost refers to it, so the write lock below is not held while it is sent to the
+        # object storage; data of blobs which may be removed meanwhile is stored as well, and the data of rolled back
+        # uploads is removed by the reconcileghosts command
+        hashes = {archive.data_hash for archive in archives}
+        kept = set(GhostBlob.objects.filter(hash__in=hashes, references__gt=0).values_list("hash", flat=True))
+        new_files = {archive.data_hash: data for data, archive in zip(files.values(), archives)}
+        new_blobs = [
+            (GhostBlob(hash=blob_hash), data) for blob_hash, data in new_files.items() if blob_hash not in kept
+        ]
+        with _upload_executor(files) as executor:
+            stored = [executor.submit(_store_ghost_blob, blob, data) for blob, data in new_blobs]
+        # the first failure is raised before any ghost is created
+        for result in stored:
+            result.result()
+
+        with immediate_atomic():
+            # the blobs are locked in the order of their hashes, so concurrent uploads of the same files cannot deadlock
+            for (filename, data), archive in sorted(zip(files.items(), archives), key=lambda item: item[1].data_hash):
+                if data.size + StorageUsage.of(request.user, lock=True) > settings.GHOST_QUOTA:
+                    # none of the files is kept
+                    set_rollback(True)
+                    return HTTPStatus.BAD_REQUEST, SuccessResponse(success=False, message="Quota exceeded")
+
+                # identical archives are stored only once; the lock keeps the blob from being removed until the ghost
+                # refers to it
+                blob, created = GhostBlob.objects.select_for_update().get_or_create(
+                    hash=archive.data_hash,
+                    defaults={"size": data.size},
+                )
+                if created and archive.data_hash in kept:
+                    # the blob was removed since its data was checked, which is rare enough to store it while locked
+                    _store_ghost_blob(blob, data)
+                    kept.discard(archive.data_hash)
+                _create_staging_ghost(
+                    archive=archive,
+                    level_id=level_ids[archive.level],
                     data_size=data.size,
-                    data_hash=data_hash,
+                    blob=blob,
                     filename=filename,
                     owner=request.user,
-                ):
-                    return result
-            except Exception:
-                logging.fatal("File save failed", exc_info=True)
-                raise
+                )
+    except Exception:
+        logging.fatal("File save failed", exc_info=True)
+        raise
 
     return SuccessResponse(success=True, message="")
 
 
-def _parse_ghost_data_yml(yml_data: dict, data_size: int, data_hash: str, filename: str, owner: User):
-    unknown_gameflow, _ = Gameflow.objects.get_or_create(
-        identifier="unknown",
-        title="unknown",
-    )
-    try:
-        level = Level.objects.get(
-            gameflow=unknown_gameflow,
-            identifier=yml_data["ghost"]["level"],
-        )
-    except Level.DoesNotExist:
-        level = Level.objects.create(
-            gameflow=unknown_gameflow,
-            identifier=yml_data["ghost"]["level"],
-            title=yml_data["ghost"]["level"],
-        )
+def _create_staging_ghost(
+    archive: _GhostArchive,
+    level_id: int,
+    data_size: int,
+    blob: GhostBlob,
+    filename: str,
+    owner: User,
+):
     staging_ghost = Ghost.objects.create(
         owner=owner,
         file_id=uuid.uuid4(),
-        level=level,
-        duration=timedelta(seconds=int(yml_data["ghost"]["duration"]) / 30),
-        hash=data_hash,
+        level_id=level_id,
+        duration=timedelta(seconds=archive.duration / 30),
+        blob=blob,
+        hash=blob.hash,
         original_filename=filename,
         published=False,
-        finish_type=yml_data["ghost"]["finishState"],
+        unpublished_at=timezone.now(),
+        finish_type=archive.finish_state,
         data_size=data_size,
     )
     staging_ghost.save()
@@ -205,23 +374,94 @@ def _ghost_to_response(ghost: Ghost) -> GhostFileResponseEntry:
     )
 
 
-def _get_ghosts(published: bool) -> GhostFilesResponse:
-    return GhostFilesResponse(
-        files=[
-            _ghost_to_response(ghost)
-            for ghost in Ghost.objects.filter(published=published).order_by("-created_at").all()
-        ],
+def _ghost_response_queryset():
+    # everything _ghost_to_response touches, fetched with a constant number of queries
+    return (
+        Ghost.objects.select_related("owner", "level__gameflow")
+        .prefetch_related("tags")
+        .only(
+            "id",
+            "created_at",
+            "description",
+            "duration",
+            "data_size",
+            "finish_type",
+            "downloads",
+            "published",
+            "owner__username",
+            "level__identifier",
+            "level__title",
+            "level__gameflow__title",
+        )
     )
 
 
-def get_published_ghosts(request: HttpRequest) -> GhostFilesResponse:
-    return _get_ghosts(True)
+def _encode_ghost_cursor(ghost: Ghost) -> str:
+    return base64.urlsafe_b64encode(f"{ghost.created_at.isoformat()}|{ghost.id}".encode()).decode()
+
+
+def _decode_ghost_cursor(cursor: str) -> tuple[datetime, int]:
+    try:
+        created_at, id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+        return datetime.fromisoformat(created_at), int(id)
+    except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+        raise ValueError("invalid cursor") from e
+
+
+def _ordered_ghosts(published: bool) -> QuerySet:
+    # (created_at, id) gives a total order, so keyset pages neither skip nor repeat ghosts
+    return _ghost_response_queryset().filter(published=published).order_by("-created_at", "-id")
+
+
+def get_published_ghosts_version(request: HttpRequest) -> ResourceVersion:
+    # covers every filter and page, which is still far cheaper than building the response
+    return queryset_version(
+        Ghost.objects.filter(published=True),
+        TagModel.objects.all(),
+        Level.objects.all(),
+        Gameflow.objects.all(),
+    )
+
+
+def get_published_ghosts(
+    request: HttpRequest,
+    query: GhostsQuery,
+) -> GhostFilesResponse | tuple[int, GhostFilesResponse]:
+    ghosts = _ordered_ghosts(True)
+    for tag_id in query.tags:
+        ghosts = ghosts.filter(tags=tag_id)
+    if query.level_id is not None:
+        ghosts = ghosts.filter(level_id=query.level_id)
+    if query.finish_type is not None:
+        ghosts = ghosts.filter(finish_type=query.finish_type)
+    if query.username is not None:
+        ghosts = ghosts.filter(owner__username=query.username)
+    if query.cursor is not None:
+        try:
+            created_at, id = _decode_ghost_cursor(query.cursor)
+        except ValueError:
+            return HTTPStatus.BAD_REQUEST, GhostFilesResponse(files=[], next_cursor=None)
+        ghosts = ghosts.filter(Q(created_at__lt=created_at) | Q(created_at=created_at, id__lt=id))
+
+    limit = query.limit or _DEFAULT_GHOST_PAGE_SIZE
+    # fetch one more than requested to know whether there is a next page
+    page = list(ghosts[: limit + 1])
+    return GhostFilesResponse(
+        files=[_ghost_to_response(ghost) for ghost in page[:limit]],
+        next_cursor=_encode_ghost_cursor(page[limit - 1]) if len(page) > limit else None,
+    )
 
 
-@atomic
 def get_staging_ghosts(request: HttpRequest) -> GhostFilesResponse:
-    _remove_expired_staging_ghosts(request)
-    return _get_ghosts(False)
+    # the data of ghosts unpublished longer ago has expired, their rows are removed by the reapstagingghosts command;
+    # ghosts uploaded long ago may have been unpublished just now
+    return GhostFilesResponse(
+        files=[
+            _ghost_to_response(ghost)
+            for ghost in _ordered_ghosts(False).filter(unpublished_at__gt=timezone.now() - STAGING_GHOST_LIFETIME)
+        ],
+        next_cursor=None,
+    )
 
 
 @require_authenticated(response=SuccessResponse(success=False, message="not allowed"))
@@ -275,35 +515,130 @@ def update_single_ghost(
     return SuccessResponse(success=True, message="")
 
 
-@atomic
-def download_ghost(request: HttpRequest, id: int) -> FileResponse:
+def _single_byte_range(header: str | None) -> str | None:
+    # only single ranges are passed on to object storage, multiple or malformed ones get the whole file
+    match = None if header is None else _BYTE_RANGE_PATTERN.fullmatch(header.strip())
+    if match is None:
+        return None
+    first, last = match.groups()
+    if not first and not last:
+        return None
+    if first and last and int(last) < int(first):
+        return None
+    return f"bytes={first}-{last}"
+
+
+def _if_range_matches(request: HttpRequest, data: Object | GhostDataStream) -> bool:
+    if_range = request.headers.get("If-Range")
+    if if_range is None:
+        return True
+    if if_range.startswith('"'):
+        return if_range == f'"{data.etag}"'
+    date = parse_http_date_safe(if_range)
+    return date is not None and data.last_modified is not None and date == int(data.last_modified.timestamp())
+
+
+def _missing_ghost_data(ghost: Ghost) -> FileResponse:
+    ghost.delete()
+    return FileResponse(status=HTTPStatus.NOT_FOUND)
+
+
+def _redirect_download(ghost: Ghost, byte_range: str | None) -> HttpResponseRedirect | FileResponse:
+    if not ghost_data_exists(ghost):
+        return _missing_ghost_data(ghost)
+
+    # resumed or parallel downloads only count once
+    if byte_range is None or byte_range.startswith("bytes=0-"):
+        count_download(ghost.id)
+
+    # object storage answers the repeated request, including its range
+    response = HttpResponseRedirect(presigned_ghost_url(ghost))
+    add_never_cache_headers(response)
+    return response
+
+
+def download_ghost(request: HttpRequest, id: int) -> FileResponse | HttpResponseRedirect:
     try:
         ghost: Ghost = Ghost.objects.get(id=id)
     except Ghost.DoesNotExist:
         return FileResponse(status=HTTPStatus.NOT_FOUND)
 
-    if not ghost_data_exists(ghost):
-        ghost.delete()
-        return FileResponse(status=HTTPStatus.NOT_FOUND)
+    byte_range = _single_byte_range(request.headers.get("Range"))
+    if settings.GHOST_DOWNLOAD_PRESIGNED:
+        return _redirect_download(ghost, byte_range)
 
-    ghost.downloads += 1
-    ghost.save()
-
-    return FileResponse(
-        BytesIO(get_ghost_data(ghost)),
+    try:
+        data = open_ghost_data(ghost, byte_range)
+    except S3Error as e:
+        if e.code != "InvalidRange":
+            raise
+        # rare enough to afford asking for the size separately
+        stat = stat_ghost_data(ghost)
+        if stat is None:
+            return _missing_ghost_data(ghost)
+        response = FileResponse(status=HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE)
+        response.headers["Content-Range"] = f"bytes */{stat.size}"
+        return response
+    if data is not None and data.partial and not _if_range_matches(request, data):
+        # the client's copy is outdated, so it needs all of it
+        data.close()
+        data = open_ghost_data(ghost)
+    if data is None:
+        return _missing_ghost_data(ghost)
+
+    # resumed or parallel downloads only count once
+    if data.first == 0:
+        count_download(ghost.id)
+
+    response = FileResponse(
+        data,
         filename=ghost.original_filename,
         as_attachment=True,
+        status=HTTPStatus.PARTIAL_CONTENT if data.partial else HTTPStatus.OK,
     )
+    response.block_size = settings.GHOST_DOWNLOAD_CHUNK_SIZE
+    response.headers["Content-Length"] = data.last - data.first + 1
+    response.headers["Accept-Ranges"] = "bytes"
+    response.headers["ETag"] = f'"{data.etag}"'
+    if data.last_modified is not None:
+        response.headers["Last-Modified"] = http_date(data.last_modified.timestamp())
+    if data.partial:
+        response.headers["Content-Range"] = f"bytes {data.first}-{data.last}/{data.size}"
+    return response
 
 
 def get_single_ghost(request: HttpRequest, id: int) -> GhostFileResponse | tuple[int, GhostFileResponse]:
     try:
-        ghost = Ghost.objects.get(id=id)
+        ghost = _ghost_response_queryset().get(id=id)
     except Ghost.DoesNotExist:
         return HTTPStatus.NOT_FOUND, GhostFileResponse(ghost=None)
     return GhostFileResponse(ghost=_ghost_to_response(ghost))
 
 
+def get_ghost_levels_version(request: HttpRequest) -> ResourceVersion:
+    return queryset_version(Ghost.objects.filter(published=True), Level.objects.all(), Gameflow.objects.all())
+
+
+def get_ghost_levels(request: HttpRequest) -> LevelsResponse:
+    # the levels the published ghosts can be filtered by, independent of which pages a client has loaded
+    return LevelsResponse(
+        levels=[
+            LevelInfo(
+                id=level.id,
+                identifier=level.identifier,
+                title=f"{level.gameflow.title} - {level.title}",
+            )
+            for level in Level.objects.filter(Exists(Ghost.objects.filter(level=OuterRef("pk"), published=True)))
+            .select_related("gameflow")
+            .order_by("gameflow__title", "title")
+        ],
+    )
+
+
+def get_alternative_levels_version(request: HttpRequest, identifier: str) -> ResourceVersion:
+    return queryset_version(Level.objects.filter(identifier=identifier), Gameflow.objects.all())
+
+
 def get_alternative_levels(request: HttpRequest, identifier: str) -> LevelsResponse:
     return LevelsResponse(
         levels=[
@@ -312,6 +647,6 @@ def get_alternative_levels(request: HttpRequest, identifier: str) -> LevelsRespo
                 identifier=level.identifier,
                 title=f"{level.gameflow.title} - {level.title}",
             )
-            for level in Level.objects.filter(identifier=identifier).all()
+            for level in Level.objects.filter(identifier=identifier).select_related("gameflow")
         ],
     )
@@ -2,6 +2,8 @@ import uuid
 
 from django.contrib.auth import get_user_model
 from django.db import models
+from django.db.models.signals import pre_save
+from django.dispatch import receiver
 
 from hsutils import TimestampedModel
 
@@ -14,3 +16,18 @@ class ApiKey(TimestampedModel):
 
     def __str__(self):
         return f"{self.owner}({self.key})"
+
+
+def get_stored_user_state(user: User) -> dict | None:
+    # the username and activity of a user as stored before the save that is currently in progress, None for new users
+    return getattr(user, "_stored_state", None)
+
+
+@receiver(pre_save, sender=User)
+def remember_stored_user_state(sender, instance: User, update_fields=None, **kwargs):
+    if instance.pk is None:
+        instance._stored_state = None
+    elif update_fields is not None and not {"username", "is_active"} & set(update_fields):
+        instance._stored_state = {"username": instance.username, "is_active": instance.is_active}
+    else:
+        instance._stored_state = User.objects.filter(pk=instance.pk).values("username", "is_active").first()
@@ -0,0 +1,75 @@
+import hashlib
+import hmac
+import uuid
+from typing import Iterable
+
+from django.conf import settings
+from django.core.cache import cache
+
+# Only successful lookups are cached, so a stale entry can never grant access on its own;
+# every change that could revoke access removes the affected entries (see the receivers in models.py).
+
+
+def _user_token_cache_key(username: str) -> str:
+    return f"session-access:user:{hashlib.sha256(username.encode()).hexdigest()}"
+
+
+def _session_cache_key(key: uuid.UUID) -> str:
+    return f"session-access:session:{key.hex}"
+
+
+def _hash_token(auth_token: str) -> str:
+    return hashlib.sha256(auth_token.encode()).hexdigest()
+
+
+def is_cached_user_token(username: str, auth_token: str) -> bool:
+    cached = cache.get(_user_token_cache_key(username))
+    return cached is not None and hmac.compare_digest(cached, _hash_token(auth_token))
+
+
+def get_cached_user_tokens(credentials: Iterable[tuple[str, str]]) -> set[tuple[str, str]]:
+    credentials = set(credentials)
+    cached = cache.get_many([_user_token_cache_key(username) for username, _ in credentials])
+    return {
+        (username, auth_token)
+        for username, auth_token in credentials
+        if (cached_hash := cached.get(_user_token_cache_key(username))) is not None
+        and hmac.compare_digest(cached_hash, _hash_token(auth_token))
+    }
+
+
+def cache_user_token(username: str, auth_token: str):
+    cache.set(_user_token_cache_key(username), _hash_token(auth_token), settings.SESSION_ACCESS_CACHE_TIMEOUT)
+
+
+def cache_user_tokens(credentials: Iterable[tuple[str, str]]):
+    cache.set_many(
+        {_user_token_cache_key(username): _hash_token(auth_token) for username, auth_token in credentials},
+        settings.SESSION_ACCESS_CACHE_TIMEOUT,
+    )
+
+
+def invalidate_user_token(username: str):
+    cache.delete(_user_token_cache_key(username))
+
+
+def is_cached_session(key: uuid.UUID) -> bool:
+    return cache.get(_session_cache_key(key)) is not None
+
+
+def get_cached_sessions(keys: Iterable[uuid.UUID]) -> set[uuid.UUID]:
+    keys = set(keys)
+    cached = cache.get_many([_session_cache_key(key) for key in keys])
+    return {key for key in keys if _session_cache_key(key) in cached}
+
+
+def cache_session(key: uuid.UUID):
+    cache.set(_session_cache_key(key), True, settings.SESSION_ACCESS_CACHE_TIMEOUT)
+
+
+def cache_sessions(keys: Iterable[uuid.UUID]):
+    cache.set_many({_session_cache_key(key): True for key in keys}, settings.SESSION_ACCESS_CACHE_TIMEOUT)
+
+
+def invalidate_session(key: uuid.UUID):
+    cache.delete(_session_cache_key(key))
@@ -0,0 +1,81 @@
+import time
+import uuid
+from http import HTTPStatus
+from typing import Callable
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db.transaction import atomic, set_rollback
+from django.test import Client
+
+from haunted_auth.models import ApiKey
+from haunted_sessions.access_cache import invalidate_session, invalidate_user_token
+from haunted_sessions.models import Session
+from hsutils.json_codec import dumps_json
+from hsutils.viewmodels import SessionAccessRequest, session_access
+
+User = get_user_model()
+
+
+def _latencies(requests: int, run: Callable[[], None]) -> list[float]:
+    latencies = []
+    for _ in range(requests):
+        started = time.perf_counter()
+        run()
+        latencies.append(time.perf_counter() - started)
+    return sorted(latencies)
+
+
+def _percentile(latencies: list[float], percent: int) -> float:
+    return latencies[min(len(latencies) - 1, len(latencies) * percent // 100)]
+
+
+class Command(BaseCommand):
+    help = "Measures the latency of session access checks of the coop server, with and without cached lookups"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--requests", type=int, default=1000, help="Number of checks per measurement")
+        parser.add_argument("--host", default="localhost", help="Allowed host the checks are sent to")
+
+    def handle(self, *args, requests: int, host: str, **options):
+        client = Client(HTTP_HOST=host)
+        with atomic():
+            # the player and the session only exist for the benchmark, so they are rolled back afterwards
+            player = User.objects.create(
+                is_active=True,
+                username=f"benchmark-{uuid.uuid4().hex[:16]}",
+                email="benchmark@example.com",
+            )
+            session = Session.objects.create(owner=player, private=False)
+            body = dumps_json(
+                SessionAccessRequest(
+                    api_key=settings.COOP_API_KEY,
+                    username=player.username,
+                    auth_token=ApiKey.objects.create(owner=player).key.hex,
+                    session_id=session.key.hex,
+                ).to_json_data(),
+            )
+
+            def check():
+                response = client.post("/" + session_access.path, data=body, content_type="text/json")
+                if response.status_code != HTTPStatus.OK:
+                    raise CommandError(f"access check failed with status {response.status_code}")
+
+            def cold_check():
+                invalidate_user_token(player.username)
+                invalidate_session(session.key)
+                check()
+
+            try:
+                for name, run in (("Uncached", cold_check), ("Cached", check)):
+                    latencies = _latencies(requests, run)
+                    self.stdout.write(
+                        f"{name} checks: p50 {_percentile(latencies, 50) * 1000:.3f} ms,"
+                        f" p99 {_percentile(latencies, 99) * 1000:.3f} ms",
+                    )
+            finally:
+                # the cache must not outlive the rolled back session
+                invalidate_user_token(player.username)
+                invalidate_session(session.key)
+                set_rollback(True)
@@ -2,12 +2,16 @@ import uuid
 
 from django.contrib.auth import get_user_model
 from django.db import models
-from django.db.models.signals import pre_save
+from django.db.models import Q
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_save
 from django.dispatch import receiver
 from django.utils import timezone
 
+from haunted_auth.models import ApiKey, get_stored_user_state
 from hsutils import TimestampedModel
 
+from .access_cache import invalidate_session, invalidate_user_token
+
 # Create your models here.
 User = get_user_model()
 
@@ -34,6 +38,14 @@ class Session(TimestampedModel):
     private = models.BooleanField()
     last_used = models.DateTimeField(default=timezone.now, editable=False, blank=False, null=False)
 
+    class Meta(TimestampedModel.Meta):
+        indexes = [
+            # the listing shows the public sessions and those owned by the user, newest first
+            models.Index(fields=["-created_at"], condition=Q(private=False), name="session_public_created_idx"),
+            models.Index(fields=["owner", "-created_at"], name="session_owner_created_idx"),
+            models.Index(fields=["last_used"], name="session_last_used_idx"),
+        ]
+
     def __str__(self):
         return str(self.key)
 
@@ -47,3 +59,46 @@ def update_timestamped_model_timestamps(sender, instance: Session, **kwargs):
     if instance.start is None or instance.end is None:
         instance.start = None
         instance.end = None
+
+
+@receiver(m2m_changed, sender=Session.players.through)
+def touch_sessions_of_changed_players(sender, instance, action: str, reverse: bool, pk_set: set | None, **kwargs):
+    # the listing is versioned by the sessions only, so changing the players must move their timestamps
+    if action not in ("post_add", "post_remove", "pre_clear"):
+        return
+    if not reverse:
+        sessions = Session.objects.filter(pk=instance.pk)
+    elif action == "pre_clear":
+        sessions = Session.objects.filter(players=instance)
+    else:
+        sessions = Session.objects.filter(pk__in=pk_set)
+    sessions.update(updated_at=timezone.now())
+
+
+@receiver(post_delete, sender=Session)
+def invalidate_session_access(sender, instance: Session, **kwargs):
+    invalidate_session(instance.key)
+
+
+@receiver(post_save, sender=ApiKey)
+@receiver(post_delete, sender=ApiKey)
+def invalidate_api_key_access(sender, instance: ApiKey, **kwargs):
+    invalidate_user_token(instance.owner.username)
+
+
+@receiver(post_save, sender=User)
+def invalidate_user_access(sender, instance: User, **kwargs):
+    stored = get_stored_user_state(instance)
+    if stored is None:
+        return
+    if stored["username"] != instance.username or stored["is_active"] != instance.is_active:
+        invalidate_user_token(stored["username"])
+        invalidate_user_token(instance.username)
+    if stored["username"] != instance.username:
+        # the sessions show the username, so their versions must change
+        Session.objects.filter(Q(owner=instance) | Q(players=instance)).update(updated_at=timezone.now())
+
+
+@receiver(post_delete, sender=User)
+def invalidate_deleted_user_access(sender, instance: User, **kwargs):
+    invalidate_user_token(instance.username)
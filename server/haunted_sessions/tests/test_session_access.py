@@ -0,0 +1,189 @@
+import uuid
+from http import HTTPStatus
+
+import pytest
+from django.conf import settings
+from django.test import Client
+
+from haunted_auth.models import ApiKey
+from haunted_sessions.models import Session
+from hsutils.test_utils import post_test_url
+from hsutils.viewmodels import (
+    BulkSessionAccessRequest,
+    BulkSessionAccessResponse,
+    SessionAccessEntry,
+    SessionAccessRequest,
+    SuccessResponse,
+    bulk_session_access,
+    session_access,
+)
+
+
+@pytest.fixture
+def player(django_user_model):
+    user = django_user_model.objects.create(is_active=True, username="player", email="player@example.com")
+    ApiKey.objects.create(owner=user)
+    return user
+
+
+@pytest.fixture
+def db_session(player) -> Session:
+    return Session.objects.create(owner=player, private=False)
+
+
+def _check(client: Client, username: str, auth_token: str, session_id: str) -> HTTPStatus:
+    status, response = post_test_url(
+        client,
+        session_access.path,
+        SessionAccessRequest(
+            api_key=settings.COOP_API_KEY,
+            username=username,
+            auth_token=auth_token,
+            session_id=session_id,
+        ),
+        SuccessResponse,
+    )
+    assert response is not None
+    return status
+
+
+def _check_player(client: Client, player, db_session: Session) -> HTTPStatus:
+    return _check(client, player.username, ApiKey.objects.get(owner=player).key.hex, db_session.key.hex)
+
+
+@pytest.mark.django_db
+def test_warm_check_needs_no_queries(client: Client, player, db_session: Session, django_assert_num_queries):
+    auth_token = ApiKey.objects.get(owner=player).key.hex
+    assert _check(client, player.username, auth_token, db_session.key.hex) == HTTPStatus.OK
+
+    with django_assert_num_queries(0):
+        assert _check(client, player.username, auth_token, db_session.key.hex) == HTTPStatus.OK
+
+
+@pytest.mark.django_db
+def test_failed_checks_are_not_cached(client: Client, player, db_session: Session):
+    assert _check(client, player.username, uuid.uuid4().hex, db_session.key.hex) == HTTPStatus.UNAUTHORIZED
+    assert _check(client, "unknown", uuid.uuid4().hex, db_session.key.hex) == HTTPStatus.NOT_FOUND
+    assert _check_player(client, player, Session(key=uuid.uuid4())) == HTTPStatus.NOT_FOUND
+    assert _check(client, player.username, uuid.uuid4().hex, "invalid") == HTTPStatus.NOT_FOUND
+    assert _check_player(client, player, db_session) == HTTPStatus.OK
+    assert _check(client, player.username, uuid.uuid4().hex, db_session.key.hex) == HTTPStatus.UNAUTHORIZED
+
+
+@pytest.mark.django_db
+def test_token_regeneration_revokes_access(client: Client, player, db_session: Session):
+    old_token = ApiKey.objects.get(owner=player).key.hex
+    assert _check(client, player.username, old_token, db_session.key.hex) == HTTPStatus.OK
+
+    ApiKey.objects.get(owner=player).delete()
+    ApiKey.objects.create(owner=player)
+    assert _check(client, player.username, old_token, db_session.key.hex) == HTTPStatus.UNAUTHORIZED
+    assert _check_player(client, player, db_session) == HTTPStatus.OK
+
+    api_key = ApiKey.objects.get(owner=player)
+    old_token = api_key.key.hex
+    api_key.key = uuid.uuid4()
+    api_key.save()
+    assert _check(client, player.username, old_token, db_session.key.hex) == HTTPStatus.UNAUTHORIZED
+
+
+@pytest.mark.django_db
+def test_user_changes_revoke_access(client: Client, player, db_session: Session):
+    auth_token = ApiKey.objects.get(owner=player).key.hex
+    assert _check(client, player.username, auth_token, db_session.key.hex) == HTTPStatus.OK
+
+    player.username = "renamed"
+    player.save()
+    assert _check(client, "player", auth_token, db_session.key.hex) == HTTPStatus.NOT_FOUND
+    assert _check(client, "renamed", auth_token, db_session.key.hex) == HTTPStatus.OK
+
+    player.is_active = False
+    player.save()
+    assert _check(client, "renamed", auth_token, db_session.key.hex) == HTTPStatus.NOT_FOUND
+
+
+@pytest.mark.django_db
+def test_session_deletion_revokes_access(client: Client, player, db_session: Session):
+    assert _check_player(client, player, db_session) == HTTPStatus.OK
+    Session.objects.filter(id=db_session.id).delete()
+    assert _check_player(client, player, db_session) == HTTPStatus.NOT_FOUND
+
+
+def _check_bulk(client: Client, entries: list[tuple[str, str, str]]) -> list[SuccessResponse]:
+    status, response = post_test_url(
+        client,
+        bulk_session_access.path,
+        BulkSessionAccessRequest(
+            api_key=settings.COOP_API_KEY,
+            entries=[
+                SessionAccessEntry(username=username, auth_token=auth_token, session_id=session_id)
+                for username, auth_token, session_id in entries
+            ],
+        ),
+        BulkSessionAccessResponse,
+    )
+    assert status == HTTPStatus.OK
+    return response.results
+
+
+@pytest.mark.django_db
+def test_bulk_check_reports_each_entry(client: Client, django_user_model, player, db_session: Session):
+    inactive = django_user_model.objects.create(is_active=False, username="inactive", email="inactive@example.com")
+    ApiKey.objects.create(owner=inactive)
+    tokenless = django_user_model.objects.create(is_active=True, username="tokenless", email="tokenless@example.com")
+    auth_token = ApiKey.objects.get(owner=player).key.hex
+
+    results = _check_bulk(
+        client,
+        [
+            (player.username, auth_token, db_session.key.hex),
+            (player.username, uuid.uuid4().hex, db_session.key.hex),
+            (player.username, auth_token, uuid.uuid4().hex),
+            (player.username, auth_token, "invalid"),
+            ("unknown", auth_token, db_session.key.hex),
+            (inactive.username, ApiKey.objects.get(owner=inactive).key.hex, db_session.key.hex),
+            (tokenless.username, auth_token, db_session.key.hex),
+        ],
+    )
+    assert [(result.success, result.message) for result in results] == [
+        (True, ""),
+        (False, "invalid auth token"),
+        (False, "session does not exist"),
+        (False, "session does not exist"),
+        (False, "user does not exist"),
+        (False, "user is inactive"),
+        (False, "auth token not found"),
+    ]
+
+
+@pytest.mark.django_db
+def test_bulk_check_query_count_is_constant(client: Client, django_user_model, django_assert_num_queries):
+    users = django_user_model.objects.bulk_create(
+        [django_user_model(is_active=True, username=f"user{i}", email=f"user{i}@example.com") for i in range(200)],
+    )
+    api_keys = ApiKey.objects.bulk_create([ApiKey(owner=user) for user in users])
+    sessions = Session.objects.bulk_create([Session(owner=users[0], private=False) for _ in range(5)])
+    entries = [
+        (user.username, api_key.key.hex, sessions[i % len(sessions)].key.hex)
+        for i, (user, api_key) in enumerate(zip(users, api_keys))
+    ]
+
+    # one query for the users with their tokens and one for the sessions
+    with django_assert_num_queries(2):
+        results = _check_bulk(client, entries)
+    assert all(result.success for result in results)
+
+    with django_assert_num_queries(0):
+        results = _check_bulk(client, entries)
+    assert all(result.success for result in results)
+
+
+@pytest.mark.django_db
+def test_bulk_check_requires_api_key(client: Client, player, db_session: Session):
+    status, _ = post_test_url(
+        client,
+        bulk_session_access.path,
+        BulkSessionAccessRequest(api_key="invalid", entries=[]),
+        BulkSessionAccessResponse,
+    )
+    assert status == HTTPStatus.UNAUTHORIZED
@@ -0,0 +1,118 @@
+from datetime import timedelta
+from http import HTTPStatus
+
+import pytest
+from django.conf import settings
+from django.test import Client
+from django.utils import timezone
+
+from haunted_sessions.models import Session
+from hsutils.test_utils import post_test_url
+from hsutils.viewmodels import (
+    Empty,
+    SessionPlayers,
+    SessionsPlayersRequest,
+    session_players,
+)
+
+
+def _sync(client: Client, players: dict[str, list[str]], api_key: str | None = None) -> HTTPStatus:
+    status, _ = post_test_url(
+        client,
+        session_players.path,
+        SessionsPlayersRequest(
+            api_key=api_key or settings.COOP_API_KEY,
+            sessions=[
+                SessionPlayers(session_id=session_id, usernames=usernames) for session_id, usernames in players.items()
+            ],
+        ),
+        Empty,
+    )
+    return status
+
+
+def _players_of(session: Session) -> set[str]:
+    return {user.username for user in session.players.all()}
+
+
+@pytest.mark.django_db
+def test_sync_applies_reported_players(client: Client, create_users):
+    owner, alice, bob = create_users(3)
+    first = Session.objects.create(owner=owner, private=False)
+    second = Session.objects.create(owner=owner, private=False)
+    idle = Session.objects.create(owner=owner, private=False)
+    idle.players.add(owner)
+    long_ago = timezone.now() - timedelta(days=7)
+    Session.objects.update(last_used=long_ago)
+
+    assert (
+        _sync(
+            client,
+            {
+                first.key.hex: [alice.username, bob.username, "unknown"],
+                str(second.key): [],
+                "not-a-session": [alice.username],
+            },
+        )
+        == HTTPStatus.OK
+    )
+    assert _players_of(first) == {alice.username, bob.username}
+    assert _players_of(second) == set()
+    assert _players_of(idle) == set()
+    first.refresh_from_db()
+    second.refresh_from_db()
+    assert first.last_used > long_ago
+    assert second.last_used == long_ago
+
+    assert _sync(client, {first.key.hex: [bob.username], second.key.hex: [alice.username]}) == HTTPStatus.OK
+    assert _players_of(first) == {bob.username}
+    assert _players_of(second) == {alice.username}
+
+
+@pytest.mark.django_db
+def test_sync_requires_api_key(client: Client, create_users):
+    (owner,) = create_users(1)
+    db_session = Session.objects.create(owner=owner, private=False)
+    db_session.players.add(owner)
+    assert _sync(client, {db_session.key.hex: []}, api_key="invalid") == HTTPStatus.UNAUTHORIZED
+    assert _players_of(db_session) == {owner.username}
+
+
+@pytest.mark.django_db
+def test_sync_scales_with_changes_not_sessions(client: Client, create_users, django_assert_max_num_queries):
+    users = create_users(1000)
+    sessions = Session.objects.bulk_create([Session(owner=users[i % 1000], private=False) for i in range(10000)])
+    # 1k players spread over 100 active sessions
+    players = {sessions[i].key.hex: [user.username for user in users[i * 10 : (i + 1) * 10]] for i in range(100)}
+
+    with django_assert_max_num_queries(11):
+        assert _sync(client, players) == HTTPStatus.OK
+    assert Session.players.through.objects.count() == 1000
+
+    # a few players moving between sessions only changes their rows
+    for i in range(10):
+        players[sessions[i].key.hex].pop()
+        players[sessions[i + 50].key.hex].append(users[i * 10 + 9].username)
+    with django_assert_max_num_queries(11):
+        assert _sync(client, players) == HTTPStatus.OK
+    assert Session.players.through.objects.count() == 1000
+    assert _players_of(sessions[50]) == {user.username for user in users[500:510]} | {users[9].username}
+
+
+@pytest.mark.django_db
+def test_sync_touches_sessions_with_changed_players(client: Client, create_users):
+    owner, alice, bob = create_users(3)
+    kept = Session.objects.create(owner=owner, private=False)
+    changed = Session.objects.create(owner=owner, private=False)
+    dropped = Session.objects.create(owner=owner, private=False)
+    kept.players.add(alice)
+    changed.players.add(alice)
+    dropped.players.add(bob)
+    long_ago = timezone.now() - timedelta(days=7)
+    Session.objects.update(updated_at=long_ago)
+
+    assert _sync(client, {kept.key.hex: [alice.username], changed.key.hex: [bob.username]}) == HTTPStatus.OK
+    updated_at = dict(Session.objects.values_list("id", "updated_at"))
+    assert updated_at[kept.id] == long_ago
+    assert updated_at[changed.id] > long_ago
+    assert updated_at[dropped.id] > long_ago
@@ -0,0 +1,70 @@
+from http import HTTPStatus
+
+import pytest
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+
+from haunted_sessions.models import Session
+from hsutils.test_utils import count_test_url_queries
+from hsutils.viewmodels import sessions
+
+
+@pytest.fixture
+def create_sessions(create_users, create_tags):
+    # every session has its own owner as its player, and some tags
+    def create(count: int):
+        offset = Session.objects.count()
+        tags = create_tags(3)
+        for i, owner in enumerate(create_users(count, offset), start=offset):
+            session = Session.objects.create(owner=owner, description=f"session {i}", private=False)
+            session.tags.set(tags[: i % len(tags) + 1])
+            session.players.add(owner)
+
+    return create
+
+
+@pytest.mark.django_db
+def test_session_listing_query_count_is_constant(client: Client, create_sessions, django_assert_num_queries):
+    create_sessions(1)
+    expected_queries = count_test_url_queries(client, sessions.path)
+
+    create_sessions(20)
+    with django_assert_num_queries(expected_queries):
+        response = client.get("/" + sessions.path)
+    assert len(response.json()["sessions"]) == 21
+
+
+@pytest.mark.django_db
+def test_single_session_query_count_is_constant(
+    client: Client,
+    create_sessions,
+    django_user_model,
+    django_assert_num_queries,
+):
+    create_sessions(1)
+    session = Session.objects.get()
+    expected_queries = count_test_url_queries(client, f"api/v0/sessions/{session.key.hex}")
+
+    create_sessions(20)
+    for user in django_user_model.objects.all():
+        session.players.add(user)
+    with django_assert_num_queries(expected_queries):
+        response = client.get(f"/api/v0/sessions/{session.key.hex}")
+    assert len(response.json()["session"]["players"]) == 21
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("single", [False, True])
+def test_sessions_load_only_usernames(client: Client, create_sessions, single: bool):
+    create_sessions(3)
+    path = f"api/v0/sessions/{Session.objects.first().key.hex}" if single else sessions.path
+    with CaptureQueriesContext(connection) as context:
+        response = client.get("/" + path)
+    assert response.status_code == HTTPStatus.OK
+    user_queries = [query["sql"] for query in context.captured_queries if '"auth_user"' in query["sql"]]
+    assert user_queries
+    for sql in user_queries:
+        assert '"auth_user"."username"' in sql
+        assert '"auth_user"."password"' not in sql
+        assert '"auth_user"."email"' not in sql
@@ -0,0 +1,54 @@
+from http import HTTPStatus
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+
+from haunted_sessions.models import Session
+from hsutils.test_utils import find_table_scans, requires_query_plans
+from hsutils.viewmodels import sessions
+
+pytestmark = requires_query_plans
+
+
+@pytest.fixture
+def session_data(create_users) -> list[Session]:
+    users = create_users(2000)
+    session_list = Session.objects.bulk_create(
+        Session(owner=users[i % len(users)], description=f"session {i}", private=i % 3 == 0) for i in range(300)
+    )
+    Session.players.through.objects.bulk_create(
+        Session.players.through(session=session_list[i % len(session_list)], user=users[i]) for i in range(1200)
+    )
+    return session_list
+
+
+def _get(client: Client, path: str) -> CaptureQueriesContext:
+    with CaptureQueriesContext(connection) as context:
+        response = client.get("/" + path)
+    assert response.status_code == HTTPStatus.OK
+    return context
+
+
+@pytest.mark.django_db
+def test_session_listing_uses_indexes(client: Client, session_data: list[Session]):
+    client.force_login(session_data[0].owner)
+    context = _get(client, sessions.path)
+    # the listing is not paginated and shows most sessions, so only the users must not be read as a whole
+    assert find_table_scans(context.captured_queries, ("auth_user",)) == []
+
+
+@pytest.mark.django_db
+def test_single_session_uses_indexes(client: Client, session_data: list[Session]):
+    context = _get(client, f"api/v0/sessions/{session_data[1].key.hex}")
+    assert find_table_scans(context.captured_queries, ("auth_user", "haunted_sessions_session")) == []
+
+
+@pytest.mark.django_db
+def test_unused_session_removal_uses_indexes(session_data: list[Session]):
+    with CaptureQueriesContext(connection) as context:
+        call_command("removeunusedsessions", stdout=StringIO())
+    assert find_table_scans(context.captured_queries, ("haunted_sessions_session",)) == []
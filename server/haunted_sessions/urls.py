@@ -1,11 +1,23 @@
-from hsutils.viewmodels import session, session_access, session_players, sessions, tags
+from hsutils.viewmodels import (
+    bulk_session_access,
+    session,
+    session_access,
+    session_players,
+    sessions,
+    tags,
+)
 
 from . import views
 
 urlpatterns = [
-    tags.wrap(get_handler=views.get_tags),
+    tags.wrap(get_handler=views.get_tags, get_version=views.get_tags_version),
     session_access.wrap(post_handler=views.check_session_access),
+    bulk_session_access.wrap(post_handler=views.check_bulk_session_access),
     session_players.wrap(post_handler=views.update_sessions_players),
-    sessions.wrap(get_handler=views.get_sessions, post_handler=views.create_session),
+    sessions.wrap(
+        get_handler=views.get_sessions,
+        get_version=views.get_sessions_version,
+        post_handler=views.create_session,
+    ),
     session.wrap(get_handler=views.get_session, post_handler=views.edit_session, delete_handler=views.delete_session),
 ]
@@ -1,9 +1,10 @@
 import logging
+import uuid
 from http import HTTPStatus
 
 from django.conf import settings
 from django.contrib.auth import get_user_model
-from django.db.models import Q
+from django.db.models import Case, F, Prefetch, Q, QuerySet, Value, When
 from django.db.transaction import atomic
 from django.http import HttpRequest
 from django.utils import timezone
@@ -11,11 +12,15 @@ from django.views.decorators.csrf import csrf_exempt
 
 from haunted_auth.models import ApiKey
 from hsutils.auth import require_authenticated
+from hsutils.conditional import ResourceVersion, queryset_version
 from hsutils.rest_helper import parse_datetime
 from hsutils.viewmodels import (
+    BulkSessionAccessRequest,
+    BulkSessionAccessResponse,
     CreateSessionRequest,
     Empty,
     Session,
+    SessionAccessEntry,
     SessionAccessRequest,
     SessionResponse,
     SessionsPlayersRequest,
@@ -26,12 +31,26 @@ from hsutils.viewmodels import (
     TimeSpan,
 )
 
+from .access_cache import (
+    cache_session,
+    cache_sessions,
+    cache_user_token,
+    cache_user_tokens,
+    get_cached_sessions,
+    get_cached_user_tokens,
+    is_cached_session,
+    is_cached_user_token,
+)
 from .models import Session as SessionModel
 from .models import Tag as TagModel
 
 User = get_user_model()
 
 
+def get_tags_version(request: HttpRequest) -> ResourceVersion:
+    return queryset_version(TagModel.objects.all())
+
+
 def get_tags(request: HttpRequest) -> TagsResponse:
     return TagsResponse(
         tags=[
@@ -71,19 +90,43 @@ def session_to_response(session: SessionModel) -> Session:
     )
 
 
-def get_sessions(request: HttpRequest) -> SessionsResponse:
+def _session_response_queryset(sessions: QuerySet) -> QuerySet:
+    # everything session_to_response touches, fetched with a constant number of queries; of the users, only their
+    # names are needed
+    return (
+        sessions.select_related("owner")
+        .prefetch_related("tags", Prefetch("players", queryset=User.objects.only("username")))
+        .only("key", "description", "start", "end", "private", "owner__username")
+    )
+
+
+def _visible_sessions(request: HttpRequest):
     if request.user.is_staff or request.user.is_superuser:
-        sessions = SessionModel.objects
-    else:
-        sessions = SessionModel.objects.filter(Q(private=False) | Q(private=True, owner_id=request.user.id))
+        return SessionModel.objects.all()
+    return SessionModel.objects.filter(Q(private=False) | Q(private=True, owner_id=request.user.id))
+
+
+def get_sessions_version(request: HttpRequest) -> ResourceVersion:
+    # the visible sessions depend on the user; changing the players of a session moves its updated_at
+    return queryset_version(
+        _visible_sessions(request),
+        TagModel.objects.all(),
+        extra=f"{request.user.id}:{request.user.is_staff or request.user.is_superuser}",
+    )
+
+
+def get_sessions(request: HttpRequest) -> SessionsResponse:
     return SessionsResponse(
-        sessions=[session_to_response(session) for session in sessions.order_by("-created_at").all()],
+        sessions=[
+            session_to_response(session)
+            for session in _session_response_queryset(_visible_sessions(request)).order_by("-created_at")
+        ],
     )
 
 
 def get_session(request: HttpRequest, session_id: str) -> SessionResponse | tuple[int, SessionResponse]:
     try:
-        session = SessionModel.objects.get(key=session_id)
+        session = _session_response_queryset(SessionModel.objects.all()).get(key=session_id)
     except SessionModel.DoesNotExist:
         return HTTPStatus.NOT_FOUND, SessionResponse(session=None)
 
@@ -170,59 +213,162 @@ def check_session_access(
         return HTTPStatus.UNAUTHORIZED, SuccessResponse(success=False, message="invalid api key")
 
     try:
-        user = User.objects.get(username=body.username)
-    except User.DoesNotExist:
-        return HTTPStatus.NOT_FOUND, SuccessResponse(success=False, message="user does not exist")
-    except Exception:
-        logging.error("unexpected error while retrieving user", exc_info=True)
-        return HTTPStatus.INTERNAL_SERVER_ERROR, SuccessResponse(
-            success=False,
-            message="unexpected error while retrieving user",
-        )
+        session_key = uuid.UUID(body.session_id)
+    except ValueError:
+        return HTTPStatus.NOT_FOUND, SuccessResponse(success=False, message="session does not exist")
+
+    if not is_cached_user_token(body.username, body.auth_token):
+        try:
+            user = User.objects.get(username=body.username)
+        except User.DoesNotExist:
+            return HTTPStatus.NOT_FOUND, SuccessResponse(success=False, message="user does not exist")
+        except Exception:
+            logging.error("unexpected error while retrieving user", exc_info=True)
+            return HTTPStatus.INTERNAL_SERVER_ERROR, SuccessResponse(
+                success=False,
+                message="unexpected error while retrieving user",
+            )
 
-    if not user.is_active:
-        return HTTPStatus.NOT_FOUND, SuccessResponse(success=False, message="user is inactive")
+        if not user.is_active:
+            return HTTPStatus.NOT_FOUND, SuccessResponse(success=False, message="user is inactive")
 
-    try:
-        auth_token = ApiKey.objects.get(owner=user)
-    except ApiKey.DoesNotExist:
-        return HTTPStatus.NOT_FOUND, SuccessResponse(success=False, message="auth token not found")
-    except Exception:
-        logging.error("unexpected error while checking auth token", exc_info=True)
-        return HTTPStatus.INTERNAL_SERVER_ERROR, SuccessResponse(
-            success=False,
-            message="unexpected error while checking auth token",
-        )
+        try:
+            auth_token = ApiKey.objects.get(owner=user)
+        except ApiKey.DoesNotExist:
+            return HTTPStatus.NOT_FOUND, SuccessResponse(success=False, message="auth token not found")
+        except Exception:
+            logging.error("unexpected error while checking auth token", exc_info=True)
+            return HTTPStatus.INTERNAL_SERVER_ERROR, SuccessResponse(
+                success=False,
+                message="unexpected error while checking auth token",
+            )
 
-    if auth_token.key.hex != body.auth_token:
-        return HTTPStatus.UNAUTHORIZED, SuccessResponse(success=False, message="invalid auth token")
-    if not SessionModel.objects.filter(key=body.session_id).exists():
-        return HTTPStatus.NOT_FOUND, SuccessResponse(success=False, message="session does not exist")
+        if auth_token.key.hex != body.auth_token:
+            return HTTPStatus.UNAUTHORIZED, SuccessResponse(success=False, message="invalid auth token")
+        cache_user_token(body.username, body.auth_token)
+
+    if not is_cached_session(session_key):
+        if not SessionModel.objects.filter(key=session_key).exists():
+            return HTTPStatus.NOT_FOUND, SuccessResponse(success=False, message="session does not exist")
+        cache_session(session_key)
     return SuccessResponse(success=True, message="")
 
 
+@csrf_exempt
+def check_bulk_session_access(
+    request: HttpRequest,
+    body: BulkSessionAccessRequest,
+) -> BulkSessionAccessResponse | tuple[int, BulkSessionAccessResponse]:
+    if body.api_key != settings.COOP_API_KEY:
+        return HTTPStatus.UNAUTHORIZED, BulkSessionAccessResponse(results=[])
+
+    session_keys: dict[str, uuid.UUID] = {}
+    for entry in body.entries:
+        try:
+            session_keys[entry.session_id] = uuid.UUID(entry.session_id)
+        except ValueError:
+            pass
+
+    # everything that is not cached yet is resolved with one query for the users and one for the sessions
+    valid_credentials = get_cached_user_tokens((entry.username, entry.auth_token) for entry in body.entries)
+    existing_sessions = get_cached_sessions(session_keys.values())
+    unverified_usernames = {
+        entry.username for entry in body.entries if (entry.username, entry.auth_token) not in valid_credentials
+    }
+    users = {
+        user.username: user for user in User.objects.filter(username__in=unverified_usernames).select_related("apikey")
+    }
+    unknown_session_keys = set(session_keys.values()) - existing_sessions
+    new_sessions = set(SessionModel.objects.filter(key__in=unknown_session_keys).values_list("key", flat=True))
+    cache_sessions(new_sessions)
+    existing_sessions |= new_sessions
+    verified_credentials: set[tuple[str, str]] = set()
+
+    def check_entry(entry: SessionAccessEntry) -> SuccessResponse:
+        if (entry.username, entry.auth_token) not in valid_credentials:
+            user = users.get(entry.username)
+            if user is None:
+                return SuccessResponse(success=False, message="user does not exist")
+            if not user.is_active:
+                return SuccessResponse(success=False, message="user is inactive")
+            try:
+                auth_token = user.apikey
+            except ApiKey.DoesNotExist:
+                return SuccessResponse(success=False, message="auth token not found")
+            if auth_token.key.hex != entry.auth_token:
+                return SuccessResponse(success=False, message="invalid auth token")
+            valid_credentials.add((entry.username, entry.auth_token))
+            verified_credentials.add((entry.username, entry.auth_token))
+        if session_keys.get(entry.session_id) not in existing_sessions:
+            return SuccessResponse(success=False, message="session does not exist")
+        return SuccessResponse(success=True, message="")
+
+    results = [check_entry(entry) for entry in body.entries]
+    cache_user_tokens(verified_credentials)
+    return BulkSessionAccessResponse(results=results)
+
+
 @csrf_exempt
 @atomic
 def update_sessions_players(request: HttpRequest, body: SessionsPlayersRequest) -> Empty | tuple[int, Empty]:
     if body.api_key != settings.COOP_API_KEY:
         return HTTPStatus.UNAUTHORIZED, Empty()
 
-    for db_session in SessionModel.objects.all():
-        db_session.players.clear()
+    reported_usernames: dict[uuid.UUID, set[str]] = {}
     for session in body.sessions:
         try:
-            db_session = SessionModel.objects.get(key=session.session_id)
-        except SessionModel.DoesNotExist:
+            key = uuid.UUID(session.session_id)
+        except ValueError:
             continue
-        if session.usernames:
-            db_session.last_used = timezone.now()
-        for user in session.usernames:
-            try:
-                db_user = User.objects.get(username=user)
-            except User.DoesNotExist:
-                continue
-            db_session.players.add(db_user)
-        db_session.save()
+        reported_usernames.setdefault(key, set()).update(session.usernames)
+
+    session_ids = dict(SessionModel.objects.filter(key__in=reported_usernames.keys()).values_list("key", "id"))
+    user_ids = dict(
+        User.objects.filter(
+            username__in={username for usernames in reported_usernames.values() for username in usernames},
+        ).values_list("username", "id"),
+    )
+    wanted_players = {
+        (session_ids[key], user_ids[username])
+        for key, usernames in reported_usernames.items()
+        if key in session_ids
+        for username in usernames
+        if username in user_ids
+    }
+
+    # only touch the rows that changed since the last sync instead of rebuilding all memberships; sessions which
+    # were not reported have no players anymore
+    Membership = SessionModel.players.through
+    unreported_rows = Membership.objects.exclude(session_id__in=session_ids.values())
+    now = timezone.now()
+    SessionModel.objects.filter(id__in=unreported_rows.values("session_id")).update(updated_at=now)
+    unreported_rows.delete()
+    stale_rows = []
+    changed_session_ids = set()
+    reported_rows = Membership.objects.filter(session_id__in=session_ids.values())
+    for row_id, session_id, user_id in reported_rows.values_list("id", "session_id", "user_id"):
+        if (session_id, user_id) in wanted_players:
+            wanted_players.remove((session_id, user_id))
+        else:
+            stale_rows.append(row_id)
+            changed_session_ids.add(session_id)
+    if stale_rows:
+        Membership.objects.filter(id__in=stale_rows).delete()
+    Membership.objects.bulk_create(
+        [Membership(session_id=session_id, user_id=user_id) for session_id, user_id in wanted_players],
+    )
+    changed_session_ids.update(session_id for session_id, _ in wanted_players)
+
+    # bulk changes of the memberships send no signals, so the changed sessions are touched here together with the
+    # usage of the reported ones
+    used_session_ids = {
+        session_ids[key] for key, usernames in reported_usernames.items() if usernames and key in session_ids
+    }
+    if used_session_ids or changed_session_ids:
+        SessionModel.objects.filter(id__in=used_session_ids | changed_session_ids).update(
+            last_used=Case(When(id__in=used_session_ids, then=Value(now)), default=F("last_used")),
+            updated_at=Case(When(id__in=changed_session_ids, then=Value(now)), default=F("updated_at")),
+        )
     return Empty()
 
 
@@ -103,6 +103,9 @@ STATIC_URL = "static/"
 
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
+# always spool uploads to disk, so that ghost uploads never sit in worker memory as a whole
+FILE_UPLOAD_HANDLERS = ["django.core.files.uploadhandler.TemporaryFileUploadHandler"]
+
 CACHES = {
     "default": env.cache(),
 }
@@ -263,8 +266,39 @@ MINIO_ACCESS_KEY = env("MINIO_ACCESS_KEY")
 MINIO_SECRET_KEY = env("MINIO_SECRET_KEY")
 MINIO_GHOST_BUCKET = env("MINIO_GHOST_BUCKET")
 MINIO_GHOST_BUCKET_STAGING = env("MINIO_GHOST_BUCKET_STAGING")
+# setting the region avoids a bucket location lookup per bucket and process
+MINIO_REGION = env("MINIO_REGION", default=None)
+MINIO_MAX_CONNECTIONS = env.int("MINIO_MAX_CONNECTIONS", default=10)
+MINIO_CONNECT_TIMEOUT = env.float("MINIO_CONNECT_TIMEOUT", default=10.0)
+MINIO_READ_TIMEOUT = env.float("MINIO_READ_TIMEOUT", default=60.0)
+MINIO_RETRIES = env.int("MINIO_RETRIES", default=3)
+MINIO_TCP_KEEPALIVE = env.bool("MINIO_TCP_KEEPALIVE", default=True)
+
+MINIO_UPLOAD_PART_SIZE = env.int("MINIO_UPLOAD_PART_SIZE", default=5 * 2**20)  # 5 MiB, the minimum allowed by S3
+# downloads are passed through in chunks of this size, so memory use does not depend on the ghost size
+GHOST_DOWNLOAD_CHUNK_SIZE = env.int("GHOST_DOWNLOAD_CHUNK_SIZE", default=64 * 2**10)
+# redirect downloads to short-lived presigned URLs instead of passing them through; MINIO_URL must then be reachable
+# by the clients, as it is part of the signature
+GHOST_DOWNLOAD_PRESIGNED = env.bool("GHOST_DOWNLOAD_PRESIGNED", default=False)
+GHOST_DOWNLOAD_PRESIGNED_EXPIRY = timedelta(seconds=env.int("GHOST_DOWNLOAD_PRESIGNED_EXPIRY", default=60))
+# count downloads in the cache and write them with "manage.py flushghostdownloads"; needs a cache shared by all workers
+GHOST_DOWNLOADS_BUFFERED = env.bool("GHOST_DOWNLOADS_BUFFERED", default=False)
+# how long the existence of published ghost data is remembered, in seconds
+GHOST_DATA_EXISTS_CACHE_TIMEOUT = env.int("GHOST_DATA_EXISTS_CACHE_TIMEOUT", default=60)
+
+# how many files of a single upload are inspected and stored concurrently
+GHOST_UPLOAD_WORKERS = env.int("GHOST_UPLOAD_WORKERS", default=4)
+# how many processes per server worker unpack uploaded archives, shared by all uploads
+GHOST_INGEST_WORKERS = env.int("GHOST_INGEST_WORKERS", default=2)
+# uploaded archives exceeding these limits are rejected before they are unpacked any further
+GHOST_ARCHIVE_MAX_MEMBERS = 16
+GHOST_ARCHIVE_MAX_UNPACKED_SIZE = 128 * 2**20  # 128 MiB
 
 MAX_GHOST_SIZE = 5 * 2**20  # 5 MiB
 GHOST_QUOTA = 100 * 2**20  # 100 MiB
 
 SESSION_RETENTION_WEEKS = env.int("SESSION_RETENTION_WEEKS")
+# how long successful session access checks are cached, in seconds
+SESSION_ACCESS_CACHE_TIMEOUT = env.int("SESSION_ACCESS_CACHE_TIMEOUT", default=300)
+# the incrementally maintained server statistics are recomputed from scratch when they get older than this
+SERVER_STATISTICS_MAX_AGE = timedelta(seconds=env.int("SERVER_STATISTICS_MAX_AGE", default=3600))
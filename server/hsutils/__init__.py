@@ -14,6 +14,8 @@ class TimestampedModel(models.Model):
         ordering = ("created_at",)
 
 
-@receiver(pre_save, sender=TimestampedModel)
-def update_timestamped_model_timestamps(sender, instance: TimestampedModel, **kwargs):
-    instance.updated_at = timezone.now()
+# signals are not sent for abstract senders, so this has to listen to all models
+@receiver(pre_save)
+def update_timestamped_model_timestamps(sender, instance, **kwargs):
+    if isinstance(instance, TimestampedModel):
+        instance.updated_at = timezone.now()
@@ -0,0 +1,62 @@
+import hashlib
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Callable, Optional
+
+from django.db.models import Count, Max, QuerySet
+from django.http import HttpRequest, HttpResponseBase
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date
+
+from . import TimestampedModel
+
+
+@dataclass(frozen=True)
+class ResourceVersion:
+    # anything that changes whenever the response would change
+    key: str
+    last_modified: Optional[datetime] = None
+
+    @property
+    def etag(self) -> str:
+        return f'"{hashlib.sha256(self.key.encode()).hexdigest()}"'
+
+
+def queryset_version(*querysets: QuerySet, extra: str = "") -> ResourceVersion:
+    # the row count catches deletions, the latest change catches everything else
+    parts = [extra]
+    last_modified = None
+    for queryset in querysets:
+        if issubclass(queryset.model, TimestampedModel):
+            aggregated = queryset.aggregate(count=Count("pk"), latest=Max("updated_at"))
+            if aggregated["latest"] is not None and (last_modified is None or aggregated["latest"] > last_modified):
+                last_modified = aggregated["latest"]
+        else:
+            aggregated = queryset.aggregate(count=Count("pk"), latest=Max("pk"))
+        parts.append(f"{queryset.model._meta.label}:{aggregated['count']}:{aggregated['latest']}")
+    return ResourceVersion(key="|".join(parts), last_modified=last_modified)
+
+
+def conditional_response(
+    request: HttpRequest,
+    version: Optional[ResourceVersion],
+    get_response: Callable[[], HttpResponseBase],
+) -> HttpResponseBase:
+    if version is None:
+        return get_response()
+
+    # only the etag is compared, as a deletion does not move the latest modification time forward
+    not_modified = get_conditional_response(request, etag=version.etag)
+    if not_modified is not None:
+        if not_modified.status_code == 304:
+            not_modified.headers["ETag"] = version.etag
+        return not_modified
+
+    response = get_response()
+    if response.status_code == 200:
+        response.headers["ETag"] = version.etag
+        if version.last_modified is not None:
+            response.headers["Last-Modified"] = http_date(version.last_modified.timestamp())
+        # always revalidate instead of heuristically caching based on Last-Modified
+        patch_cache_control(response, no_cache=True)
+    return response
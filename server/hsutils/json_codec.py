@@ -0,0 +1,20 @@
+import json
+from typing import Any
+
+# orjson is considerably faster for large responses, but not required
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def loads_json(data: bytes | str) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps_json(data: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(",", ":")).encode()
@@ -1,13 +1,123 @@
-from io import SEEK_END
-from typing import BinaryIO, Iterable
+import hashlib
+import heapq
+import os
+import socket
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from itertools import groupby
+from typing import BinaryIO, Iterable, Iterator, Optional
 
+import certifi
+import urllib3
 from django.conf import settings
-from django.contrib.auth.models import AbstractUser
+from django.core.cache import cache
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.utils.http import content_disposition_header, parse_http_date_safe
 from minio import Minio, S3Error
 from minio.commonconfig import ENABLED, CopySource, Filter
+from minio.datatypes import Object
+from minio.deleteobjects import DeleteObject
 from minio.lifecycleconfig import Expiration, LifecycleConfig, Rule
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
 
-from ghost_sharing.models import Ghost
+from ghost_sharing.models import Ghost, GhostBlob
+
+# staging data is removed by a lifecycle rule of the staging bucket
+STAGING_GHOST_LIFETIME = timedelta(days=1)
+
+
+@dataclass(frozen=True)
+class PoolStats:
+    # requests served by an already established connection
+    hits: int
+    # requests that needed a new TCP connection (and TLS handshake, if secure)
+    misses: int
+
+
+_stats_lock = threading.Lock()
+_checkouts = 0
+_connects = 0
+
+
+def get_pool_stats() -> PoolStats:
+    with _stats_lock:
+        return PoolStats(hits=max(0, _checkouts - _connects), misses=_connects)
+
+
+def reset_pool_stats():
+    global _checkouts, _connects
+    with _stats_lock:
+        _checkouts = 0
+        _connects = 0
+
+
+def _count_checkout():
+    global _checkouts
+    with _stats_lock:
+        _checkouts += 1
+
+
+def _count_connect():
+    global _connects
+    with _stats_lock:
+        _connects += 1
+
+
+class _CountingHTTPConnection(HTTPConnection):
+    def _new_conn(self) -> socket.socket:
+        _count_connect()
+        return super()._new_conn()
+
+
+class _CountingHTTPSConnection(HTTPSConnection):
+    def _new_conn(self) -> socket.socket:
+        _count_connect()
+        return super()._new_conn()
+
+
+class _CountingHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _CountingHTTPConnection
+
+    def _get_conn(self, timeout: Optional[float] = None):
+        _count_checkout()
+        return super()._get_conn(timeout)
+
+
+class _CountingHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _CountingHTTPSConnection
+
+    def _get_conn(self, timeout: Optional[float] = None):
+        _count_checkout()
+        return super()._get_conn(timeout)
+
+
+def _create_http_client() -> urllib3.PoolManager:
+    socket_options = list(HTTPConnection.default_socket_options)
+    if settings.MINIO_TCP_KEEPALIVE:
+        socket_options.append((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1))
+
+    http_client = urllib3.PoolManager(
+        maxsize=settings.MINIO_MAX_CONNECTIONS,
+        timeout=urllib3.Timeout(connect=settings.MINIO_CONNECT_TIMEOUT, read=settings.MINIO_READ_TIMEOUT),
+        retries=urllib3.Retry(
+            total=settings.MINIO_RETRIES,
+            backoff_factor=0.2,
+            status_forcelist=[500, 502, 503, 504],
+        ),
+        cert_reqs="CERT_REQUIRED",
+        ca_certs=os.environ.get("SSL_CERT_FILE") or certifi.where(),
+        socket_options=socket_options,
+    )
+    http_client.pool_classes_by_scheme = {
+        "http": _CountingHTTPConnectionPool,
+        "https": _CountingHTTPSConnectionPool,
+    }
+    return http_client
 
 
 def _create_client() -> Minio:
@@ -16,11 +126,43 @@ def _create_client() -> Minio:
         access_key=settings.MINIO_ACCESS_KEY,
         secret_key=settings.MINIO_SECRET_KEY,
         secure=settings.MINIO_SECURE,
+        region=settings.MINIO_REGION,
+        http_client=_create_http_client(),
     )
 
 
+_client_lock = threading.Lock()
+_client: Optional[Minio] = None
+_client_pid: Optional[int] = None
+
+
+def _get_client() -> Minio:
+    # one client (and thus one connection pool) per process; sockets must not be shared with forked workers
+    global _client, _client_pid
+    pid = os.getpid()
+    if _client is None or _client_pid != pid:
+        with _client_lock:
+            if _client is None or _client_pid != pid:
+                _client = _create_client()
+                _client_pid = pid
+    return _client
+
+
+def reset_client():
+    global _client, _client_pid
+    with _client_lock:
+        _client = None
+        _client_pid = None
+
+
+@receiver(setting_changed)
+def _reset_client_on_setting_change(setting: str, **kwargs):
+    if setting.startswith("MINIO_"):
+        reset_client()
+
+
 def prepare_buckets():
-    client = _create_client()
+    client = _get_client()
     if not client.bucket_exists(settings.MINIO_GHOST_BUCKET_STAGING):
         client.make_bucket(settings.MINIO_GHOST_BUCKET_STAGING)
         client.set_bucket_lifecycle(
@@ -29,7 +171,7 @@ def prepare_buckets():
                 [
                     Rule(
                         ENABLED,
-                        expiration=Expiration(days=1),
+                        expiration=Expiration(days=STAGING_GHOST_LIFETIME.days),
                         rule_filter=Filter(prefix=""),
                     ),
                 ],
@@ -39,74 +181,275 @@ def prepare_buckets():
         client.make_bucket(settings.MINIO_GHOST_BUCKET)
 
 
-def _list_ghosts(user: AbstractUser, bucket: str) -> Iterable[tuple[str, int]]:
-    client = _create_client()
-    return (
-        (ob.object_name, ob.size)
-        for ob in client.list_objects(
-            bucket,
-            prefix=f"{user.id}/",
-            recursive=True,
-        )
-        if not ob.is_dir
-    )
+def _object_name_of(ghost: Ghost) -> str:
+    return f"{ghost.owner_id}/{ghost.file_id.hex}/{ghost.original_filename}"
 
 
-def _object_name_of(ghost: Ghost) -> str:
-    return f"{ghost.owner.id}/{ghost.file_id.hex}/{ghost.original_filename}"
+# deduplicated data lives in the published bucket next to the owner prefixes of the data stored per ghost
+_BLOB_PREFIX = "blobs"
+
+
+def _blob_object_name(blob_hash: str) -> str:
+    return f"{_BLOB_PREFIX}/{blob_hash}"
+
+
+def _bucket_of(published: bool) -> str:
+    return settings.MINIO_GHOST_BUCKET if published else settings.MINIO_GHOST_BUCKET_STAGING
+
+
+def _location_of(ghost: Ghost) -> tuple[str, str]:
+    # deduplicated data is shared by all ghosts with the same content, so it stays in place when (un)publishing
+    if ghost.blob_id is not None:
+        return settings.MINIO_GHOST_BUCKET, _blob_object_name(ghost.blob_id)
+    return _bucket_of(ghost.published), _object_name_of(ghost)
+
+
+def _exists_cache_key(ghost: Ghost) -> str:
+    return f"ghost-data-exists:{ghost.file_id.hex}"
+
+
+def _forget_existence(ghost: Ghost):
+    cache.delete(_exists_cache_key(ghost))
+
+
+def stat_ghost_data(ghost: Ghost) -> Optional[Object]:
+    client = _get_client()
+    try:
+        return client.stat_object(*_location_of(ghost))
+    except S3Error as e:
+        if e.code == "NoSuchKey":
+            return None
+        raise
 
 
 def ghost_data_exists(ghost: Ghost) -> bool:
-    client = _create_client()
+    # published data only goes away through unpublish_ghost or delete_ghost, so it is safe to remember for a while
+    if ghost.published and cache.get(_exists_cache_key(ghost)):
+        return True
+    exists = stat_ghost_data(ghost) is not None
+    if exists and ghost.published:
+        cache.set(_exists_cache_key(ghost), True, settings.GHOST_DATA_EXISTS_CACHE_TIMEOUT)
+    return exists
+
+
+class GhostDataStream:
+    # a file-like view on the object data as it arrives; closing it hands the connection back to the pool
+    def __init__(self, response: urllib3.BaseHTTPResponse):
+        self._response = response
+        self.etag = response.headers.get("ETag", "").replace('"', "")
+        last_modified = parse_http_date_safe(response.headers.get("Last-Modified", ""))
+        self.last_modified = None if last_modified is None else datetime.fromtimestamp(last_modified, timezone.utc)
+        # the transferred bytes and the size of the whole object
+        if (content_range := response.headers.get("Content-Range")) is not None:
+            transferred, size = content_range.removeprefix("bytes ").split("/")
+            first, last = transferred.split("-")
+            self.first, self.last, self.size = int(first), int(last), int(size)
+            self.partial = True
+        else:
+            self.size = int(response.headers["Content-Length"])
+            self.first, self.last = 0, self.size - 1
+            self.partial = False
+
+    def read(self, size: int = -1) -> bytes:
+        return self._response.read(None if size < 0 else size)
+
+    def close(self):
+        self._response.close()
+        self._response.release_conn()
+
+
+def open_ghost_data(ghost: Ghost, byte_range: Optional[str] = None) -> Optional[GhostDataStream]:
+    # a single request, which also tells whether the data exists; a byte range is passed on as-is
+    client = _get_client()
     try:
-        client.stat_object(
-            settings.MINIO_GHOST_BUCKET if ghost.published else settings.MINIO_GHOST_BUCKET_STAGING,
-            object_name=_object_name_of(ghost),
+        return GhostDataStream(
+            client.get_object(
+                *_location_of(ghost),
+                request_headers=None if byte_range is None else {"Range": byte_range},
+            ),
         )
-        return True
     except S3Error as e:
         if e.code == "NoSuchKey":
-            return False
+            return None
         raise
 
 
-def get_ghost_data(ghost: Ghost) -> bytes:
-    client = _create_client()
-    with client.get_object(
-        settings.MINIO_GHOST_BUCKET if ghost.published else settings.MINIO_GHOST_BUCKET_STAGING,
-        object_name=_object_name_of(ghost),
-    ) as response:
-        return response.read()
+def presigned_ghost_url(ghost: Ghost) -> str:
+    # signed locally, as long as the region is known
+    client = _get_client()
+    return client.presigned_get_object(
+        *_location_of(ghost),
+        expires=settings.GHOST_DOWNLOAD_PRESIGNED_EXPIRY,
+        response_headers={"response-content-disposition": content_disposition_header(True, ghost.original_filename)},
+    )
+
+
+def get_missing_staging_ghost_data(ghosts: Iterable[Ghost]) -> list[Ghost]:
+    # a single listing of the staging bucket instead of a request per ghost
+    client = _get_client()
+    existing = {
+        ob.object_name
+        for ob in client.list_objects(settings.MINIO_GHOST_BUCKET_STAGING, recursive=True)
+        if not ob.is_dir
+    }
+    return [ghost for ghost in ghosts if _object_name_of(ghost) not in existing]
+
+
+@dataclass(frozen=True)
+class OrphanedGhostData:
+    published: bool
+    object_name: str
+
+
+_RECONCILIATION_WORKERS = 4
+# how many owners are listed ahead of the comparison, which bounds the memory use
+_RECONCILIATION_LOOKAHEAD = 16
+
+
+def _list_owner_prefixes(published: bool) -> list[str]:
+    client = _get_client()
+    return [
+        ob.object_name.rstrip("/")
+        for ob in client.list_objects(_bucket_of(published))
+        if ob.is_dir and not (published and ob.object_name == f"{_BLOB_PREFIX}/")
+    ]
 
 
-def get_staging_ghosts(user: AbstractUser) -> Iterable[tuple[str, int]]:
-    return _list_ghosts(user, settings.MINIO_GHOST_BUCKET_STAGING)
+def _list_owner_objects(published: bool, owner_prefix: str) -> dict[str, datetime]:
+    client = _get_client()
+    return {
+        ob.object_name: ob.last_modified
+        for ob in client.list_objects(_bucket_of(published), prefix=f"{owner_prefix}/", recursive=True)
+        if not ob.is_dir
+    }
+
+
+def _owner_prefix_order(owner_prefix: str) -> tuple[int, int | str]:
+    # the same order as the ghosts, which are sorted by owner id; anything else does not belong to a user
+    return (0, int(owner_prefix)) if owner_prefix.isdecimal() else (1, owner_prefix)
+
+
+def find_orphaned_ghost_data(ghosts: Iterable[Ghost], min_age: timedelta) -> Iterator[Ghost | OrphanedGhostData]:
+    """
+    Compares both buckets with the ghosts, which must be ordered by owner, one owner at a time. Yields the ghosts
+    without data and the data without ghosts which have not been touched for min_age, as uploads and (un)publishing
+    change the data before the ghost.
+    """
+    cutoff = datetime.now(timezone.utc) - min_age
+    owner_prefixes = sorted(set(_list_owner_prefixes(True)) | set(_list_owner_prefixes(False)), key=_owner_prefix_order)
+    # both sides are ordered by owner, so they can be joined without holding more than a few owners
+    owners = groupby(
+        heapq.merge(
+            ((owner_prefix, None) for owner_prefix in owner_prefixes),
+            ((owner_id, list(owner_ghosts)) for owner_id, owner_ghosts in groupby(ghosts, key=_owner_prefix_of)),
+            key=lambda entry: _owner_prefix_order(entry[0]),
+        ),
+        key=lambda entry: entry[0],
+    )
 
+    with ThreadPoolExecutor(max_workers=_RECONCILIATION_WORKERS) as executor:
 
-def get_published_ghosts(user: AbstractUser) -> Iterable[tuple[str, int]]:
-    return _list_ghosts(user, settings.MINIO_GHOST_BUCKET)
+        def start_listing(owner_prefix: str, entries: Iterable[tuple[str, Optional[list[Ghost]]]]):
+            entries = list(entries)
+            owner_ghosts = [ghost for _, entry_ghosts in entries if entry_ghosts is not None for ghost in entry_ghosts]
+            if all(entry_ghosts is not None for _, entry_ghosts in entries):
+                return owner_ghosts, None, None
+            return (
+                owner_ghosts,
+                executor.submit(_list_owner_objects, True, owner_prefix),
+                executor.submit(_list_owner_objects, False, owner_prefix),
+            )
 
+        pending = deque()
+        for owner_prefix, entries in owners:
+            pending.append(start_listing(owner_prefix, entries))
+            if len(pending) > _RECONCILIATION_LOOKAHEAD:
+                yield from _compare_owner(*pending.popleft(), cutoff)
+        while pending:
+            yield from _compare_owner(*pending.popleft(), cutoff)
 
-def get_user_ghost_total_size(user: AbstractUser) -> int:
-    return sum(size for _, size in get_staging_ghosts(user)) + sum(size for _, size in get_published_ghosts(user))
+
+def _owner_prefix_of(ghost: Ghost) -> str:
+    return str(ghost.owner_id)
+
+
+def _compare_owner(
+    ghosts: list[Ghost],
+    published_listing: Optional[Future],
+    staging_listing: Optional[Future],
+    cutoff: datetime,
+) -> Iterator[Ghost | OrphanedGhostData]:
+    listed = {
+        True: {} if published_listing is None else published_listing.result(),
+        False: {} if staging_listing is None else staging_listing.result(),
+    }
+    # deduplicated data is compared by find_orphaned_ghost_blobs
+    ghosts = [ghost for ghost in ghosts if ghost.blob_id is None]
+    stored = {(ghost.published, _object_name_of(ghost)) for ghost in ghosts}
+    for ghost in ghosts:
+        if _object_name_of(ghost) not in listed[ghost.published] and ghost.updated_at < cutoff:
+            yield ghost
+    for published, objects in listed.items():
+        for object_name, last_modified in objects.items():
+            if (published, object_name) not in stored and last_modified < cutoff:
+                yield OrphanedGhostData(published=published, object_name=object_name)
+
+
+def find_orphaned_ghost_blobs(
+    blobs: Iterable[GhostBlob],
+    min_age: timedelta,
+) -> Iterator[GhostBlob | OrphanedGhostData]:
+    """
+    Compares the deduplicated data with the blobs, which must be ordered by hash. Yields the blobs without data and the
+    data without blobs which have not been touched for min_age.
+    """
+    cutoff = datetime.now(timezone.utc) - min_age
+    client = _get_client()
+    listing = client.list_objects(settings.MINIO_GHOST_BUCKET, prefix=f"{_BLOB_PREFIX}/", recursive=True)
+    # object names and hashes have the same order, so both can be joined while streaming
+    entries = heapq.merge(
+        ((_blob_object_name(blob.hash), blob) for blob in blobs),
+        ((ob.object_name, ob) for ob in listing if not ob.is_dir),
+        key=lambda entry: entry[0],
+    )
+    for object_name, matches in groupby(entries, key=lambda entry: entry[0]):
+        (_, match), *others = matches
+        if others:
+            continue
+        if isinstance(match, GhostBlob):
+            if match.updated_at < cutoff:
+                yield match
+        elif match.last_modified < cutoff:
+            yield OrphanedGhostData(published=True, object_name=object_name)
 
 
-def put_staging_ghost(ghost: Ghost, data: BinaryIO):
-    data.seek(0, SEEK_END)
-    length = data.tell()
-    data.seek(0)
-    client = _create_client()
+def remove_orphaned_ghost_data(orphans: Iterable[OrphanedGhostData]):
+    client = _get_client()
+    orphans = list(orphans)
+    for published in (True, False):
+        errors = client.remove_objects(
+            _bucket_of(published),
+            [DeleteObject(orphan.object_name) for orphan in orphans if orphan.published == published],
+        )
+        for error in errors:
+            raise RuntimeError(f"failed to remove {error.name}: {error.code} {error.message}")
+
+
+def put_ghost_blob(blob: GhostBlob, data: BinaryIO, length: int):
+    client = _get_client()
     client.put_object(
-        settings.MINIO_GHOST_BUCKET_STAGING,
-        object_name=_object_name_of(ghost),
+        settings.MINIO_GHOST_BUCKET,
+        object_name=_blob_object_name(blob.hash),
         data=data,
         length=length,
+        part_size=settings.MINIO_UPLOAD_PART_SIZE,
     )
 
 
 def _move_ghost(ghost: Ghost, src_bucket: str, dst_bucket: str):
-    client = _create_client()
-    object_name = f"{ghost.owner.id}/{ghost.file_id.hex}/{ghost.original_filename}"
+    # only needed for data stored per ghost, which the migrateghostdata command turns into blobs
+    client = _get_client()
+    object_name = _object_name_of(ghost)
     client.copy_object(
         dst_bucket,
         object_name,
@@ -122,20 +465,49 @@ def _move_ghost(ghost: Ghost, src_bucket: str, dst_bucket: str):
 
 
 def publish_ghost(ghost: Ghost):
-    _move_ghost(ghost, settings.MINIO_GHOST_BUCKET_STAGING, settings.MINIO_GHOST_BUCKET)
+    _forget_existence(ghost)
+    if ghost.blob_id is None:
+        _move_ghost(ghost, settings.MINIO_GHOST_BUCKET_STAGING, settings.MINIO_GHOST_BUCKET)
     ghost.published = True
+    ghost.unpublished_at = None
 
 
 def unpublish_ghost(ghost: Ghost):
-    _move_ghost(ghost, settings.MINIO_GHOST_BUCKET, settings.MINIO_GHOST_BUCKET_STAGING)
+    _forget_existence(ghost)
+    if ghost.blob_id is None:
+        _move_ghost(ghost, settings.MINIO_GHOST_BUCKET, settings.MINIO_GHOST_BUCKET_STAGING)
     ghost.published = False
+    # the staging lifetime starts anew, as it did when the data was copied to the staging bucket
+    ghost.unpublished_at = datetime.now(timezone.utc)
 
 
 def delete_ghost(ghost: Ghost):
-    client = _create_client()
-    object_name = f"{ghost.owner.id}/{ghost.file_id.hex}/{ghost.original_filename}"
-    bucket_name = settings.MINIO_GHOST_BUCKET if ghost.published else settings.MINIO_GHOST_BUCKET_STAGING
-    client.remove_object(
-        bucket_name=bucket_name,
-        object_name=object_name,
-    )
+    _forget_existence(ghost)
+    # deduplicated data is released when the ghost is deleted, and removed by delete_ghost_blob once unreferenced
+    if ghost.blob_id is None:
+        client = _get_client()
+        client.remove_object(*_location_of(ghost))
+
+
+def hash_ghost_data(ghost: Ghost) -> Optional[str]:
+    data = open_ghost_data(ghost)
+    if data is None:
+        return None
+    try:
+        data_hash = hashlib.sha256()
+        while chunk := data.read(settings.GHOST_DOWNLOAD_CHUNK_SIZE):
+            data_hash.update(chunk)
+    finally:
+        data.close()
+    return data_hash.hexdigest()
+
+
+def copy_ghost_data_to_blob(ghost: Ghost, blob: GhostBlob):
+    # server-side, the data does not pass through here again
+    client = _get_client()
+    client.copy_object(settings.MINIO_GHOST_BUCKET, _blob_object_name(blob.hash), CopySource(*_location_of(ghost)))
+
+
+def delete_ghost_blob(blob: GhostBlob):
+    client = _get_client()
+    client.remove_object(settings.MINIO_GHOST_BUCKET, _blob_object_name(blob.hash))
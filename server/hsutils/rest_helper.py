@@ -1,5 +1,20 @@
 from datetime import datetime
+from typing import Callable, Optional, TypeVar
+
+T = TypeVar("T")
 
 
 def parse_datetime(value: str) -> datetime:
     return datetime.fromisoformat(value[:-1] + "+00:00" if value.endswith("Z") else value)
+
+
+def parse_query_value(value: Optional[str], parser: Callable[[str], T]) -> Optional[T]:
+    return None if value is None else parser(value)
+
+
+def parse_bool(value: str) -> bool:
+    if value in ("true", "1"):
+        return True
+    if value in ("false", "0"):
+        return False
+    raise ValueError(f"invalid boolean value {value}")
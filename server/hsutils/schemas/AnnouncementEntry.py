@@ -1,6 +1,6 @@
 import re
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Any, List, Optional
 
 from dataclasses_json import DataClassJsonMixin, dataclass_json
 from django.core.files.uploadedfile import UploadedFile
@@ -29,3 +29,48 @@ class AnnouncementEntry(DataClassJsonMixin, Validatable):
             raise SchemaValidationError("AnnouncementEntry.text_color is null")
         if len(self.text_color) < 1:
             raise SchemaValidationError("AnnouncementEntry.text_color is too short")
+
+    @classmethod
+    def from_json_data(cls, data: Any) -> "AnnouncementEntry":
+        if not isinstance(data, dict):
+            raise SchemaValidationError("AnnouncementEntry has an invalid type")
+        background_color_value = data.get("background_color")
+        if background_color_value is None:
+            raise SchemaValidationError("AnnouncementEntry.background_color is null")
+        if not isinstance(background_color_value, str):
+            raise SchemaValidationError("AnnouncementEntry.background_color has an invalid type")
+        if len(background_color_value) < 1:
+            raise SchemaValidationError("AnnouncementEntry.background_color is too short")
+        message_value = data.get("message")
+        if message_value is None:
+            raise SchemaValidationError("AnnouncementEntry.message is null")
+        if not isinstance(message_value, str):
+            raise SchemaValidationError("AnnouncementEntry.message has an invalid type")
+        if len(message_value) < 1:
+            raise SchemaValidationError("AnnouncementEntry.message is too short")
+        text_color_value = data.get("text_color")
+        if text_color_value is None:
+            raise SchemaValidationError("AnnouncementEntry.text_color is null")
+        if not isinstance(text_color_value, str):
+            raise SchemaValidationError("AnnouncementEntry.text_color has an invalid type")
+        if len(text_color_value) < 1:
+            raise SchemaValidationError("AnnouncementEntry.text_color is too short")
+        return cls(background_color=background_color_value, message=message_value, text_color=text_color_value)
+
+    def to_json_data(self) -> dict[str, Any]:
+        background_color_value = self.background_color
+        if background_color_value is None:
+            raise SchemaValidationError("AnnouncementEntry.background_color is null")
+        if len(background_color_value) < 1:
+            raise SchemaValidationError("AnnouncementEntry.background_color is too short")
+        message_value = self.message
+        if message_value is None:
+            raise SchemaValidationError("AnnouncementEntry.message is null")
+        if len(message_value) < 1:
+            raise SchemaValidationError("AnnouncementEntry.message is too short")
+        text_color_value = self.text_color
+        if text_color_value is None:
+            raise SchemaValidationError("AnnouncementEntry.text_color is null")
+        if len(text_color_value) < 1:
+            raise SchemaValidationError("AnnouncementEntry.text_color is too short")
+        return {"background_color": background_color_value, "message": message_value, "text_color": text_color_value}
@@ -1,6 +1,6 @@
 import re
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Any, List, Optional
 
 from dataclasses_json import DataClassJsonMixin, dataclass_json
 from django.core.files.uploadedfile import UploadedFile
@@ -20,3 +20,34 @@ class AnnouncementsResponse(DataClassJsonMixin, Validatable):
             raise SchemaValidationError("AnnouncementsResponse.announcements is null")
         for self_announcements_entry in self.announcements:
             self_announcements_entry.validate()
+
+    @classmethod
+    def from_json_data(cls, data: Any) -> "AnnouncementsResponse":
+        if not isinstance(data, dict):
+            raise SchemaValidationError("AnnouncementsResponse has an invalid type")
+        announcements_value = data.get("announcements")
+        if announcements_value is None:
+            raise SchemaValidationError("AnnouncementsResponse.announcements is null")
+        if not isinstance(announcements_value, list):
+            raise SchemaValidationError("AnnouncementsResponse.announcements has an invalid type")
+        announcements_value_converted = []
+        for announcements_value_entry in announcements_value:
+            if announcements_value_entry is None:
+                raise SchemaValidationError("AnnouncementsResponse.announcements is null")
+            announcements_value_entry = AnnouncementEntry.from_json_data(announcements_value_entry)
+            announcements_value_converted.append(announcements_value_entry)
+        announcements_value = announcements_value_converted
+        return cls(announcements=announcements_value)
+
+    def to_json_data(self) -> dict[str, Any]:
+        announcements_value = self.announcements
+        if announcements_value is None:
+            raise SchemaValidationError("AnnouncementsResponse.announcements is null")
+        announcements_value_converted = []
+        for announcements_value_entry in announcements_value:
+            if announcements_value_entry is None:
+                raise SchemaValidationError("AnnouncementsResponse.announcements is null")
+            announcements_value_entry = announcements_value_entry.to_json_data()
+            announcements_value_converted.append(announcements_value_entry)
+        announcements_value = announcements_value_converted
+        return {"announcements": announcements_value}
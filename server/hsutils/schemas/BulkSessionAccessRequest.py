@@ -0,0 +1,70 @@
+import re
+from dataclasses import dataclass
+from typing import Any, List, Optional
+
+from dataclasses_json import DataClassJsonMixin, dataclass_json
+from django.core.files.uploadedfile import UploadedFile
+
+from ..error import SchemaValidationError
+from ..validated_response import Validatable
+from .SessionAccessEntry import SessionAccessEntry
+
+
+@dataclass_json
+@dataclass(kw_only=True)
+class BulkSessionAccessRequest(DataClassJsonMixin, Validatable):
+    api_key: str
+    entries: List[SessionAccessEntry]
+
+    def validate(self):
+        if self.api_key is None:
+            raise SchemaValidationError("BulkSessionAccessRequest.api_key is null")
+        if len(self.api_key) < 1:
+            raise SchemaValidationError("BulkSessionAccessRequest.api_key is too short")
+        if self.entries is None:
+            raise SchemaValidationError("BulkSessionAccessRequest.entries is null")
+        for self_entries_entry in self.entries:
+            self_entries_entry.validate()
+
+    @classmethod
+    def from_json_data(cls, data: Any) -> "BulkSessionAccessRequest":
+        if not isinstance(data, dict):
+            raise SchemaValidationError("BulkSessionAccessRequest has an invalid type")
+        api_key_value = data.get("api_key")
+        if api_key_value is None:
+            raise SchemaValidationError("BulkSessionAccessRequest.api_key is null")
+        if not isinstance(api_key_value, str):
+            raise SchemaValidationError("BulkSessionAccessRequest.api_key has an invalid type")
+        if len(api_key_value) < 1:
+            raise SchemaValidationError("BulkSessionAccessRequest.api_key is too short")
+        entries_value = data.get("entries")
+        if entries_value is None:
+            raise SchemaValidationError("BulkSessionAccessRequest.entries is null")
+        if not isinstance(entries_value, list):
+            raise SchemaValidationError("BulkSessionAccessRequest.entries has an invalid type")
+        entries_value_converted = []
+        for entries_value_entry in entries_value:
+            if entries_value_entry is None:
+                raise SchemaValidationError("BulkSessionAccessRequest.entries is null")
+            entries_value_entry = SessionAccessEntry.from_json_data(entries_value_entry)
+            entries_value_converted.append(entries_value_entry)
+        entries_value = entries_value_converted
+        return cls(api_key=api_key_value, entries=entries_value)
+
+    def to_json_data(self) -> dict[str, Any]:
+        api_key_value = self.api_key
+        if api_key_value is None:
+            raise SchemaValidationError("BulkSessionAccessRequest.api_key is null")
+        if len(api_key_value) < 1:
+            raise SchemaValidationError("BulkSessionAccessRequest.api_key is too short")
+        entries_value = self.entries
+        if entries_value is None:
+            raise SchemaValidationError("BulkSessionAccessRequest.entries is null")
+        entries_value_converted = []
+        for entries_value_entry in entries_value:
+            if entries_value_entry is None:
+                raise SchemaValidationError("BulkSessionAccessRequest.entries is null")
+            entries_value_entry = entries_value_entry.to_json_data()
+            entries_value_converted.append(entries_value_entry)
+        entries_value = entries_value_converted
+        return {"api_key": api_key_value, "entries": entries_value}
@@ -0,0 +1,53 @@
+import re
+from dataclasses import dataclass
+from typing import Any, List, Optional
+
+from dataclasses_json import DataClassJsonMixin, dataclass_json
+from django.core.files.uploadedfile import UploadedFile
+
+from ..error import SchemaValidationError
+from ..validated_response import Validatable
+from .SuccessResponse import SuccessResponse
+
+
+@dataclass_json
+@dataclass(kw_only=True)
+class BulkSessionAccessResponse(DataClassJsonMixin, Validatable):
+    results: List[SuccessResponse]
+
+    def validate(self):
+        if self.results is None:
+            raise SchemaValidationError("BulkSessionAccessResponse.results is null")
+        for self_results_entry in self.results:
+            self_results_entry.validate()
+
+    @classmethod
+    def from_json_data(cls, data: Any) -> "BulkSessionAccessResponse":
+        if not isinstance(data, dict):
+            raise SchemaValidationError("BulkSessionAccessResponse has an invalid type")
+        results_value = data.get("results")
+        if results_value is None:
+            raise SchemaValidationError("BulkSessionAccessResponse.results is null")
+        if not isinstance(results_value, list):
+            raise SchemaValidationError("BulkSessionAccessResponse.results has an invalid type")
+        results_value_converted = []
+        for results_value_entry in results_value:
+            if results_value_entry is None:
+                raise SchemaValidationError("BulkSessionAccessResponse.results is null")
+            results_value_entry = SuccessResponse.from_json_data(results_value_entry)
+            results_value_converted.append(results_value_entry)
+        results_value = results_value_converted
+        return cls(results=results_value)
+
+    def to_json_data(self) -> dict[str, Any]:
+        results_value = self.results
+        if results_value is None:
+            raise SchemaValidationError("BulkSessionAccessResponse.results is null")
+        results_value_converted = []
+        for results_value_entry in results_value:
+            if results_value_entry is None:
+                raise SchemaValidationError("BulkSessionAccessResponse.results is null")
+            results_value_entry = results_value_entry.to_json_data()
+            results_value_converted.append(results_value_entry)
+        results_value = results_value_converted
+        return {"results": results_value}
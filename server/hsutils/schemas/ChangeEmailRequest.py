@@ -1,6 +1,6 @@
 import re
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Any, List, Optional
 
 from dataclasses_json import DataClassJsonMixin, dataclass_json
 from django.core.files.uploadedfile import UploadedFile
@@ -19,3 +19,24 @@ class ChangeEmailRequest(DataClassJsonMixin, Validatable):
             raise SchemaValidationError("ChangeEmailRequest.email is null")
         if len(self.email) < 1:
             raise SchemaValidationError("ChangeEmailRequest.email is too short")
+
+    @classmethod
+    def from_json_data(cls, data: Any) -> "ChangeEmailRequest":
+        if not isinstance(data, dict):
+            raise SchemaValidationError("ChangeEmailRequest has an invalid type")
+        email_value = data.get("email")
+        if email_value is None:
+            raise SchemaValidationError("ChangeEmailRequest.email is null")
+        if not isinstance(email_value, str):
+            raise SchemaValidationError("ChangeEmailRequest.email has an invalid type")
+        if len(email_value) < 1:
+            raise SchemaValidationError("ChangeEmailRequest.email is too short")
+        return cls(email=email_value)
+
+    def to_json_data(self) -> dict[str, Any]:
+        email_value = self.email
+        if email_value is None:
+            raise SchemaValidationError("ChangeEmailRequest.email is null")
+        if len(email_value) < 1:
+            raise SchemaValidationError("ChangeEmailRequest.email is too short")
+        return {"email": email_value}
@@ -1,6 +1,6 @@
 import re
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Any, List, Optional
 
 from dataclasses_json import DataClassJsonMixin, dataclass_json
 from django.core.files.uploadedfile import UploadedFile
@@ -19,3 +19,24 @@ class ChangePasswordRequest(DataClassJsonMixin, Validatable):
             raise SchemaValidationError("ChangePasswordRequest.password is null")
         if len(self.password) < 1:
             raise SchemaValidationError("ChangePasswordRequest.password is too short")
+
+    @classmethod
+    def from_json_data(cls, data: Any) -> "ChangePasswordRequest":
+        if not isinstance(data, dict):
+            raise SchemaValidationError("ChangePasswordRequest has an invalid type")
+        password_value = data.get("password")
+        if password_value is None:
+            raise SchemaValidationError("ChangePasswordRequest.password is null")
+        if not isinstance(password_value, str):
+            raise SchemaValidationError("ChangePasswordRequest.password has an invalid type")
+        if len(password_value) < 1:
+            raise SchemaValidationError("ChangePasswordRequest.password is too short")
+        return cls(password=password_value)
+
+    def to_json_data(self) -> dict[str, Any]:
+        password_value = self.password
+        if password_value is None:
+            raise SchemaValidationError("ChangePasswordRequest.password is null")
+        if len(password_value) < 1:
+            raise SchemaValidationError("ChangePasswordRequest.password is too short")
+        return {"password": password_value}
@@ -1,6 +1,6 @@
 import re
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Any, List, Optional
 
 from dataclasses_json import DataClassJsonMixin, dataclass_json
 from django.core.files.uploadedfile import UploadedFile
@@ -19,3 +19,24 @@ class ChangeUsernameRequest(DataClassJsonMixin, Validatable):
             raise SchemaValidationError("ChangeUsernameRequest.username is null")
         if len(self.username) < 1:
             raise SchemaValidationError("ChangeUsernameRequest.username is too short")
+
+    @classmethod
+    def from_json_data(cls, data: Any) -> "ChangeUsernameRequest":
+        if not isinstance(data, dict):
+            raise SchemaValidationError("ChangeUsernameRequest has an invalid type")
+        username_value = data.get("username")
+        if username_value is None:
+            raise SchemaValidationError("ChangeUsernameRequest.username is null")
+        if not isinstance(username_value, str):
+            raise SchemaValidationError("ChangeUsernameRequest.username has an invalid type")
+        if len(username_value) < 1:
+            raise SchemaValidationError("ChangeUsernameRequest.username is too short")
+        return cls(username=username_value)
+
+    def to_json_data(self) -> dict[str, Any]:
+        username_value = self.username
+        if username_value is None:
+            raise SchemaValidationError("ChangeUsernameRequest.username is null")
+        if len(username_value) < 1:
+            raise SchemaValidationError("ChangeUsernameRequest.username is too short")
+        return {"username": username_value}
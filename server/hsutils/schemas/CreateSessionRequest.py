@@ -1,6 +1,6 @@
 import re
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Any, List, Optional
 
 from dataclasses_json import DataClassJsonMixin, dataclass_json
 from django.core.files.uploadedfile import UploadedFile
@@ -33,3 +33,54 @@ class CreateSessionRequest(DataClassJsonMixin, Validatable):
             pass
         if self.time is not None:
             self.time.validate()
+
+    @classmethod
+    def from_json_data(cls, data: Any) -> "CreateSessionRequest":
+        if not isinstance(data, dict):
+            raise SchemaValidationError("CreateSessionRequest has an invalid type")
+        description_value = data.get("description")
+        if description_value is None:
+            raise SchemaValidationError("CreateSessionRequest.description is null")
+        if not isinstance(description_value, str):
+            raise SchemaValidationError("CreateSessionRequest.description has an invalid type")
+        if len(description_value) > 512:
+            raise SchemaValidationError("CreateSessionRequest.description is too long")
+        private_value = data.get("private")
+        if private_value is None:
+            raise SchemaValidationError("CreateSessionRequest.private is null")
+        if not isinstance(private_value, bool):
+            raise SchemaValidationError("CreateSessionRequest.private has an invalid type")
+        tags_value = data.get("tags")
+        if tags_value is None:
+            raise SchemaValidationError("CreateSessionRequest.tags is null")
+        if not isinstance(tags_value, list):
+            raise SchemaValidationError("CreateSessionRequest.tags has an invalid type")
+        for tags_value_entry in tags_value:
+            if tags_value_entry is None:
+                raise SchemaValidationError("CreateSessionRequest.tags is null")
+            if not isinstance(tags_value_entry, int) or isinstance(tags_value_entry, bool):
+                raise SchemaValidationError("CreateSessionRequest.tags has an invalid type")
+        time_value = data.get("time")
+        if time_value is not None:
+            time_value = TimeSpan.from_json_data(time_value)
+        return cls(description=description_value, private=private_value, tags=tags_value, time=time_value)
+
+    def to_json_data(self) -> dict[str, Any]:
+        description_value = self.description
+        if description_value is None:
+            raise SchemaValidationError("CreateSessionRequest.description is null")
+        if len(description_value) > 512:
+            raise SchemaValidationError("CreateSessionRequest.description is too long")
+        private_value = self.private
+        if private_value is None:
+            raise SchemaValidationError("CreateSessionRequest.private is null")
+        tags_value = self.tags
+        if tags_value is None:
+            raise SchemaValidationError("CreateSessionRequest.tags is null")
+        for tags_value_entry in tags_value:
+            if tags_value_entry is None:
+                raise SchemaValidationError("CreateSessionRequest.tags is null")
+        time_value = self.time
+        if time_value is not None:
+            time_value = time_value.to_json_data()
+        return {"description": description_value, "private": private_value, "tags": tags_value, "time": time_value}
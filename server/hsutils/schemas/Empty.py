@@ -1,6 +1,6 @@
 import re
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Any, List, Optional
 
 from dataclasses_json import DataClassJsonMixin, dataclass_json
 from django.core.files.uploadedfile import UploadedFile
@@ -14,3 +14,12 @@ from ..validated_response import Validatable
 class Empty(DataClassJsonMixin, Validatable):
     def validate(self):
         return
+
+    @classmethod
+    def from_json_data(cls, data: Any) -> "Empty":
+        if not isinstance(data, dict):
+            raise SchemaValidationError("Empty has an invalid type")
+        return cls()
+
+    def to_json_data(self) -> dict[str, Any]:
+        return {}
@@ -1,6 +1,6 @@
 import re
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Any, List, Optional
 
 from dataclasses_json import DataClassJsonMixin, dataclass_json
 from django.core.files.uploadedfile import UploadedFile
@@ -18,3 +18,18 @@ class GhostFileResponse(DataClassJsonMixin, Validatable):
     def validate(self):
         if self.ghost is not None:
             self.ghost.validate()
+
+    @classmethod
+    def from_json_data(cls, data: Any) -> "GhostFileResponse":
+        if not isinstance(data, dict):
+            raise SchemaValidationError("GhostFileResponse has an invalid type")
+        ghost_value = data.get("ghost")
+        if ghost_value is not None:
+            ghost_value = GhostFileResponseEntry.from_json_data(ghost_value)
+        return cls(ghost=ghost_value)
+
+    def to_json_data(self) -> dict[str, Any]:
+        ghost_value = self.ghost
+        if ghost_value is not None:
+            ghost_value = ghost_value.to_json_data()
+        return {"ghost": ghost_value}
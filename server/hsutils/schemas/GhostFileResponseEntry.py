@@ -1,6 +1,6 @@
 import re
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Any, List, Optional
 
 from dataclasses_json import DataClassJsonMixin, dataclass_json
 from django.core.files.uploadedfile import UploadedFile
@@ -65,3 +65,172 @@ class GhostFileResponseEntry(DataClassJsonMixin, Validatable):
             raise SchemaValidationError("GhostFileResponseEntry.username is null")
         if len(self.username) < 1:
             raise SchemaValidationError("GhostFileResponseEntry.username is too short")
+
+    @classmethod
+    def from_json_data(cls, data: Any) -> "GhostFileResponseEntry":
+        if not isinstance(data, dict):
+            raise SchemaValidationError("GhostFileResponseEntry has an invalid type")
+        description_value = data.get("description")
+        if description_value is None:
+            raise SchemaValidationError("GhostFileResponseEntry.description is null")
+        if not isinstance(description_value, str):
+            raise SchemaValidationError("GhostFileResponseEntry.description has an invalid type")
+        downloads_value = data.get("downloads")
+        if downloads_value is None:
+            raise SchemaValidationError("GhostFileResponseEntry.downloads is null")
+        if not isinstance(downloads_value, int) or isinstance(downloads_value, bool):
+            raise SchemaValidationError("GhostFileResponseEntry.downloads has an invalid type")
+        if downloads_value < 0:
+            raise SchemaValidationError("GhostFileResponseEntry.downloads has a value below minimum")
+        duration_value = data.get("duration")
+        if duration_value is None:
+            raise SchemaValidationError("GhostFileResponseEntry.duration is null")
+        if not isinstance(duration_value, int) or isinstance(duration_value, bool):
+            raise SchemaValidationError("GhostFileResponseEntry.duration has an invalid type")
+        if duration_value < 0:
+            raise SchemaValidationError("GhostFileResponseEntry.duration has a value below minimum")
+        finish_type_value = data.get("finish_type")
+        if finish_type_value is None:
+            raise SchemaValidationError("GhostFileResponseEntry.finish_type is null")
+        if not isinstance(finish_type_value, str):
+            raise SchemaValidationError("GhostFileResponseEntry.finish_type has an invalid type")
+        id_value = data.get("id")
+        if id_value is None:
+            raise SchemaValidationError("GhostFileResponseEntry.id is null")
+        if not isinstance(id_value, int) or isinstance(id_value, bool):
+            raise SchemaValidationError("GhostFileResponseEntry.id has an invalid type")
+        level_display_value = data.get("level_display")
+        if level_display_value is None:
+            raise SchemaValidationError("GhostFileResponseEntry.level_display is null")
+        if not isinstance(level_display_value, str):
+            raise SchemaValidationError("GhostFileResponseEntry.level_display has an invalid type")
+        if len(level_display_value) < 1:
+            raise SchemaValidationError("GhostFileResponseEntry.level_display is too short")
+        level_id_value = data.get("level_id")
+        if level_id_value is None:
+            raise SchemaValidationError("GhostFileResponseEntry.level_id is null")
+        if not isinstance(level_id_value, int) or isinstance(level_id_value, bool):
+            raise SchemaValidationError("GhostFileResponseEntry.level_id has an invalid type")
+        level_identifier_value = data.get("level_identifier")
+        if level_identifier_value is None:
+            raise SchemaValidationError("GhostFileResponseEntry.level_identifier is null")
+        if not isinstance(level_identifier_value, str):
+            raise SchemaValidationError("GhostFileResponseEntry.level_identifier has an invalid type")
+        if len(level_identifier_value) < 1:
+            raise SchemaValidationError("GhostFileResponseEntry.level_identifier is too short")
+        published_value = data.get("published")
+        if published_value is None:
+            raise SchemaValidationError("GhostFileResponseEntry.published is null")
+        if not isinstance(published_value, bool):
+            raise SchemaValidationError("GhostFileResponseEntry.published has an invalid type")
+        size_value = data.get("size")
+        if size_value is None:
+            raise SchemaValidationError("GhostFileResponseEntry.size is null")
+        if not isinstance(size_value, int) or isinstance(size_value, bool):
+            raise SchemaValidationError("GhostFileResponseEntry.size has an invalid type")
+        if size_value < 0:
+            raise SchemaValidationError("GhostFileResponseEntry.size has a value below minimum")
+        tags_value = data.get("tags")
+        if tags_value is None:
+            raise SchemaValidationError("GhostFileResponseEntry.tags is null")
+        if not isinstance(tags_value, list):
+            raise SchemaValidationError("GhostFileResponseEntry.tags has an invalid type")
+        tags_value_converted = []
+        for tags_value_entry in tags_value:
+            if tags_value_entry is None:
+                raise SchemaValidationError("GhostFileResponseEntry.tags is null")
+            tags_value_entry = Tag.from_json_data(tags_value_entry)
+            tags_value_converted.append(tags_value_entry)
+        tags_value = tags_value_converted
+        username_value = data.get("username")
+        if username_value is None:
+            raise SchemaValidationError("GhostFileResponseEntry.username is null")
+        if not isinstance(username_value, str):
+            raise SchemaValidationError("GhostFileResponseEntry.username has an invalid type")
+        if len(username_value) < 1:
+            raise SchemaValidationError("GhostFileResponseEntry.username is too short")
+        return cls(
+            description=description_value,
+            downloads=downloads_value,
+            duration=duration_value,
+            finish_type=finish_type_value,
+            id=id_value,
+            level_display=level_display_value,
+            level_id=level_id_value,
+            level_identifier=level_identifier_value,
+            published=published_value,
+            size=size_value,
+            tags=tags_value,
+            username=username_value,
+        )
+
+    def to_json_data(self) -> dict[str, Any]:
+        description_value = self.description
+        if description_value is None:
+            raise SchemaValidationError("GhostFileResponseEntry.description is null")
+        downloads_value = self.downloads
+        if downloads_value is None:
+            raise SchemaValidationError("GhostFileResponseEntry.downloads is null")
+        if downloads_value < 0:
+            raise SchemaValidationError("GhostFileResponseEntry.downloads has a value below minimum")
+        duration_value = self.duration
+        if duration_value is None:
+            raise SchemaValidationError("GhostFileResponseEntry.duration is null")
+        if duration_value < 0:
+            raise SchemaValidationError("GhostFileResponseEntry.duration has a value below minimum")
+        finish_type_value = self.finish_type
+        if finish_type_value is None:
+            raise SchemaValidationError("GhostFileResponseEntry.finish_type is null")
+        id_value = self.id
+        if id_value is None:
+            raise SchemaValidationError("GhostFileResponseEntry.id is null")
+        level_display_value = self.level_display
+        if level_display_value is None:
+            raise SchemaValidationError("GhostFileResponseEntry.level_display is null")
+        if len(level_display_value) < 1:
+            raise SchemaValidationError("GhostFileResponseEntry.level_display is too short")
+        level_id_value = self.level_id
+        if level_id_value is None:
+            raise SchemaValidationError("GhostFileResponseEntry.level_id is null")
+        level_identifier_value = self.level_identifier
+        if level_identifier_value is None:
+            raise SchemaValidationError("GhostFileResponseEntry.level_identifier is null")
+        if len(level_identifier_value) < 1:
+            raise SchemaValidationError("GhostFileResponseEntry.level_identifier is too short")
+        published_value = self.published
+        if published_value is None:
+            raise SchemaValidationError("GhostFileResponseEntry.published is null")
+        size_value = self.size
+        if size_value is None:
+            raise SchemaValidationError("GhostFileResponseEntry.size is null")
+        if size_value < 0:
+            raise SchemaValidationError("GhostFileResponseEntry.size has a value below minimum")
+        tags_value = self.tags
+        if tags_value is None:
+            raise SchemaValidationError("GhostFileResponseEntry.tags is null")
+        tags_value_converted = []
+        for tags_value_entry in tags_value:
+            if tags_value_entry is None:
+                raise SchemaValidationError("GhostFileResponseEntry.tags is null")
+            tags_value_entry = tags_value_entry.to_json_data()
+            tags_value_converted.append(tags_value_entry)
+        tags_value = tags_value_converted
+        username_value = self.username
+        if username_value is None:
+            raise SchemaValidationError("GhostFileResponseEntry.username is null")
+        if len(username_value) < 1:
+            raise SchemaValidationError("GhostFileResponseEntry.username is too short")
+        return {
+            "description": description_value,
+            "downloads": downloads_value,
+            "duration": duration_value,
+            "finish_type": finish_type_value,
+            "id": id_value,
+            "level_display": level_display_value,
+            "level_id": level_id_value,
+            "level_identifier": level_identifier_value,
+            "published": published_value,
+            "size": size_value,
+            "tags": tags_value,
+            "username": username_value,
+        }
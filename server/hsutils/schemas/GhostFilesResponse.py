@@ -1,6 +1,6 @@
 import re
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Any, List, Optional
 
 from dataclasses_json import DataClassJsonMixin, dataclass_json
 from django.core.files.uploadedfile import UploadedFile
@@ -14,9 +14,54 @@ from .GhostFileResponseEntry import GhostFileResponseEntry
 @dataclass(kw_only=True)
 class GhostFilesResponse(DataClassJsonMixin, Validatable):
     files: List[GhostFileResponseEntry]
+    next_cursor: Optional[str]
 
     def validate(self):
         if self.files is None:
             raise SchemaValidationError("GhostFilesResponse.files is null")
         for self_files_entry in self.files:
             self_files_entry.validate()
+        if self.next_cursor is not None:
+            if len(self.next_cursor) < 1:
+                raise SchemaValidationError("GhostFilesResponse.next_cursor is too short")
+
+    @classmethod
+    def from_json_data(cls, data: Any) -> "GhostFilesResponse":
+        if not isinstance(data, dict):
+            raise SchemaValidationError("GhostFilesResponse has an invalid type")
+        files_value = data.get("files")
+        if files_value is None:
+            raise SchemaValidationError("GhostFilesResponse.files is null")
+        if not isinstance(files_value, list):
+            raise SchemaValidationError("GhostFilesResponse.files has an invalid type")
+        files_value_converted = []
+        for files_value_entry in files_value:
+            if files_value_entry is None:
+                raise SchemaValidationError("GhostFilesResponse.files is null")
+            files_value_entry = GhostFileResponseEntry.from_json_data(files_value_entry)
+            files_value_converted.append(files_value_entry)
+        files_value = files_value_converted
+        next_cursor_value = data.get("next_cursor")
+        if next_cursor_value is not None:
+            if not isinstance(next_cursor_value, str):
+                raise SchemaValidationError("GhostFilesResponse.next_cursor has an invalid type")
+            if len(next_cursor_value) < 1:
+                raise SchemaValidationError("GhostFilesResponse.next_cursor is too short")
+        return cls(files=files_value, next_cursor=next_cursor_value)
+
+    def to_json_data(self) -> dict[str, Any]:
+        files_value = self.files
+        if files_value is None:
+            raise SchemaValidationError("GhostFilesResponse.files is null")
+        files_value_converted = []
+        for files_value_entry in files_value:
+            if files_value_entry is None:
+                raise SchemaValidationError("GhostFilesResponse.files is null")
+            files_value_entry = files_value_entry.to_json_data()
+            files_value_converted.append(files_value_entry)
+        files_value = files_value_converted
+        next_cursor_value = self.next_cursor
+        if next_cursor_value is not None:
+            if len(next_cursor_value) < 1:
+                raise SchemaValidationError("GhostFilesResponse.next_cursor is too short")
+        return {"files": files_value, "next_cursor": next_cursor_value}
@@ -1,6 +1,6 @@
 import re
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Any, List, Optional
 
 from dataclasses_json import DataClassJsonMixin, dataclass_json
 from django.core.files.uploadedfile import UploadedFile
@@ -30,3 +30,57 @@ class GhostInfoRequest(DataClassJsonMixin, Validatable):
             if self_tags_entry is None:
                 raise SchemaValidationError("GhostInfoRequest.tags is null")
             pass
+
+    @classmethod
+    def from_json_data(cls, data: Any) -> "GhostInfoRequest":
+        if not isinstance(data, dict):
+            raise SchemaValidationError("GhostInfoRequest has an invalid type")
+        description_value = data.get("description")
+        if description_value is None:
+            raise SchemaValidationError("GhostInfoRequest.description is null")
+        if not isinstance(description_value, str):
+            raise SchemaValidationError("GhostInfoRequest.description has an invalid type")
+        level_id_value = data.get("level_id")
+        if level_id_value is None:
+            raise SchemaValidationError("GhostInfoRequest.level_id is null")
+        if not isinstance(level_id_value, int) or isinstance(level_id_value, bool):
+            raise SchemaValidationError("GhostInfoRequest.level_id has an invalid type")
+        published_value = data.get("published")
+        if published_value is None:
+            raise SchemaValidationError("GhostInfoRequest.published is null")
+        if not isinstance(published_value, bool):
+            raise SchemaValidationError("GhostInfoRequest.published has an invalid type")
+        tags_value = data.get("tags")
+        if tags_value is None:
+            raise SchemaValidationError("GhostInfoRequest.tags is null")
+        if not isinstance(tags_value, list):
+            raise SchemaValidationError("GhostInfoRequest.tags has an invalid type")
+        for tags_value_entry in tags_value:
+            if tags_value_entry is None:
+                raise SchemaValidationError("GhostInfoRequest.tags is null")
+            if not isinstance(tags_value_entry, int) or isinstance(tags_value_entry, bool):
+                raise SchemaValidationError("GhostInfoRequest.tags has an invalid type")
+        return cls(description=description_value, level_id=level_id_value, published=published_value, tags=tags_value)
+
+    def to_json_data(self) -> dict[str, Any]:
+        description_value = self.description
+        if description_value is None:
+            raise SchemaValidationError("GhostInfoRequest.description is null")
+        level_id_value = self.level_id
+        if level_id_value is None:
+            raise SchemaValidationError("GhostInfoRequest.level_id is null")
+        published_value = self.published
+        if published_value is None:
+            raise SchemaValidationError("GhostInfoRequest.published is null")
+        tags_value = self.tags
+        if tags_value is None:
+            raise SchemaValidationError("GhostInfoRequest.tags is null")
+        for tags_value_entry in tags_value:
+            if tags_value_entry is None:
+                raise SchemaValidationError("GhostInfoRequest.tags is null")
+        return {
+            "description": description_value,
+            "level_id": level_id_value,
+            "published": published_value,
+            "tags": tags_value,
+        }
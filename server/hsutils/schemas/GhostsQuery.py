@@ -0,0 +1,132 @@
+import re
+from dataclasses import dataclass
+from typing import Any, List, Optional
+
+from dataclasses_json import DataClassJsonMixin, dataclass_json
+from django.core.files.uploadedfile import UploadedFile
+
+from ..error import SchemaValidationError
+from ..validated_response import Validatable
+
+
+@dataclass_json
+@dataclass(kw_only=True)
+class GhostsQuery(DataClassJsonMixin, Validatable):
+    cursor: Optional[str]
+    finish_type: Optional[str]
+    level_id: Optional[int]
+    limit: Optional[int]
+    tags: List[int]
+    username: Optional[str]
+
+    def validate(self):
+        if self.cursor is not None:
+            if len(self.cursor) < 1:
+                raise SchemaValidationError("GhostsQuery.cursor is too short")
+        if self.finish_type is not None:
+            if len(self.finish_type) < 1:
+                raise SchemaValidationError("GhostsQuery.finish_type is too short")
+        if self.level_id is not None:
+            pass
+        if self.limit is not None:
+            if self.limit < 1:
+                raise SchemaValidationError("GhostsQuery.limit has a value below minimum")
+            if self.limit > 100:
+                raise SchemaValidationError("GhostsQuery.limit has a value above maximum")
+        if self.tags is None:
+            raise SchemaValidationError("GhostsQuery.tags is null")
+        for self_tags_entry in self.tags:
+            if self_tags_entry is None:
+                raise SchemaValidationError("GhostsQuery.tags is null")
+            pass
+        if self.username is not None:
+            if len(self.username) < 1:
+                raise SchemaValidationError("GhostsQuery.username is too short")
+
+    @classmethod
+    def from_json_data(cls, data: Any) -> "GhostsQuery":
+        if not isinstance(data, dict):
+            raise SchemaValidationError("GhostsQuery has an invalid type")
+        cursor_value = data.get("cursor")
+        if cursor_value is not None:
+            if not isinstance(cursor_value, str):
+                raise SchemaValidationError("GhostsQuery.cursor has an invalid type")
+            if len(cursor_value) < 1:
+                raise SchemaValidationError("GhostsQuery.cursor is too short")
+        finish_type_value = data.get("finish_type")
+        if finish_type_value is not None:
+            if not isinstance(finish_type_value, str):
+                raise SchemaValidationError("GhostsQuery.finish_type has an invalid type")
+            if len(finish_type_value) < 1:
+                raise SchemaValidationError("GhostsQuery.finish_type is too short")
+        level_id_value = data.get("level_id")
+        if level_id_value is not None:
+            if not isinstance(level_id_value, int) or isinstance(level_id_value, bool):
+                raise SchemaValidationError("GhostsQuery.level_id has an invalid type")
+        limit_value = data.get("limit")
+        if limit_value is not None:
+            if not isinstance(limit_value, int) or isinstance(limit_value, bool):
+                raise SchemaValidationError("GhostsQuery.limit has an invalid type")
+            if limit_value < 1:
+                raise SchemaValidationError("GhostsQuery.limit has a value below minimum")
+            if limit_value > 100:
+                raise SchemaValidationError("GhostsQuery.limit has a value above maximum")
+        tags_value = data.get("tags")
+        if tags_value is None:
+            raise SchemaValidationError("GhostsQuery.tags is null")
+        if not isinstance(tags_value, list):
+            raise SchemaValidationError("GhostsQuery.tags has an invalid type")
+        for tags_value_entry in tags_value:
+            if tags_value_entry is None:
+                raise SchemaValidationError("GhostsQuery.tags is null")
+            if not isinstance(tags_value_entry, int) or isinstance(tags_value_entry, bool):
+                raise SchemaValidationError("GhostsQuery.tags has an invalid type")
+        username_value = data.get("username")
+        if username_value is not None:
+            if not isinstance(username_value, str):
+                raise SchemaValidationError("GhostsQuery.username has an invalid type")
+            if len(username_value) < 1:
+                raise SchemaValidationError("GhostsQuery.username is too short")
+        return cls(
+            cursor=cursor_value,
+            finish_type=finish_type_value,
+            level_id=level_id_value,
+            limit=limit_value,
+            tags=tags_value,
+            username=username_value,
+        )
+
+    def to_json_data(self) -> dict[str, Any]:
+        cursor_value = self.cursor
+        if cursor_value is not None:
+            if len(cursor_value) < 1:
+                raise SchemaValidationError("GhostsQuery.cursor is too short")
+        finish_type_value = self.finish_type
+        if finish_type_value is not None:
+            if len(finish_type_value) < 1:
+                raise SchemaValidationError("GhostsQuery.finish_type is too short")
+        level_id_value = self.level_id
+        limit_value = self.limit
+        if limit_value is not None:
+            if limit_value < 1:
+                raise SchemaValidationError("GhostsQuery.limit has a value below minimum")
+            if limit_value > 100:
+                raise SchemaValidationError("GhostsQuery.limit has a value above maximum")
+        tags_value = self.tags
+        if tags_value is None:
+            raise SchemaValidationError("GhostsQuery.tags is null")
+        for tags_value_entry in tags_value:
+            if tags_value_entry is None:
+                raise SchemaValidationError("GhostsQuery.tags is null")
+        username_value = self.username
+        if username_value is not None:
+            if len(username_value) < 1:
+                raise SchemaValidationError("GhostsQuery.username is too short")
+        return {
+            "cursor": cursor_value,
+            "finish_type": finish_type_value,
+            "level_id": level_id_value,
+            "limit": limit_value,
+            "tags": tags_value,
+            "username": username_value,
+        }
@@ -1,6 +1,6 @@
 import re
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Any, List, Optional
 
 from dataclasses_json import DataClassJsonMixin, dataclass_json
 from django.core.files.uploadedfile import UploadedFile
@@ -27,3 +27,44 @@ class LevelInfo(DataClassJsonMixin, Validatable):
             raise SchemaValidationError("LevelInfo.title is null")
         if len(self.title) < 1:
             raise SchemaValidationError("LevelInfo.title is too short")
+
+    @classmethod
+    def from_json_data(cls, data: Any) -> "LevelInfo":
+        if not isinstance(data, dict):
+            raise SchemaValidationError("LevelInfo has an invalid type")
+        id_value = data.get("id")
+        if id_value is None:
+            raise SchemaValidationError("LevelInfo.id is null")
+        if not isinstance(id_value, int) or isinstance(id_value, bool):
+            raise SchemaValidationError("LevelInfo.id has an invalid type")
+        identifier_value = data.get("identifier")
+        if identifier_value is None:
+            raise SchemaValidationError("LevelInfo.identifier is null")
+        if not isinstance(identifier_value, str):
+            raise SchemaValidationError("LevelInfo.identifier has an invalid type")
+        if len(identifier_value) < 1:
+            raise SchemaValidationError("LevelInfo.identifier is too short")
+        title_value = data.get("title")
+        if title_value is None:
+            raise SchemaValidationError("LevelInfo.title is null")
+        if not isinstance(title_value, str):
+            raise SchemaValidationError("LevelInfo.title has an invalid type")
+        if len(title_value) < 1:
+            raise SchemaValidationError("LevelInfo.title is too short")
+        return cls(id=id_value, identifier=identifier_value, title=title_value)
+
+    def to_json_data(self) -> dict[str, Any]:
+        id_value = self.id
+        if id_value is None:
+            raise SchemaValidationError("LevelInfo.id is null")
+        identifier_value = self.identifier
+        if identifier_value is None:
+            raise SchemaValidationError("LevelInfo.identifier is null")
+        if len(identifier_value) < 1:
+            raise SchemaValidationError("LevelInfo.identifier is too short")
+        title_value = self.title
+        if title_value is None:
+            raise SchemaValidationError("LevelInfo.title is null")
+        if len(title_value) < 1:
+            raise SchemaValidationError("LevelInfo.title is too short")
+        return {"id": id_value, "identifier": identifier_value, "title": title_value}
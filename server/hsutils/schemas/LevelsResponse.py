@@ -1,6 +1,6 @@
 import re
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Any, List, Optional
 
 from dataclasses_json import DataClassJsonMixin, dataclass_json
 from django.core.files.uploadedfile import UploadedFile
@@ -20,3 +20,34 @@ class LevelsResponse(DataClassJsonMixin, Validatable):
             raise SchemaValidationError("LevelsResponse.levels is null")
         for self_levels_entry in self.levels:
             self_levels_entry.validate()
+
+    @classmethod
+    def from_json_data(cls, data: Any) -> "LevelsResponse":
+        if not isinstance(data, dict):
+            raise SchemaValidationError("LevelsResponse has an invalid type")
+        levels_value = data.get("levels")
+        if levels_value is None:
+            raise SchemaValidationError("LevelsResponse.levels is null")
+        if not isinstance(levels_value, list):
+            raise SchemaValidationError("LevelsResponse.levels has an invalid type")
+        levels_value_converted = []
+        for levels_value_entry in levels_value:
+            if levels_value_entry is None:
+                raise SchemaValidationError("LevelsResponse.levels is null")
+            levels_value_entry = LevelInfo.from_json_data(levels_value_entry)
+            levels_value_converted.append(levels_value_entry)
+        levels_value = levels_value_converted
+        return cls(levels=levels_value)
+
+    def to_json_data(self) -> dict[str, Any]:
+        levels_value = self.levels
+        if levels_value is None:
+            raise SchemaValidationError("LevelsResponse.levels is null")
+        levels_value_converted = []
+        for levels_value_entry in levels_value:
+            if levels_value_entry is None:
+                raise SchemaValidationError("LevelsResponse.levels is null")
+            levels_value_entry = levels_value_entry.to_json_data()
+            levels_value_converted.append(levels_value_entry)
+        levels_value = levels_value_converted
+        return {"levels": levels_value}
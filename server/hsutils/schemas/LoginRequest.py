@@ -1,6 +1,6 @@
 import re
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Any, List, Optional
 
 from dataclasses_json import DataClassJsonMixin, dataclass_json
 from django.core.files.uploadedfile import UploadedFile
@@ -24,3 +24,36 @@ class LoginRequest(DataClassJsonMixin, Validatable):
             raise SchemaValidationError("LoginRequest.username is null")
         if len(self.username) < 1:
             raise SchemaValidationError("LoginRequest.username is too short")
+
+    @classmethod
+    def from_json_data(cls, data: Any) -> "LoginRequest":
+        if not isinstance(data, dict):
+            raise SchemaValidationError("LoginRequest has an invalid type")
+        password_value = data.get("password")
+        if password_value is None:
+            raise SchemaValidationError("LoginRequest.password is null")
+        if not isinstance(password_value, str):
+            raise SchemaValidationError("LoginRequest.password has an invalid type")
+        if len(password_value) < 1:
+            raise SchemaValidationError("LoginRequest.password is too short")
+        username_value = data.get("username")
+        if username_value is None:
+            raise SchemaValidationError("LoginRequest.username is null")
+        if not isinstance(username_value, str):
+            raise SchemaValidationError("LoginRequest.username has an invalid type")
+        if len(username_value) < 1:
+            raise SchemaValidationError("LoginRequest.username is too short")
+        return cls(password=password_value, username=username_value)
+
+    def to_json_data(self) -> dict[str, Any]:
+        password_value = self.password
+        if password_value is None:
+            raise SchemaValidationError("LoginRequest.password is null")
+        if len(password_value) < 1:
+            raise SchemaValidationError("LoginRequest.password is too short")
+        username_value = self.username
+        if username_value is None:
+            raise SchemaValidationError("LoginRequest.username is null")
+        if len(username_value) < 1:
+            raise SchemaValidationError("LoginRequest.username is too short")
+        return {"password": password_value, "username": username_value}
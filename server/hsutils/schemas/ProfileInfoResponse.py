@@ -1,6 +1,6 @@
 import re
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Any, List, Optional
 
 from dataclasses_json import DataClassJsonMixin, dataclass_json
 from django.core.files.uploadedfile import UploadedFile
@@ -33,3 +33,72 @@ class ProfileInfoResponse(DataClassJsonMixin, Validatable):
             raise SchemaValidationError("ProfileInfoResponse.username is null")
         if len(self.username) < 1:
             raise SchemaValidationError("ProfileInfoResponse.username is too short")
+
+    @classmethod
+    def from_json_data(cls, data: Any) -> "ProfileInfoResponse":
+        if not isinstance(data, dict):
+            raise SchemaValidationError("ProfileInfoResponse has an invalid type")
+        auth_token_value = data.get("auth_token")
+        if auth_token_value is not None:
+            if not isinstance(auth_token_value, str):
+                raise SchemaValidationError("ProfileInfoResponse.auth_token has an invalid type")
+            if len(auth_token_value) < 1:
+                raise SchemaValidationError("ProfileInfoResponse.auth_token is too short")
+        authenticated_value = data.get("authenticated")
+        if authenticated_value is None:
+            raise SchemaValidationError("ProfileInfoResponse.authenticated is null")
+        if not isinstance(authenticated_value, bool):
+            raise SchemaValidationError("ProfileInfoResponse.authenticated has an invalid type")
+        email_value = data.get("email")
+        if email_value is not None:
+            if not isinstance(email_value, str):
+                raise SchemaValidationError("ProfileInfoResponse.email has an invalid type")
+            if len(email_value) < 1:
+                raise SchemaValidationError("ProfileInfoResponse.email is too short")
+        is_staff_value = data.get("is_staff")
+        if is_staff_value is None:
+            raise SchemaValidationError("ProfileInfoResponse.is_staff is null")
+        if not isinstance(is_staff_value, bool):
+            raise SchemaValidationError("ProfileInfoResponse.is_staff has an invalid type")
+        username_value = data.get("username")
+        if username_value is None:
+            raise SchemaValidationError("ProfileInfoResponse.username is null")
+        if not isinstance(username_value, str):
+            raise SchemaValidationError("ProfileInfoResponse.username has an invalid type")
+        if len(username_value) < 1:
+            raise SchemaValidationError("ProfileInfoResponse.username is too short")
+        return cls(
+            auth_token=auth_token_value,
+            authenticated=authenticated_value,
+            email=email_value,
+            is_staff=is_staff_value,
+            username=username_value,
+        )
+
+    def to_json_data(self) -> dict[str, Any]:
+        auth_token_value = self.auth_token
+        if auth_token_value is not None:
+            if len(auth_token_value) < 1:
+                raise SchemaValidationError("ProfileInfoResponse.auth_token is too short")
+        authenticated_value = self.authenticated
+        if authenticated_value is None:
+            raise SchemaValidationError("ProfileInfoResponse.authenticated is null")
+        email_value = self.email
+        if email_value is not None:
+            if len(email_value) < 1:
+                raise SchemaValidationError("ProfileInfoResponse.email is too short")
+        is_staff_value = self.is_staff
+        if is_staff_value is None:
+            raise SchemaValidationError("ProfileInfoResponse.is_staff is null")
+        username_value = self.username
+        if username_value is None:
+            raise SchemaValidationError("ProfileInfoResponse.username is null")
+        if len(username_value) < 1:
+            raise SchemaValidationError("ProfileInfoResponse.username is too short")
+        return {
+            "auth_token": auth_token_value,
+            "authenticated": authenticated_value,
+            "email": email_value,
+            "is_staff": is_staff_value,
+            "username": username_value,
+        }
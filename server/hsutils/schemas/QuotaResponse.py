@@ -1,6 +1,6 @@
 import re
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Any, List, Optional
 
 from dataclasses_json import DataClassJsonMixin, dataclass_json
 from django.core.files.uploadedfile import UploadedFile
@@ -24,3 +24,36 @@ class QuotaResponse(DataClassJsonMixin, Validatable):
             raise SchemaValidationError("QuotaResponse.max is null")
         if self.max < 0:
             raise SchemaValidationError("QuotaResponse.max has a value below minimum")
+
+    @classmethod
+    def from_json_data(cls, data: Any) -> "QuotaResponse":
+        if not isinstance(data, dict):
+            raise SchemaValidationError("QuotaResponse has an invalid type")
+        current_value = data.get("current")
+        if current_value is None:
+            raise SchemaValidationError("QuotaResponse.current is null")
+        if not isinstance(current_value, int) or isinstance(current_value, bool):
+            raise SchemaValidationError("QuotaResponse.current has an invalid type")
+        if current_value < 0:
+            raise SchemaValidationError("QuotaResponse.current has a value below minimum")
+        max_value = data.get("max")
+        if max_value is None:
+            raise SchemaValidationError("QuotaResponse.max is null")
+        if not isinstance(max_value, int) or isinstance(max_value, bool):
+            raise SchemaValidationError("QuotaResponse.max has an invalid type")
+        if max_value < 0:
+            raise SchemaValidationError("QuotaResponse.max has a value below minimum")
+        return cls(current=current_value, max=max_value)
+
+    def to_json_data(self) -> dict[str, Any]:
+        current_value = self.current
+        if current_value is None:
+            raise SchemaValidationError("QuotaResponse.current is null")
+        if current_value < 0:
+            raise SchemaValidationError("QuotaResponse.current has a value below minimum")
+        max_value = self.max
+        if max_value is None:
+            raise SchemaValidationError("QuotaResponse.max is null")
+        if max_value < 0:
+            raise SchemaValidationError("QuotaResponse.max has a value below minimum")
+        return {"current": current_value, "max": max_value}
@@ -1,6 +1,6 @@
 import re
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Any, List, Optional
 
 from dataclasses_json import DataClassJsonMixin, dataclass_json
 from django.core.files.uploadedfile import UploadedFile
@@ -29,3 +29,48 @@ class RegisterRequest(DataClassJsonMixin, Validatable):
             raise SchemaValidationError("RegisterRequest.username is null")
         if len(self.username) < 1:
             raise SchemaValidationError("RegisterRequest.username is too short")
+
+    @classmethod
+    def from_json_data(cls, data: Any) -> "RegisterRequest":
+        if not isinstance(data, dict):
+            raise SchemaValidationError("RegisterRequest has an invalid type")
+        email_value = data.get("email")
+        if email_value is None:
+            raise SchemaValidationError("RegisterRequest.email is null")
+        if not isinstance(email_value, str):
+            raise SchemaValidationError("RegisterRequest.email has an invalid type")
+        if len(email_value) < 1:
+            raise SchemaValidationError("RegisterRequest.email is too short")
+        password_value = data.get("password")
+        if password_value is None:
+            raise SchemaValidationError("RegisterRequest.password is null")
+        if not isinstance(password_value, str):
+            raise SchemaValidationError("RegisterRequest.password has an invalid type")
+        if len(password_value) < 1:
+            raise SchemaValidationError("RegisterRequest.password is too short")
+        username_value = data.get("username")
+        if username_value is None:
+            raise SchemaValidationError("RegisterRequest.username is null")
+        if not isinstance(username_value, str):
+            raise SchemaValidationError("RegisterRequest.username has an invalid type")
+        if len(username_value) < 1:
+            raise SchemaValidationError("RegisterRequest.username is too short")
+        return cls(email=email_value, password=password_value, username=username_value)
+
+    def to_json_data(self) -> dict[str, Any]:
+        email_value = self.email
+        if email_value is None:
+            raise SchemaValidationError("RegisterRequest.email is null")
+        if len(email_value) < 1:
+            raise SchemaValidationError("RegisterRequest.email is too short")
+        password_value = self.password
+        if password_value is None:
+            raise SchemaValidationError("RegisterRequest.password is null")
+        if len(password_value) < 1:
+            raise SchemaValidationError("RegisterRequest.password is too short")
+        username_value = self.username
+        if username_value is None:
+            raise SchemaValidationError("RegisterRequest.username is null")
+        if len(username_value) < 1:
+            raise SchemaValidationError("RegisterRequest.username is too short")
+        return {"email": email_value, "password": password_value, "username": username_value}
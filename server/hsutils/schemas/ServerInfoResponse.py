@@ -1,6 +1,6 @@
 import re
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Any, List, Optional
 
 from dataclasses_json import DataClassJsonMixin, dataclass_json
 from django.core.files.uploadedfile import UploadedFile
@@ -39,3 +39,84 @@ class ServerInfoResponse(DataClassJsonMixin, Validatable):
             raise SchemaValidationError("ServerInfoResponse.total_users is null")
         if self.total_users < 0:
             raise SchemaValidationError("ServerInfoResponse.total_users has a value below minimum")
+
+    @classmethod
+    def from_json_data(cls, data: Any) -> "ServerInfoResponse":
+        if not isinstance(data, dict):
+            raise SchemaValidationError("ServerInfoResponse has an invalid type")
+        coop_url_value = data.get("coop_url")
+        if coop_url_value is None:
+            raise SchemaValidationError("ServerInfoResponse.coop_url is null")
+        if not isinstance(coop_url_value, str):
+            raise SchemaValidationError("ServerInfoResponse.coop_url has an invalid type")
+        if len(coop_url_value) < 1:
+            raise SchemaValidationError("ServerInfoResponse.coop_url is too short")
+        total_ghost_duration_value = data.get("total_ghost_duration")
+        if total_ghost_duration_value is None:
+            raise SchemaValidationError("ServerInfoResponse.total_ghost_duration is null")
+        if not isinstance(total_ghost_duration_value, int) or isinstance(total_ghost_duration_value, bool):
+            raise SchemaValidationError("ServerInfoResponse.total_ghost_duration has an invalid type")
+        if total_ghost_duration_value < 0:
+            raise SchemaValidationError("ServerInfoResponse.total_ghost_duration has a value below minimum")
+        total_ghosts_value = data.get("total_ghosts")
+        if total_ghosts_value is None:
+            raise SchemaValidationError("ServerInfoResponse.total_ghosts is null")
+        if not isinstance(total_ghosts_value, int) or isinstance(total_ghosts_value, bool):
+            raise SchemaValidationError("ServerInfoResponse.total_ghosts has an invalid type")
+        if total_ghosts_value < 0:
+            raise SchemaValidationError("ServerInfoResponse.total_ghosts has a value below minimum")
+        total_sessions_value = data.get("total_sessions")
+        if total_sessions_value is None:
+            raise SchemaValidationError("ServerInfoResponse.total_sessions is null")
+        if not isinstance(total_sessions_value, int) or isinstance(total_sessions_value, bool):
+            raise SchemaValidationError("ServerInfoResponse.total_sessions has an invalid type")
+        if total_sessions_value < 0:
+            raise SchemaValidationError("ServerInfoResponse.total_sessions has a value below minimum")
+        total_users_value = data.get("total_users")
+        if total_users_value is None:
+            raise SchemaValidationError("ServerInfoResponse.total_users is null")
+        if not isinstance(total_users_value, int) or isinstance(total_users_value, bool):
+            raise SchemaValidationError("ServerInfoResponse.total_users has an invalid type")
+        if total_users_value < 0:
+            raise SchemaValidationError("ServerInfoResponse.total_users has a value below minimum")
+        return cls(
+            coop_url=coop_url_value,
+            total_ghost_duration=total_ghost_duration_value,
+            total_ghosts=total_ghosts_value,
+            total_sessions=total_sessions_value,
+            total_users=total_users_value,
+        )
+
+    def to_json_data(self) -> dict[str, Any]:
+        coop_url_value = self.coop_url
+        if coop_url_value is None:
+            raise SchemaValidationError("ServerInfoResponse.coop_url is null")
+        if len(coop_url_value) < 1:
+            raise SchemaValidationError("ServerInfoResponse.coop_url is too short")
+        total_ghost_duration_value = self.total_ghost_duration
+        if total_ghost_duration_value is None:
+            raise SchemaValidationError("ServerInfoResponse.total_ghost_duration is null")
+        if total_ghost_duration_value < 0:
+            raise SchemaValidationError("ServerInfoResponse.total_ghost_duration has a value below minimum")
+        total_ghosts_value = self.total_ghosts
+        if total_ghosts_value is None:
+            raise SchemaValidationError("ServerInfoResponse.total_ghosts is null")
+        if total_ghosts_value < 0:
+            raise SchemaValidationError("ServerInfoResponse.total_ghosts has a value below minimum")
+        total_sessions_value = self.total_sessions
+        if total_sessions_value is None:
+            raise SchemaValidationError("ServerInfoResponse.total_sessions is null")
+        if total_sessions_value < 0:
+            raise SchemaValidationError("ServerInfoResponse.total_sessions has a value below minimum")
+        total_users_value = self.total_users
+        if total_users_value is None:
+            raise SchemaValidationError("ServerInfoResponse.total_users is null")
+        if total_users_value < 0:
+            raise SchemaValidationError("ServerInfoResponse.total_users has a value below minimum")
+        return {
+            "coop_url": coop_url_value,
+            "total_ghost_duration": total_ghost_duration_value,
+            "total_ghosts": total_ghosts_value,
+            "total_sessions": total_sessions_value,
+            "total_users": total_users_value,
+        }
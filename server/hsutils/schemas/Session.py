@@ -1,6 +1,6 @@
 import re
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Any, List, Optional
 
 from dataclasses_json import DataClassJsonMixin, dataclass_json
 from django.core.files.uploadedfile import UploadedFile
@@ -48,3 +48,116 @@ class Session(DataClassJsonMixin, Validatable):
             self_tags_entry.validate()
         if self.time is not None:
             self.time.validate()
+
+    @classmethod
+    def from_json_data(cls, data: Any) -> "Session":
+        if not isinstance(data, dict):
+            raise SchemaValidationError("Session has an invalid type")
+        description_value = data.get("description")
+        if description_value is None:
+            raise SchemaValidationError("Session.description is null")
+        if not isinstance(description_value, str):
+            raise SchemaValidationError("Session.description has an invalid type")
+        id_value = data.get("id")
+        if id_value is None:
+            raise SchemaValidationError("Session.id is null")
+        if not isinstance(id_value, str):
+            raise SchemaValidationError("Session.id has an invalid type")
+        if len(id_value) < 1:
+            raise SchemaValidationError("Session.id is too short")
+        owner_value = data.get("owner")
+        if owner_value is None:
+            raise SchemaValidationError("Session.owner is null")
+        if not isinstance(owner_value, str):
+            raise SchemaValidationError("Session.owner has an invalid type")
+        if len(owner_value) < 1:
+            raise SchemaValidationError("Session.owner is too short")
+        players_value = data.get("players")
+        if players_value is None:
+            raise SchemaValidationError("Session.players is null")
+        if not isinstance(players_value, list):
+            raise SchemaValidationError("Session.players has an invalid type")
+        for players_value_entry in players_value:
+            if players_value_entry is None:
+                raise SchemaValidationError("Session.players is null")
+            if not isinstance(players_value_entry, str):
+                raise SchemaValidationError("Session.players has an invalid type")
+            if len(players_value_entry) < 1:
+                raise SchemaValidationError("Session.players is too short")
+        private_value = data.get("private")
+        if private_value is None:
+            raise SchemaValidationError("Session.private is null")
+        if not isinstance(private_value, bool):
+            raise SchemaValidationError("Session.private has an invalid type")
+        tags_value = data.get("tags")
+        if tags_value is None:
+            raise SchemaValidationError("Session.tags is null")
+        if not isinstance(tags_value, list):
+            raise SchemaValidationError("Session.tags has an invalid type")
+        tags_value_converted = []
+        for tags_value_entry in tags_value:
+            if tags_value_entry is None:
+                raise SchemaValidationError("Session.tags is null")
+            tags_value_entry = Tag.from_json_data(tags_value_entry)
+            tags_value_converted.append(tags_value_entry)
+        tags_value = tags_value_converted
+        time_value = data.get("time")
+        if time_value is not None:
+            time_value = TimeSpan.from_json_data(time_value)
+        return cls(
+            description=description_value,
+            id=id_value,
+            owner=owner_value,
+            players=players_value,
+            private=private_value,
+            tags=tags_value,
+            time=time_value,
+        )
+
+    def to_json_data(self) -> dict[str, Any]:
+        description_value = self.description
+        if description_value is None:
+            raise SchemaValidationError("Session.description is null")
+        id_value = self.id
+        if id_value is None:
+            raise SchemaValidationError("Session.id is null")
+        if len(id_value) < 1:
+            raise SchemaValidationError("Session.id is too short")
+        owner_value = self.owner
+        if owner_value is None:
+            raise SchemaValidationError("Session.owner is null")
+        if len(owner_value) < 1:
+            raise SchemaValidationError("Session.owner is too short")
+        players_value = self.players
+        if players_value is None:
+            raise SchemaValidationError("Session.players is null")
+        for players_value_entry in players_value:
+            if players_value_entry is None:
+                raise SchemaValidationError("Session.players is null")
+            if len(players_value_entry) < 1:
+                raise SchemaValidationError("Session.players is too short")
+        private_value = self.private
+        if private_value is None:
+            raise SchemaValidationError("Session.private is null")
+        tags_value = self.tags
+        if tags_value is None:
+            raise SchemaValidationError("Session.tags is null")
+        tags_value_converted = []
+        for tags_value_entry in tags_value:
+            if tags_value_entry is None:
+                raise SchemaValidationError("Session.tags is null")
+            tags_value_entry = tags_value_entry.to_json_data()
+            tags_value_converted.append(tags_value_entry)
+        tags_value = tags_value_converted
+        time_value = self.time
+        if time_value is not None:
+            time_value = time_value.to_json_data()
+        return {
+            "description": description_value,
+            "id": id_value,
+            "owner": owner_value,
+            "players": players_value,
+            "private": private_value,
+            "tags": tags_value,
+            "time": time_value,
+        }
@@ -0,0 +1,76 @@
+import re
+from dataclasses import dataclass
+from typing import Any, List, Optional
+
+from dataclasses_json import DataClassJsonMixin, dataclass_json
+from django.core.files.uploadedfile import UploadedFile
+
+from ..error import SchemaValidationError
+from ..validated_response import Validatable
+
+
+@dataclass_json
+@dataclass(kw_only=True)
+class SessionAccessEntry(DataClassJsonMixin, Validatable):
+    auth_token: str
+    session_id: str
+    username: str
+
+    def validate(self):
+        if self.auth_token is None:
+            raise SchemaValidationError("SessionAccessEntry.auth_token is null")
+        if len(self.auth_token) < 1:
+            raise SchemaValidationError("SessionAccessEntry.auth_token is too short")
+        if self.session_id is None:
+            raise SchemaValidationError("SessionAccessEntry.session_id is null")
+        if len(self.session_id) < 1:
+            raise SchemaValidationError("SessionAccessEntry.session_id is too short")
+        if self.username is None:
+            raise SchemaValidationError("SessionAccessEntry.username is null")
+        if len(self.username) < 1:
+            raise SchemaValidationError("SessionAccessEntry.username is too short")
+
+    @classmethod
+    def from_json_data(cls, data: Any) -> "SessionAccessEntry":
+        if not isinstance(data, dict):
+            raise SchemaValidationError("SessionAccessEntry has an invalid type")
+        auth_token_value = data.get("auth_token")
+        if auth_token_value is None:
+            raise SchemaValidationError("SessionAccessEntry.auth_token is null")
+        if not isinstance(auth_token_value, str):
+            raise SchemaValidationError("SessionAccessEntry.auth_token has an invalid type")
+        if len(auth_token_value) < 1:
+            raise SchemaValidationError("SessionAccessEntry.auth_token is too short")
+        session_id_value = data.get("session_id")
+        if session_id_value is None:
+            raise SchemaValidationError("SessionAccessEntry.session_id is null")
+        if not isinstance(session_id_value, str):
+            raise SchemaValidationError("SessionAccessEntry.session_id has an invalid type")
+        if len(session_id_value) < 1:
+            raise SchemaValidationError("SessionAccessEntry.session_id is too short")
+        username_value = data.get("username")
+        if username_value is None:
+            raise SchemaValidationError("SessionAccessEntry.username is null")
+        if not isinstance(username_value, str):
+            raise SchemaValidationError("SessionAccessEntry.username has an invalid type")
+        if len(username_value) < 1:
+            raise SchemaValidationError("SessionAccessEntry.username is too short")
+        return cls(auth_token=auth_token_value, session_id=session_id_value, username=username_value)
+
+    def to_json_data(self) -> dict[str, Any]:
+        auth_token_value = self.auth_token
+        if auth_token_value is None:
+            raise SchemaValidationError("SessionAccessEntry.auth_token is null")
+        if len(auth_token_value) < 1:
+            raise SchemaValidationError("SessionAccessEntry.auth_token is too short")
+        session_id_value = self.session_id
+        if session_id_value is None:
+            raise SchemaValidationError("SessionAccessEntry.session_id is null")
+        if len(session_id_value) < 1:
+            raise SchemaValidationError("SessionAccessEntry.session_id is too short")
+        username_value = self.username
+        if username_value is None:
+            raise SchemaValidationError("SessionAccessEntry.username is null")
+        if len(username_value) < 1:
+            raise SchemaValidationError("SessionAccessEntry.username is too short")
+        return {"auth_token": auth_token_value, "session_id": session_id_value, "username": username_value}
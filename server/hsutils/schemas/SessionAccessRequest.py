@@ -1,6 +1,6 @@
 import re
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Any, List, Optional
 
 from dataclasses_json import DataClassJsonMixin, dataclass_json
 from django.core.files.uploadedfile import UploadedFile
@@ -34,3 +34,67 @@ class SessionAccessRequest(DataClassJsonMixin, Validatable):
             raise SchemaValidationError("SessionAccessRequest.username is null")
         if len(self.username) < 1:
             raise SchemaValidationError("SessionAccessRequest.username is too short")
+
+    @classmethod
+    def from_json_data(cls, data: Any) -> "SessionAccessRequest":
+        if not isinstance(data, dict):
+            raise SchemaValidationError("SessionAccessRequest has an invalid type")
+        api_key_value = data.get("api_key")
+        if api_key_value is None:
+            raise SchemaValidationError("SessionAccessRequest.api_key is null")
+        if not isinstance(api_key_value, str):
+            raise SchemaValidationError("SessionAccessRequest.api_key has an invalid type")
+        if len(api_key_value) < 1:
+            raise SchemaValidationError("SessionAccessRequest.api_key is too short")
+        auth_token_value = data.get("auth_token")
+        if auth_token_value is None:
+            raise SchemaValidationError("SessionAccessRequest.auth_token is null")
+        if not isinstance(auth_token_value, str):
+            raise SchemaValidationError("SessionAccessRequest.auth_token has an invalid type")
+        if len(auth_token_value) < 1:
+            raise SchemaValidationError("SessionAccessRequest.auth_token is too short")
+        session_id_value = data.get("session_id")
+        if session_id_value is None:
+            raise SchemaValidationError("SessionAccessRequest.session_id is null")
+        if not isinstance(session_id_value, str):
+            raise SchemaValidationError("SessionAccessRequest.session_id has an invalid type")
+        if len(session_id_value) < 1:
+            raise SchemaValidationError("SessionAccessRequest.session_id is too short")
+        username_value = data.get("username")
+        if username_value is None:
+            raise SchemaValidationError("SessionAccessRequest.username is null")
+        if not isinstance(username_value, str):
+            raise SchemaValidationError("SessionAccessRequest.username has an invalid type")
+        if len(username_value) < 1:
+            raise SchemaValidationError("SessionAccessRequest.username is too short")
+        return cls(
+            api_key=api_key_value, auth_token=auth_token_value, session_id=session_id_value, username=username_value
+        )
+
+    def to_json_data(self) -> dict[str, Any]:
+        api_key_value = self.api_key
+        if api_key_value is None:
+            raise SchemaValidationError("SessionAccessRequest.api_key is null")
+        if len(api_key_value) < 1:
+            raise SchemaValidationError("SessionAccessRequest.api_key is too short")
+        auth_token_value = self.auth_token
+        if auth_token_value is None:
+            raise SchemaValidationError("SessionAccessRequest.auth_token is null")
+        if len(auth_token_value) < 1:
+            raise SchemaValidationError("SessionAccessRequest.auth_token is too short")
+        session_id_value = self.session_id
+        if session_id_value is None:
+            raise SchemaValidationError("SessionAccessRequest.session_id is null")
+        if len(session_id_value) < 1:
+            raise SchemaValidationError("SessionAccessRequest.session_id is too short")
+        username_value = self.username
+        if username_value is None:
+            raise SchemaValidationError("SessionAccessRequest.username is null")
+        if len(username_value) < 1:
+            raise SchemaValidationError("SessionAccessRequest.username is too short")
+        return {
+            "api_key": api_key_value,
+            "auth_token": auth_token_value,
+            "session_id": session_id_value,
+            "username": username_value,
+        }
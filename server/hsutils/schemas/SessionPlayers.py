@@ -1,6 +1,6 @@
 import re
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Any, List, Optional
 
 from dataclasses_json import DataClassJsonMixin, dataclass_json
 from django.core.files.uploadedfile import UploadedFile
@@ -27,3 +27,44 @@ class SessionPlayers(DataClassJsonMixin, Validatable):
                 raise SchemaValidationError("SessionPlayers.usernames is null")
             if len(self_usernames_entry) < 1:
                 raise SchemaValidationError("SessionPlayers.usernames is too short")
+
+    @classmethod
+    def from_json_data(cls, data: Any) -> "SessionPlayers":
+        if not isinstance(data, dict):
+            raise SchemaValidationError("SessionPlayers has an invalid type")
+        session_id_value = data.get("session_id")
+        if session_id_value is None:
+            raise SchemaValidationError("SessionPlayers.session_id is null")
+        if not isinstance(session_id_value, str):
+            raise SchemaValidationError("SessionPlayers.session_id has an invalid type")
+        if len(session_id_value) < 1:
+            raise SchemaValidationError("SessionPlayers.session_id is too short")
+        usernames_value = data.get("usernames")
+        if usernames_value is None:
+            raise SchemaValidationError("SessionPlayers.usernames is null")
+        if not isinstance(usernames_value, list):
+            raise SchemaValidationError("SessionPlayers.usernames has an invalid type")
+        for usernames_value_entry in usernames_value:
+            if usernames_value_entry is None:
+                raise SchemaValidationError("SessionPlayers.usernames is null")
+            if not isinstance(usernames_value_entry, str):
+                raise SchemaValidationError("SessionPlayers.usernames has an invalid type")
+            if len(usernames_value_entry) < 1:
+                raise SchemaValidationError("SessionPlayers.usernames is too short")
+        return cls(session_id=session_id_value, usernames=usernames_value)
+
+    def to_json_data(self) -> dict[str, Any]:
+        session_id_value = self.session_id
+        if session_id_value is None:
+            raise SchemaValidationError("SessionPlayers.session_id is null")
+        if len(session_id_value) < 1:
+            raise SchemaValidationError("SessionPlayers.session_id is too short")
+        usernames_value = self.usernames
+        if usernames_value is None:
+            raise SchemaValidationError("SessionPlayers.usernames is null")
+        for usernames_value_entry in usernames_value:
+            if usernames_value_entry is None:
+                raise SchemaValidationError("SessionPlayers.usernames is null")
+            if len(usernames_value_entry) < 1:
+                raise SchemaValidationError("SessionPlayers.usernames is too short")
+        return {"session_id": session_id_value, "usernames": usernames_value}
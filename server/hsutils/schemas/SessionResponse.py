@@ -1,6 +1,6 @@
 import re
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Any, List, Optional
 
 from dataclasses_json import DataClassJsonMixin, dataclass_json
 from django.core.files.uploadedfile import UploadedFile
@@ -18,3 +18,18 @@ class SessionResponse(DataClassJsonMixin, Validatable):
     def validate(self):
         if self.session is not None:
             self.session.validate()
+
+    @classmethod
+    def from_json_data(cls, data: Any) -> "SessionResponse":
+        if not isinstance(data, dict):
+            raise SchemaValidationError("SessionResponse has an invalid type")
+        session_value = data.get("session")
+        if session_value is not None:
+            session_value = Session.from_json_data(session_value)
+        return cls(session=session_value)
+
+    def to_json_data(self) -> dict[str, Any]:
+        session_value = self.session
+        if session_value is not None:
+            session_value = session_value.to_json_data()
+        return {"session": session_value}
@@ -1,6 +1,6 @@
 import re
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Any, List, Optional
 
 from dataclasses_json import DataClassJsonMixin, dataclass_json
 from django.core.files.uploadedfile import UploadedFile
@@ -25,3 +25,46 @@ class SessionsPlayersRequest(DataClassJsonMixin, Validatable):
             raise SchemaValidationError("SessionsPlayersRequest.sessions is null")
         for self_sessions_entry in self.sessions:
             self_sessions_entry.validate()
+
+    @classmethod
+    def from_json_data(cls, data: Any) -> "SessionsPlayersRequest":
+        if not isinstance(data, dict):
+            raise SchemaValidationError("SessionsPlayersRequest has an invalid type")
+        api_key_value = data.get("api_key")
+        if api_key_value is None:
+            raise SchemaValidationError("SessionsPlayersRequest.api_key is null")
+        if not isinstance(api_key_value, str):
+            raise SchemaValidationError("SessionsPlayersRequest.api_key has an invalid type")
+        if len(api_key_value) < 1:
+            raise SchemaValidationError("SessionsPlayersRequest.api_key is too short")
+        sessions_value = data.get("sessions")
+        if sessions_value is None:
+            raise SchemaValidationError("SessionsPlayersRequest.sessions is null")
+        if not isinstance(sessions_value, list):
+            raise SchemaValidationError("SessionsPlayersRequest.sessions has an invalid type")
+        sessions_value_converted = []
+        for sessions_value_entry in sessions_value:
+            if sessions_value_entry is None:
+                raise SchemaValidationError("SessionsPlayersRequest.sessions is null")
+            sessions_value_entry = SessionPlayers.from_json_data(sessions_value_entry)
+            sessions_value_converted.append(sessions_value_entry)
+        sessions_value = sessions_value_converted
+        return cls(api_key=api_key_value, sessions=sessions_value)
+
+    def to_json_data(self) -> dict[str, Any]:
+        api_key_value = self.api_key
+        if api_key_value is None:
+            raise SchemaValidationError("SessionsPlayersRequest.api_key is null")
+        if len(api_key_value) < 1:
+            raise SchemaValidationError("SessionsPlayersRequest.api_key is too short")
+        sessions_value = self.sessions
+        if sessions_value is None:
+            raise SchemaValidationError("SessionsPlayersRequest.sessions is null")
+        sessions_value_converted = []
+        for sessions_value_entry in sessions_value:
+            if sessions_value_entry is None:
+                raise SchemaValidationError("SessionsPlayersRequest.sessions is null")
+            sessions_value_entry = sessions_value_entry.to_json_data()
+            sessions_value_converted.append(sessions_value_entry)
+        sessions_value = sessions_value_converted
+        return {"api_key": api_key_value, "sessions": sessions_value}
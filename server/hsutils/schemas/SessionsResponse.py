@@ -1,6 +1,6 @@
 import re
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Any, List, Optional
 
 from dataclasses_json import DataClassJsonMixin, dataclass_json
 from django.core.files.uploadedfile import UploadedFile
@@ -20,3 +20,34 @@ class SessionsResponse(DataClassJsonMixin, Validatable):
             raise SchemaValidationError("SessionsResponse.sessions is null")
         for self_sessions_entry in self.sessions:
             self_sessions_entry.validate()
+
+    @classmethod
+    def from_json_data(cls, data: Any) -> "SessionsResponse":
+        if not isinstance(data, dict):
+            raise SchemaValidationError("SessionsResponse has an invalid type")
+        sessions_value = data.get("sessions")
+        if sessions_value is None:
+            raise SchemaValidationError("SessionsResponse.sessions is null")
+        if not isinstance(sessions_value, list):
+            raise SchemaValidationError("SessionsResponse.sessions has an invalid type")
+        sessions_value_converted = []
+        for sessions_value_entry in sessions_value:
+            if sessions_value_entry is None:
+                raise SchemaValidationError("SessionsResponse.sessions is null")
+            sessions_value_entry = Session.from_json_data(sessions_value_entry)
+            sessions_value_converted.append(sessions_value_entry)
+        sessions_value = sessions_value_converted
+        return cls(sessions=sessions_value)
+
+    def to_json_data(self) -> dict[str, Any]:
+        sessions_value = self.sessions
+        if sessions_value is None:
+            raise SchemaValidationError("SessionsResponse.sessions is null")
+        sessions_value_converted = []
+        for sessions_value_entry in sessions_value:
+            if sessions_value_entry is None:
+                raise SchemaValidationError("SessionsResponse.sessions is null")
+            sessions_value_entry = sessions_value_entry.to_json_data()
+            sessions_value_converted.append(sessions_value_entry)
+        sessions_value = sessions_value_converted
+        return {"sessions": sessions_value}
@@ -1,6 +1,6 @@
 import re
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Any, List, Optional
 
 from dataclasses_json import DataClassJsonMixin, dataclass_json
 from django.core.files.uploadedfile import UploadedFile
@@ -21,3 +21,28 @@ class SuccessResponse(DataClassJsonMixin, Validatable):
         if self.success is None:
             raise SchemaValidationError("SuccessResponse.success is null")
         return
+
+    @classmethod
+    def from_json_data(cls, data: Any) -> "SuccessResponse":
+        if not isinstance(data, dict):
+            raise SchemaValidationError("SuccessResponse has an invalid type")
+        message_value = data.get("message")
+        if message_value is None:
+            raise SchemaValidationError("SuccessResponse.message is null")
+        if not isinstance(message_value, str):
+            raise SchemaValidationError("SuccessResponse.message has an invalid type")
+        success_value = data.get("success")
+        if success_value is None:
+            raise SchemaValidationError("SuccessResponse.success is null")
+        if not isinstance(success_value, bool):
+            raise SchemaValidationError("SuccessResponse.success has an invalid type")
+        return cls(message=message_value, success=success_value)
+
+    def to_json_data(self) -> dict[str, Any]:
+        message_value = self.message
+        if message_value is None:
+            raise SchemaValidationError("SuccessResponse.message is null")
+        success_value = self.success
+        if success_value is None:
+            raise SchemaValidationError("SuccessResponse.success is null")
+        return {"message": message_value, "success": success_value}
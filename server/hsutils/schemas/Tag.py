@@ -1,6 +1,6 @@
 import re
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Any, List, Optional
 
 from dataclasses_json import DataClassJsonMixin, dataclass_json
 from django.core.files.uploadedfile import UploadedFile
@@ -25,3 +25,40 @@ class Tag(DataClassJsonMixin, Validatable):
             raise SchemaValidationError("Tag.name is null")
         if len(self.name) < 1:
             raise SchemaValidationError("Tag.name is too short")
+
+    @classmethod
+    def from_json_data(cls, data: Any) -> "Tag":
+        if not isinstance(data, dict):
+            raise SchemaValidationError("Tag has an invalid type")
+        description_value = data.get("description")
+        if description_value is None:
+            raise SchemaValidationError("Tag.description is null")
+        if not isinstance(description_value, str):
+            raise SchemaValidationError("Tag.description has an invalid type")
+        id_value = data.get("id")
+        if id_value is None:
+            raise SchemaValidationError("Tag.id is null")
+        if not isinstance(id_value, int) or isinstance(id_value, bool):
+            raise SchemaValidationError("Tag.id has an invalid type")
+        name_value = data.get("name")
+        if name_value is None:
+            raise SchemaValidationError("Tag.name is null")
+        if not isinstance(name_value, str):
+            raise SchemaValidationError("Tag.name has an invalid type")
+        if len(name_value) < 1:
+            raise SchemaValidationError("Tag.name is too short")
+        return cls(description=description_value, id=id_value, name=name_value)
+
+    def to_json_data(self) -> dict[str, Any]:
+        description_value = self.description
+        if description_value is None:
+            raise SchemaValidationError("Tag.description is null")
+        id_value = self.id
+        if id_value is None:
+            raise SchemaValidationError("Tag.id is null")
+        name_value = self.name
+        if name_value is None:
+            raise SchemaValidationError("Tag.name is null")
+        if len(name_value) < 1:
+            raise SchemaValidationError("Tag.name is too short")
+        return {"description": description_value, "id": id_value, "name": name_value}
@@ -1,6 +1,6 @@
 import re
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Any, List, Optional
 
 from dataclasses_json import DataClassJsonMixin, dataclass_json
 from django.core.files.uploadedfile import UploadedFile
@@ -20,3 +20,34 @@ class TagsResponse(DataClassJsonMixin, Validatable):
             raise SchemaValidationError("TagsResponse.tags is null")
         for self_tags_entry in self.tags:
             self_tags_entry.validate()
+
+    @classmethod
+    def from_json_data(cls, data: Any) -> "TagsResponse":
+        if not isinstance(data, dict):
+            raise SchemaValidationError("TagsResponse has an invalid type")
+        tags_value = data.get("tags")
+        if tags_value is None:
+            raise SchemaValidationError("TagsResponse.tags is null")
+        if not isinstance(tags_value, list):
+            raise SchemaValidationError("TagsResponse.tags has an invalid type")
+        tags_value_converted = []
+        for tags_value_entry in tags_value:
+            if tags_value_entry is None:
+                raise SchemaValidationError("TagsResponse.tags is null")
+            tags_value_entry = Tag.from_json_data(tags_value_entry)
+            tags_value_converted.append(tags_value_entry)
+        tags_value = tags_value_converted
+        return cls(tags=tags_value)
+
+    def to_json_data(self) -> dict[str, Any]:
+        tags_value = self.tags
+        if tags_value is None:
+            raise SchemaValidationError("TagsResponse.tags is null")
+        tags_value_converted = []
+        for tags_value_entry in tags_value:
+            if tags_value_entry is None:
+                raise SchemaValidationError("TagsResponse.tags is null")
+            tags_value_entry = tags_value_entry.to_json_data()
+            tags_value_converted.append(tags_value_entry)
+        tags_value = tags_value_converted
+        return {"tags": tags_value}
@@ -1,6 +1,6 @@
 import re
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Any, List, Optional
 
 from dataclasses_json import DataClassJsonMixin, dataclass_json
 from django.core.files.uploadedfile import UploadedFile
@@ -28,3 +28,44 @@ class TimeSpan(DataClassJsonMixin, Validatable):
             r"[0-9]{4}-[0-9]{2}-[0-9]{2}T[0-9]{2}:[0-9]{2}:[0-9]{2}(\.[0-9]+)?(\+[0-9]{2}:[0-9]{2}|Z)", self.start
         ):
             raise SchemaValidationError("TimeSpan.start has an invalid format")
+
+    @classmethod
+    def from_json_data(cls, data: Any) -> "TimeSpan":
+        if not isinstance(data, dict):
+            raise SchemaValidationError("TimeSpan has an invalid type")
+        end_value = data.get("end")
+        if end_value is None:
+            raise SchemaValidationError("TimeSpan.end is null")
+        if not isinstance(end_value, str):
+            raise SchemaValidationError("TimeSpan.end has an invalid type")
+        if not re.fullmatch(
+            r"[0-9]{4}-[0-9]{2}-[0-9]{2}T[0-9]{2}:[0-9]{2}:[0-9]{2}(\.[0-9]+)?(\+[0-9]{2}:[0-9]{2}|Z)", end_value
+        ):
+            raise SchemaValidationError("TimeSpan.end has an invalid format")
+        start_value = data.get("start")
+        if start_value is None:
+            raise SchemaValidationError("TimeSpan.start is null")
+        if not isinstance(start_value, str):
+            raise SchemaValidationError("TimeSpan.start has an invalid type")
+        if not re.fullmatch(
+            r"[0-9]{4}-[0-9]{2}-[0-9]{2}T[0-9]{2}:[0-9]{2}:[0-9]{2}(\.[0-9]+)?(\+[0-9]{2}:[0-9]{2}|Z)", start_value
+        ):
+            raise SchemaValidationError("TimeSpan.start has an invalid format")
+        return cls(end=end_value, start=start_value)
+
+    def to_json_data(self) -> dict[str, Any]:
+        end_value = self.end
+        if end_value is None:
+            raise SchemaValidationError("TimeSpan.end is null")
+        if not re.fullmatch(
+            r"[0-9]{4}-[0-9]{2}-[0-9]{2}T[0-9]{2}:[0-9]{2}:[0-9]{2}(\.[0-9]+)?(\+[0-9]{2}:[0-9]{2}|Z)", end_value
+        ):
+            raise SchemaValidationError("TimeSpan.end has an invalid format")
+        start_value = self.start
+        if start_value is None:
+            raise SchemaValidationError("TimeSpan.start is null")
+        if not re.fullmatch(
+            r"[0-9]{4}-[0-9]{2}-[0-9]{2}T[0-9]{2}:[0-9]{2}:[0-9]{2}(\.[0-9]+)?(\+[0-9]{2}:[0-9]{2}|Z)", start_value
+        ):
+            raise SchemaValidationError("TimeSpan.start has an invalid format")
+        return {"end": end_value, "start": start_value}
@@ -1,8 +1,20 @@
+import hashlib
+import re
+import threading
+from datetime import datetime, timezone
+from email.utils import formatdate
 from http import HTTPStatus
-from typing import Optional, TypeVar
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Iterable, Optional, TypeVar
+from urllib.parse import parse_qs, unquote, urlsplit
+from xml.etree import ElementTree
+from xml.sax.saxutils import escape
 
+import pytest
 from dataclasses_json import DataClassJsonMixin
+from django.db import connection
 from django.test import Client
+from django.test.utils import CaptureQueriesContext
 
 T = TypeVar("T", bound=DataClassJsonMixin)
 
@@ -29,3 +41,225 @@ def post_test_url(client: Client, path: str, data, response_class: type[T]) -> t
         return HTTPStatus(r.status_code), response_class.schema().loads(r.content.decode())
     except Exception:
         return HTTPStatus(r.status_code), None
+
+
+def count_test_url_queries(client: Client, path: str) -> int:
+    with CaptureQueriesContext(connection) as context:
+        r = client.get("/" + path)
+    assert r.status_code == HTTPStatus.OK
+    return len(context.captured_queries)
+
+
+# only SQLite, which the tests run on, has its query plans checked; other databases skip the tests using the plans
+requires_query_plans = pytest.mark.skipif(
+    connection.vendor != "sqlite",
+    reason=f"query plans of {connection.vendor} are not supported",
+)
+# a plan line of a step reading a whole table without any index
+_TABLE_SCAN_PATTERN = re.compile(r"^SCAN (\w+)$")
+
+
+def explain_query(sql: str) -> list[str]:
+    with connection.cursor() as cursor:
+        cursor.execute(f"EXPLAIN QUERY PLAN {sql}")
+        return [row[-1] for row in cursor.fetchall()]
+
+
+def find_table_scans(captured_queries: Iterable[dict], tables: Iterable[str]) -> list[tuple[str, str]]:
+    # the captured queries reading one of the tables from start to end, along with the offending plan line; the
+    # statistics are refreshed first, so the plans match those of tables with the size of the test data
+    tables = set(tables)
+    with connection.cursor() as cursor:
+        cursor.execute("ANALYZE")
+    scans = []
+    for query in captured_queries:
+        if not query["sql"].startswith("SELECT"):
+            continue
+        for line in explain_query(query["sql"]):
+            match = _TABLE_SCAN_PATTERN.search(line)
+            if match is not None and match.group(1) in tables:
+                scans.append((query["sql"], line))
+    return scans
+
+
+# a minimal, in-memory S3 endpoint that understands just enough for the minio client calls made by this project
+class ObjectStorageStandIn:
+    def __init__(self):
+        self.objects: dict[tuple[str, str], bytes] = {}
+        self.requests: list[tuple[str, str]] = []
+        # a single modification time for all objects keeps validators stable between requests
+        self.modified_at = datetime.now(timezone.utc)
+        self.last_modified = formatdate(self.modified_at.timestamp(), usegmt=True)
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), _make_stand_in_handler(self))
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def endpoint(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"{host}:{port}"
+
+    def __enter__(self) -> "ObjectStorageStandIn":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *args):
+        self._server.shutdown()
+        self._server.server_close()
+
+
+def _make_stand_in_handler(storage: ObjectStorageStandIn) -> type[BaseHTTPRequestHandler]:
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, format, *args):
+            pass
+
+        def _split_path(self) -> tuple[str, str]:
+            path = urlsplit(self.path).path
+            bucket, _, key = unquote(path).lstrip("/").partition("/")
+            return bucket, key
+
+        def _respond(self, status: HTTPStatus, body: bytes = b"", headers: Optional[dict[str, str]] = None):
+            self.send_response(status)
+            for name, value in (headers or {}).items():
+                self.send_header(name, value)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            if self.command != "HEAD":
+                self.wfile.write(body)
+
+        def _respond_error(self, status: HTTPStatus, code: str, bucket: str, key: str):
+            self._respond(
+                status,
+                (
+                    "<?xml version='1.0' encoding='UTF-8'?>"
+                    f"<Error><Code>{code}</Code><Message>{status.phrase}</Message><Key>{key}</Key>"
+                    f"<BucketName>{bucket}</BucketName><Resource>{self.path}</Resource></Error>"
+                ).encode(),
+                {"Content-Type": "application/xml"},
+            )
+
+        def _object_headers(self, data: bytes) -> dict[str, str]:
+            return {
+                "ETag": f'"{hashlib.md5(data).hexdigest()}"',
+                "Last-Modified": storage.last_modified,
+                "Content-Type": "application/octet-stream",
+            }
+
+        def do_HEAD(self):
+            bucket, key = self._split_path()
+            storage.requests.append(("HEAD", f"{bucket}/{key}"))
+            if (data := storage.objects.get((bucket, key))) is None:
+                self._respond(HTTPStatus.NOT_FOUND)
+                return
+            self.send_response(HTTPStatus.OK)
+            for name, value in self._object_headers(data).items():
+                self.send_header(name, value)
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+
+        def _respond_listing(self, bucket: str):
+            # a single page of ListObjectsV2
+            query = parse_qs(urlsplit(self.path).query)
+            prefix = query.get("prefix", [""])[0]
+            delimiter = query.get("delimiter", [""])[0]
+            keys = []
+            common_prefixes = []
+            for key in sorted(key for object_bucket, key in storage.objects if object_bucket == bucket):
+                if not key.startswith(prefix):
+                    continue
+                if delimiter and delimiter in key[len(prefix) :]:
+                    common_prefix = key[: key.index(delimiter, len(prefix)) + len(delimiter)]
+                    if common_prefix not in common_prefixes:
+                        common_prefixes.append(common_prefix)
+                else:
+                    keys.append(key)
+            contents = "".join(
+                f"<Contents><Key>{escape(key)}</Key>"
+                f"<LastModified>{storage.modified_at:%Y-%m-%dT%H:%M:%S.%fZ}</LastModified>"
+                f"<Size>{len(storage.objects[(bucket, key)])}</Size></Contents>"
+                for key in keys
+            ) + "".join(
+                f"<CommonPrefixes><Prefix>{escape(common_prefix)}</Prefix></CommonPrefixes>"
+                for common_prefix in common_prefixes
+            )
+            self._respond(
+                HTTPStatus.OK,
+                (
+                    "<?xml version='1.0' encoding='UTF-8'?>"
+                    '<ListBucketResult xmlns="http://s3.amazonaws.com/doc/2006-03-01/">'
+                    f"<Name>{bucket}</Name><Prefix>{escape(prefix)}</Prefix>"
+                    f"<KeyCount>{len(keys) + len(common_prefixes)}</KeyCount>"
+                    f"<IsTruncated>false</IsTruncated>{contents}</ListBucketResult>"
+                ).encode(),
+                {"Content-Type": "application/xml"},
+            )
+
+        def do_GET(self):
+            bucket, key = self._split_path()
+            storage.requests.append(("GET", f"{bucket}/{key}"))
+            if not key:
+                self._respond_listing(bucket)
+                return
+            if (data := storage.objects.get((bucket, key))) is None:
+                self._respond_error(HTTPStatus.NOT_FOUND, "NoSuchKey", bucket, key)
+                return
+            headers = self._object_headers(data)
+            if (byte_range := self.headers.get("Range")) is not None:
+                first, last = byte_range.removeprefix("bytes=").split("-")
+                if not first:
+                    first, last = max(0, len(data) - int(last)), len(data) - 1 if int(last) else -1
+                else:
+                    first, last = int(first), min(int(last), len(data) - 1) if last else len(data) - 1
+                if first > last:
+                    self._respond_error(HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE, "InvalidRange", bucket, key)
+                    return
+                headers["Content-Range"] = f"bytes {first}-{last}/{len(data)}"
+                self._respond(HTTPStatus.PARTIAL_CONTENT, data[first : last + 1], headers)
+                return
+            self._respond(HTTPStatus.OK, data, headers)
+
+        def do_PUT(self):
+            bucket, key = self._split_path()
+            storage.requests.append(("PUT", f"{bucket}/{key}"))
+            data = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+            if (copy_source := self.headers.get("x-amz-copy-source")) is not None:
+                source_bucket, _, source_key = unquote(copy_source).lstrip("/").partition("/")
+                if (data := storage.objects.get((source_bucket, source_key))) is None:
+                    self._respond_error(HTTPStatus.NOT_FOUND, "NoSuchKey", source_bucket, source_key)
+                    return
+                storage.objects[(bucket, key)] = data
+                self._respond(
+                    HTTPStatus.OK,
+                    (
+                        "<?xml version='1.0' encoding='UTF-8'?>"
+                        f'<CopyObjectResult><ETag>"{hashlib.md5(data).hexdigest()}"</ETag>'
+                        f"<LastModified>{datetime.now(timezone.utc):%Y-%m-%dT%H:%M:%S.%fZ}</LastModified>"
+                        "</CopyObjectResult>"
+                    ).encode(),
+                    {"Content-Type": "application/xml"},
+                )
+                return
+            storage.objects[(bucket, key)] = data
+            self._respond(HTTPStatus.OK, headers={"ETag": f'"{hashlib.md5(data).hexdigest()}"'})
+
+        def do_POST(self):
+            # only multi-object deletion
+            bucket, _ = self._split_path()
+            storage.requests.append(("POST", f"{bucket}/"))
+            body = ElementTree.fromstring(self.rfile.read(int(self.headers.get("Content-Length", 0))))
+            for key in body.findall(".//{*}Key"):
+                storage.objects.pop((bucket, key.text), None)
+            self._respond(
+                HTTPStatus.OK,
+                b'<?xml version="1.0" encoding="UTF-8"?><DeleteResult></DeleteResult>',
+                {"Content-Type": "application/xml"},
+            )
+
+        def do_DELETE(self):
+            bucket, key = self._split_path()
+            storage.requests.append(("DELETE", f"{bucket}/{key}"))
+            storage.objects.pop((bucket, key), None)
+            self._respond(HTTPStatus.NO_CONTENT)
+
+    return Handler
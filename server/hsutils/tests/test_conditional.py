@@ -0,0 +1,139 @@
+from datetime import timedelta
+from http import HTTPStatus
+
+import pytest
+from django.test import Client
+
+from ghost_sharing.models import Gameflow, Ghost, GhostFinishType, Level
+from haunted_sessions.models import Session, Tag
+from hsutils.viewmodels import ghosts, sessions, tags
+
+
+def _get(client: Client, path: str, etag: str | None = None):
+    if etag is None:
+        return client.get("/" + path)
+    return client.get("/" + path, HTTP_IF_NONE_MATCH=etag)
+
+
+@pytest.mark.django_db
+def test_unchanged_resource_is_not_modified(client: Client, django_assert_num_queries):
+    Tag.objects.create(name="tag", description="")
+    response = _get(client, tags.path)
+    assert response.status_code == HTTPStatus.OK
+    etag = response.headers["ETag"]
+    assert "Last-Modified" in response.headers
+    assert "no-cache" in response.headers["Cache-Control"]
+
+    # only the version is queried
+    with django_assert_num_queries(1):
+        response = _get(client, tags.path, etag)
+    assert response.status_code == HTTPStatus.NOT_MODIFIED
+    assert response.headers["ETag"] == etag
+    assert response.content == b""
+
+    assert _get(client, tags.path, '"outdated"').status_code == HTTPStatus.OK
+
+
+@pytest.mark.django_db
+def test_changes_modify_the_version(client: Client):
+    tag = Tag.objects.create(name="tag", description="")
+    etags = [_get(client, tags.path).headers["ETag"]]
+
+    tag.description = "changed"
+    tag.save()
+    etags.append(_get(client, tags.path).headers["ETag"])
+
+    other = Tag.objects.create(name="other", description="")
+    etags.append(_get(client, tags.path).headers["ETag"])
+    assert len(set(etags)) == 3
+
+    # back to the previous content
+    other.delete()
+    assert _get(client, tags.path, etags[1]).status_code == HTTPStatus.NOT_MODIFIED
+    assert _get(client, tags.path, etags[2]).status_code == HTTPStatus.OK
+
+
+@pytest.mark.django_db
+def test_timestamped_models_track_updates():
+    tag = Tag.objects.create(name="tag", description="")
+    updated_at = tag.updated_at
+    tag.save()
+    assert tag.updated_at > updated_at
+    tag.refresh_from_db()
+    assert tag.updated_at > updated_at
+
+
+@pytest.mark.django_db
+def test_session_version_depends_on_user(client: Client, django_user_model):
+    owner = django_user_model.objects.create(is_active=True, username="owner", email="owner@example.com")
+    player = django_user_model.objects.create(is_active=True, username="player", email="player@example.com")
+    session = Session.objects.create(owner=owner, private=True)
+
+    anonymous_etag = _get(client, sessions.path).headers["ETag"]
+    client.force_login(owner)
+    response = _get(client, sessions.path, anonymous_etag)
+    assert response.status_code == HTTPStatus.OK
+    assert len(response.json()["sessions"]) == 1
+    owner_etag = response.headers["ETag"]
+
+    session.players.add(player)
+    response = _get(client, sessions.path, owner_etag)
+    assert response.status_code == HTTPStatus.OK
+    owner_etag = response.headers["ETag"]
+
+    player.username = "renamed"
+    player.save()
+    response = _get(client, sessions.path, owner_etag)
+    assert response.status_code == HTTPStatus.OK
+    assert response.json()["sessions"][0]["players"] == ["renamed"]
+
+
+@pytest.mark.django_db
+def test_ghost_version_follows_owner_renames(client: Client, django_user_model):
+    owner = django_user_model.objects.create(is_active=True, username="owner", email="owner@example.com")
+    level = Level.objects.create(
+        gameflow=Gameflow.objects.create(identifier="gameflow", title="Gameflow"),
+        identifier="LEVEL",
+        title="Level",
+    )
+    Ghost.objects.create(
+        owner=owner,
+        level=level,
+        published=True,
+        data_size=1,
+        duration=timedelta(seconds=1),
+        finish_type=GhostFinishType.completed,
+        original_filename="ghost.tar.xz",
+        description="ghost",
+    )
+    etag = _get(client, ghosts.path).headers["ETag"]
+    assert _get(client, ghosts.path, etag).status_code == HTTPStatus.NOT_MODIFIED
+
+    owner.username = "renamed"
+    owner.save()
+    response = _get(client, ghosts.path, etag)
+    assert response.status_code == HTTPStatus.OK
+    assert response.json()["files"][0]["username"] == "renamed"
+
+
+@pytest.mark.django_db
+def test_session_version_follows_player_changes(client: Client, django_user_model):
+    owner = django_user_model.objects.create(is_active=True, username="owner", email="owner@example.com")
+    player = django_user_model.objects.create(is_active=True, username="player", email="player@example.com")
+    other = django_user_model.objects.create(is_active=True, username="other", email="other@example.com")
+    session = Session.objects.create(owner=owner, private=False)
+    session.players.add(player)
+    etag = _get(client, sessions.path).headers["ETag"]
+
+    # swapping a player keeps the number of memberships
+    session.players.remove(player)
+    other.sessions.add(session)
+    response = _get(client, sessions.path, etag)
+    assert response.status_code == HTTPStatus.OK
+    assert response.json()["sessions"][0]["players"] == ["other"]
+    etag = response.headers["ETag"]
+
+    other.sessions.clear()
+    response = _get(client, sessions.path, etag)
+    assert response.status_code == HTTPStatus.OK
+    assert response.json()["sessions"][0]["players"] == []
@@ -0,0 +1,96 @@
+import json
+
+import pytest
+
+from hsutils.error import SchemaValidationError
+from hsutils.json_codec import dumps_json, loads_json
+from hsutils.viewmodels import (
+    CreateSessionRequest,
+    GhostFileResponseEntry,
+    GhostFilesResponse,
+    Session,
+    SessionsResponse,
+    Tag,
+    TimeSpan,
+)
+
+
+def _make_sessions_response(count: int) -> SessionsResponse:
+    return SessionsResponse(
+        sessions=[
+            Session(
+                id=f"{i:032x}",
+                description=f"session {i}",
+                owner=f"user{i}",
+                players=[f"player{j}" for j in range(5)],
+                private=i % 2 == 0,
+                tags=[Tag(id=j, name=f"tag{j}", description="") for j in range(3)],
+                time=TimeSpan(start="2024-01-01T12:00:00Z", end="2024-01-01T14:00:00Z") if i % 3 == 0 else None,
+            )
+            for i in range(count)
+        ],
+    )
+
+
+def _make_ghost_files_response(count: int) -> GhostFilesResponse:
+    return GhostFilesResponse(
+        files=[
+            GhostFileResponseEntry(
+                id=i,
+                username=f"user{i}",
+                description=f"ghost {i}",
+                tags=[Tag(id=j, name=f"tag{j}", description="") for j in range(3)],
+                level_display="Gameflow - Level",
+                level_identifier="LEVEL1",
+                level_id=1,
+                duration=300,
+                size=2**20,
+                finish_type="Completed",
+                downloads=i,
+                published=True,
+            )
+            for i in range(count)
+        ],
+        next_cursor=None,
+    )
+
+
+@pytest.mark.parametrize("response", [_make_sessions_response(10), _make_ghost_files_response(10)])
+def test_conversion_matches_dataclasses_json(response):
+    assert response.to_json_data() == response.to_dict()
+    assert type(response).from_json_data(loads_json(dumps_json(response.to_json_data()))) == response
+    assert type(response).from_json_data(json.loads(response.to_json())) == response
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        [],
+        {"description": 1, "private": False, "tags": [], "time": None},
+        {"description": "", "private": "false", "tags": [], "time": None},
+        {"description": "", "private": False, "tags": [True], "time": None},
+        {"description": "", "private": False, "tags": [None], "time": None},
+        {"description": "", "private": False, "tags": {}, "time": None},
+        {"description": "x" * 513, "private": False, "tags": [], "time": None},
+        {"description": "", "private": False, "tags": [], "time": {"start": "today", "end": "tomorrow"}},
+    ],
+)
+def test_decoding_validates(data):
+    with pytest.raises(SchemaValidationError):
+        CreateSessionRequest.from_json_data(data)
+
+
+def test_encoding_validates():
+    response = _make_sessions_response(1)
+    response.sessions[0].owner = ""
+    with pytest.raises(SchemaValidationError):
+        response.to_json_data()
+
+
+@pytest.mark.parametrize("response", [_make_sessions_response(500), _make_ghost_files_response(500)])
+def test_conversion_matches_schema_conversion(response):
+    response_class = type(response)
+    encoded = dumps_json(response.to_json_data())
+
+    assert response_class.from_json_data(loads_json(encoded)) == response_class.schema().loads(encoded.decode())
+    assert json.loads(encoded) == json.loads(json.dumps(response.to_dict()))
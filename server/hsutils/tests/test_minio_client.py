@@ -0,0 +1,60 @@
+import os
+
+from django.conf import settings
+
+from ghost_sharing.models import Ghost
+from hsutils import minio
+from hsutils.test_utils import ObjectStorageStandIn
+
+
+def test_client_is_reused_per_process(object_storage: ObjectStorageStandIn, monkeypatch):
+    client = minio._get_client()
+    assert minio._get_client() is client
+
+    pid = os.getpid()
+    monkeypatch.setattr(minio.os, "getpid", lambda: pid + 1)
+    forked_client = minio._get_client()
+    assert forked_client is not client
+    assert minio._get_client() is forked_client
+
+
+def test_client_is_reset_on_setting_change(object_storage: ObjectStorageStandIn, settings):
+    client = minio._get_client()
+    settings.MINIO_MAX_CONNECTIONS = 3
+    assert minio._get_client() is not client
+
+
+def test_connections_are_reused(object_storage: ObjectStorageStandIn, django_user_model):
+    ghost = Ghost(owner=django_user_model(id=1), original_filename="ghost.tar.xz", published=True)
+    object_storage.objects[(settings.MINIO_GHOST_BUCKET, minio._object_name_of(ghost))] = b"ghost data"
+
+    minio.reset_pool_stats()
+    for _ in range(10):
+        assert minio.stat_ghost_data(ghost) is not None
+        stream = minio.open_ghost_data(ghost)
+        assert stream.read() == b"ghost data"
+        stream.close()
+
+    stats = minio.get_pool_stats()
+    assert stats.misses == 1
+    assert stats.hits == 19
+    assert len(object_storage.requests) == 20
+
+
+def test_existence_of_published_data_is_cached(object_storage: ObjectStorageStandIn, django_user_model):
+    ghost = Ghost(owner=django_user_model(id=1), original_filename="ghost.tar.xz", published=False)
+    object_storage.objects[(settings.MINIO_GHOST_BUCKET_STAGING, minio._object_name_of(ghost))] = b"ghost data"
+
+    # staging data expires on its own, so it is always checked
+    for _ in range(2):
+        assert minio.ghost_data_exists(ghost)
+    assert len(object_storage.requests) == 2
+
+    minio.publish_ghost(ghost)
+    object_storage.requests.clear()
+    for _ in range(3):
+        assert minio.ghost_data_exists(ghost)
+    assert object_storage.requests == [("HEAD", f"{settings.MINIO_GHOST_BUCKET}/{minio._object_name_of(ghost)}")]
+
+    minio.delete_ghost(ghost)
+    assert not minio.ghost_data_exists(ghost)
@@ -0,0 +1,27 @@
+import pytest
+from django.db import connection
+from django.db.transaction import atomic
+from django.test.utils import CaptureQueriesContext
+
+from haunted_sessions.models import Tag
+from hsutils.transaction import immediate_atomic
+
+pytestmark = pytest.mark.skipif(connection.vendor != "sqlite", reason="only SQLite needs immediate transactions")
+
+
+def _transaction_statements(block) -> list[str]:
+    with CaptureQueriesContext(connection) as context:
+        with block:
+            Tag.objects.count()
+            with atomic():
+                Tag.objects.count()
+    return [query["sql"] for query in context.captured_queries if "SELECT" not in query["sql"]]
+
+
+@pytest.mark.django_db(transaction=True)
+def test_only_locking_transactions_are_immediate():
+    statements = _transaction_statements(immediate_atomic())
+    assert statements[0] == "BEGIN IMMEDIATE"
+    assert statements[1].startswith("SAVEPOINT")
+    # the mode is only used to begin that transaction
+    assert _transaction_statements(atomic())[0] == "BEGIN"
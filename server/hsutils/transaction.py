@@ -0,0 +1,27 @@
+from contextlib import contextmanager
+from typing import Optional
+
+from django.db.transaction import atomic, get_connection
+
+
+@contextmanager
+def immediate_atomic(using: Optional[str] = None):
+    # SQLite ignores select_for_update(), and a transaction which reads before writing fails on the write lock instead
+    # of waiting for it; the transactions relying on locks take the write lock right away on SQLite instead, while all
+    # others keep reading concurrently
+    connection = get_connection(using)
+    if connection.vendor != "sqlite" or connection.in_atomic_block:
+        with atomic(using=using):
+            yield
+        return
+
+    connection.ensure_connection()
+    transaction_mode = connection.transaction_mode
+    connection.transaction_mode = "IMMEDIATE"
+    try:
+        with atomic(using=using):
+            # the transaction has begun, nested blocks only create savepoints
+            connection.transaction_mode = transaction_mode
+            yield
+    finally:
+        connection.transaction_mode = transaction_mode
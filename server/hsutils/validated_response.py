@@ -11,11 +11,16 @@ from django.http import (
     JsonResponse,
 )
 
+from .json_codec import dumps_json
+
 
 class Validatable:
     def validate(self):
         raise NotImplementedError
 
+    def to_json_data(self) -> dict:
+        raise NotImplementedError
+
 
 T = TypeVar("T", DataClassJsonMixin, Validatable, HttpResponseBase, covariant=True)
 P = ParamSpec("P")
@@ -40,10 +45,10 @@ def validated_response(
                 ), "HttpResponseBase must not provide a status code"
 
             assert isinstance(response_data, Validatable)
-            response_data.validate()
-
-            return JsonResponse(
-                data=response_data.to_dict(),
+            # validates while converting
+            return HttpResponse(
+                dumps_json(response_data.to_json_data()),
+                content_type="application/json",
                 status=response_code,
             )
         except Exception:
@@ -9,9 +9,14 @@ from django.http import FileResponse as DjangoFileResponse
 from django.http import HttpRequest, HttpResponseBase, JsonResponse
 from django.urls import path
 
+from .conditional import ResourceVersion, conditional_response
 from .error import SchemaValidationError
+from .json_codec import loads_json
+from .rest_helper import parse_bool, parse_query_value
 from .schemas.AnnouncementEntry import AnnouncementEntry
 from .schemas.AnnouncementsResponse import AnnouncementsResponse
+from .schemas.BulkSessionAccessRequest import BulkSessionAccessRequest
+from .schemas.BulkSessionAccessResponse import BulkSessionAccessResponse
 from .schemas.ChangeEmailRequest import ChangeEmailRequest
 from .schemas.ChangePasswordRequest import ChangePasswordRequest
 from .schemas.ChangeUsernameRequest import ChangeUsernameRequest
@@ -21,6 +26,7 @@ from .schemas.GhostFileResponse import GhostFileResponse
 from .schemas.GhostFileResponseEntry import GhostFileResponseEntry
 from .schemas.GhostFilesResponse import GhostFilesResponse
 from .schemas.GhostInfoRequest import GhostInfoRequest
+from .schemas.GhostsQuery import GhostsQuery
 from .schemas.LevelInfo import LevelInfo
 from .schemas.LevelsResponse import LevelsResponse
 from .schemas.LoginRequest import LoginRequest
@@ -29,6 +35,7 @@ from .schemas.QuotaResponse import QuotaResponse
 from .schemas.RegisterRequest import RegisterRequest
 from .schemas.ServerInfoResponse import ServerInfoResponse
 from .schemas.Session import Session
+from .schemas.SessionAccessEntry import SessionAccessEntry
 from .schemas.SessionAccessRequest import SessionAccessRequest
 from .schemas.SessionPlayers import SessionPlayers
 from .schemas.SessionResponse import SessionResponse
@@ -95,10 +102,11 @@ class tags:
         cls,
         *,
         get_handler: Callable[[HttpRequest], TagsResponse | tuple[int, TagsResponse]],
+        get_version: Callable[[HttpRequest], Optional[ResourceVersion]],
     ):
         def dispatch(request: HttpRequest) -> HttpResponseBase:
             if request.method == "GET":
-                return cls.do_get(request, get_handler)
+                return conditional_response(request, get_version(request), lambda: cls.do_get(request, get_handler))
             return JsonResponse(data={}, status=HTTPStatus.METHOD_NOT_ALLOWED)
 
         return path(cls.path, dispatch, name=cls.name)
@@ -125,11 +133,12 @@ class sessions:
         cls,
         *,
         get_handler: Callable[[HttpRequest], SessionsResponse | tuple[int, SessionsResponse]],
+        get_version: Callable[[HttpRequest], Optional[ResourceVersion]],
         post_handler: Callable[[HttpRequest, CreateSessionRequest], SuccessResponse | tuple[int, SuccessResponse]],
     ):
         def dispatch(request: HttpRequest) -> HttpResponseBase:
             if request.method == "GET":
-                return cls.do_get(request, get_handler)
+                return conditional_response(request, get_version(request), lambda: cls.do_get(request, get_handler))
             if request.method == "POST":
                 return cls.do_post(request, post_handler)
             return JsonResponse(data={}, status=HTTPStatus.METHOD_NOT_ALLOWED)
@@ -154,10 +163,9 @@ class sessions:
         request: HttpRequest,
         handler: Callable[[HttpRequest, CreateSessionRequest], SuccessResponse | tuple[int, SuccessResponse]],
     ) -> SuccessResponse | tuple[int, SuccessResponse] | JsonResponse:
-        body: CreateSessionRequest = CreateSessionRequest.schema().loads(request.body.decode())
         try:
-            body.validate()
-        except SchemaValidationError as e:
+            body = CreateSessionRequest.from_json_data(loads_json(request.body))
+        except (ValueError, SchemaValidationError) as e:
             logging.error("request validation failed", exc_info=True)
             return JsonResponse(status=HTTPStatus.BAD_REQUEST, data={"message": str(e)})
         response = handler(request, body)
@@ -212,10 +220,9 @@ class session:
         handler: Callable[[HttpRequest, str, CreateSessionRequest], SuccessResponse | tuple[int, SuccessResponse]],
         session_id: str,
     ) -> SuccessResponse | tuple[int, SuccessResponse] | JsonResponse:
-        body: CreateSessionRequest = CreateSessionRequest.schema().loads(request.body.decode())
         try:
-            body.validate()
-        except SchemaValidationError as e:
+            body = CreateSessionRequest.from_json_data(loads_json(request.body))
+        except (ValueError, SchemaValidationError) as e:
             logging.error("request validation failed", exc_info=True)
             return JsonResponse(status=HTTPStatus.BAD_REQUEST, data={"message": str(e)})
         response = handler(request, session_id, body)
@@ -263,10 +270,49 @@ class session_access:
         request: HttpRequest,
         handler: Callable[[HttpRequest, SessionAccessRequest], SuccessResponse | tuple[int, SuccessResponse]],
     ) -> SuccessResponse | tuple[int, SuccessResponse] | JsonResponse:
-        body: SessionAccessRequest = SessionAccessRequest.schema().loads(request.body.decode())
         try:
-            body.validate()
-        except SchemaValidationError as e:
+            body = SessionAccessRequest.from_json_data(loads_json(request.body))
+        except (ValueError, SchemaValidationError) as e:
+            logging.error("request validation failed", exc_info=True)
+            return JsonResponse(status=HTTPStatus.BAD_REQUEST, data={"message": str(e)})
+        response = handler(request, body)
+        if isinstance(response, tuple):
+            code, response = response
+        else:
+            code = HTTPStatus.OK
+        return code, response
+
+
+class bulk_session_access:
+    path = "api/v0/sessions/check-access-bulk"
+    name = "bulkSessionAccess"
+
+    @classmethod
+    def wrap(
+        cls,
+        *,
+        post_handler: Callable[
+            [HttpRequest, BulkSessionAccessRequest], BulkSessionAccessResponse | tuple[int, BulkSessionAccessResponse]
+        ],
+    ):
+        def dispatch(request: HttpRequest) -> HttpResponseBase:
+            if request.method == "POST":
+                return cls.do_post(request, post_handler)
+            return JsonResponse(data={}, status=HTTPStatus.METHOD_NOT_ALLOWED)
+
+        return path(cls.path, dispatch, name=cls.name)
+
+    @validated_response
+    @staticmethod
+    def do_post(
+        request: HttpRequest,
+        handler: Callable[
+            [HttpRequest, BulkSessionAccessRequest], BulkSessionAccessResponse | tuple[int, BulkSessionAccessResponse]
+        ],
+    ) -> BulkSessionAccessResponse | tuple[int, BulkSessionAccessResponse] | JsonResponse:
+        try:
+            body = BulkSessionAccessRequest.from_json_data(loads_json(request.body))
+        except (ValueError, SchemaValidationError) as e:
             logging.error("request validation failed", exc_info=True)
             return JsonResponse(status=HTTPStatus.BAD_REQUEST, data={"message": str(e)})
         response = handler(request, body)
@@ -299,10 +345,9 @@ class session_players:
     def do_post(
         request: HttpRequest, handler: Callable[[HttpRequest, SessionsPlayersRequest], Empty | tuple[int, Empty]]
     ) -> Empty | tuple[int, Empty] | JsonResponse:
-        body: SessionsPlayersRequest = SessionsPlayersRequest.schema().loads(request.body.decode())
         try:
-            body.validate()
-        except SchemaValidationError as e:
+            body = SessionsPlayersRequest.from_json_data(loads_json(request.body))
+        except (ValueError, SchemaValidationError) as e:
             logging.error("request validation failed", exc_info=True)
             return JsonResponse(status=HTTPStatus.BAD_REQUEST, data={"message": str(e)})
         response = handler(request, body)
@@ -322,10 +367,11 @@ class announcements:
         cls,
         *,
         get_handler: Callable[[HttpRequest], AnnouncementsResponse | tuple[int, AnnouncementsResponse]],
+        get_version: Callable[[HttpRequest], Optional[ResourceVersion]],
     ):
         def dispatch(request: HttpRequest) -> HttpResponseBase:
             if request.method == "GET":
-                return cls.do_get(request, get_handler)
+                return conditional_response(request, get_version(request), lambda: cls.do_get(request, get_handler))
             return JsonResponse(data={}, status=HTTPStatus.METHOD_NOT_ALLOWED)
 
         return path(cls.path, dispatch, name=cls.name)
@@ -397,10 +443,9 @@ class change_username:
         request: HttpRequest,
         handler: Callable[[HttpRequest, ChangeUsernameRequest], SuccessResponse | tuple[int, SuccessResponse]],
     ) -> SuccessResponse | tuple[int, SuccessResponse] | JsonResponse:
-        body: ChangeUsernameRequest = ChangeUsernameRequest.schema().loads(request.body.decode())
         try:
-            body.validate()
-        except SchemaValidationError as e:
+            body = ChangeUsernameRequest.from_json_data(loads_json(request.body))
+        except (ValueError, SchemaValidationError) as e:
             logging.error("request validation failed", exc_info=True)
             return JsonResponse(status=HTTPStatus.BAD_REQUEST, data={"message": str(e)})
         response = handler(request, body)
@@ -464,10 +509,9 @@ class login:
         request: HttpRequest,
         handler: Callable[[HttpRequest, LoginRequest], SuccessResponse | tuple[int, SuccessResponse]],
     ) -> SuccessResponse | tuple[int, SuccessResponse] | JsonResponse:
-        body: LoginRequest = LoginRequest.schema().loads(request.body.decode())
         try:
-            body.validate()
-        except SchemaValidationError as e:
+            body = LoginRequest.from_json_data(loads_json(request.body))
+        except (ValueError, SchemaValidationError) as e:
             logging.error("request validation failed", exc_info=True)
             return JsonResponse(status=HTTPStatus.BAD_REQUEST, data={"message": str(e)})
         response = handler(request, body)
@@ -501,10 +545,9 @@ class register:
         request: HttpRequest,
         handler: Callable[[HttpRequest, RegisterRequest], SuccessResponse | tuple[int, SuccessResponse]],
     ) -> SuccessResponse | tuple[int, SuccessResponse] | JsonResponse:
-        body: RegisterRequest = RegisterRequest.schema().loads(request.body.decode())
         try:
-            body.validate()
-        except SchemaValidationError as e:
+            body = RegisterRequest.from_json_data(loads_json(request.body))
+        except (ValueError, SchemaValidationError) as e:
             logging.error("request validation failed", exc_info=True)
             return JsonResponse(status=HTTPStatus.BAD_REQUEST, data={"message": str(e)})
         response = handler(request, body)
@@ -538,10 +581,9 @@ class change_password:
         request: HttpRequest,
         handler: Callable[[HttpRequest, ChangePasswordRequest], SuccessResponse | tuple[int, SuccessResponse]],
     ) -> SuccessResponse | tuple[int, SuccessResponse] | JsonResponse:
-        body: ChangePasswordRequest = ChangePasswordRequest.schema().loads(request.body.decode())
         try:
-            body.validate()
-        except SchemaValidationError as e:
+            body = ChangePasswordRequest.from_json_data(loads_json(request.body))
+        except (ValueError, SchemaValidationError) as e:
             logging.error("request validation failed", exc_info=True)
             return JsonResponse(status=HTTPStatus.BAD_REQUEST, data={"message": str(e)})
         response = handler(request, body)
@@ -575,10 +617,9 @@ class change_email:
         request: HttpRequest,
         handler: Callable[[HttpRequest, ChangeEmailRequest], SuccessResponse | tuple[int, SuccessResponse]],
     ) -> SuccessResponse | tuple[int, SuccessResponse] | JsonResponse:
-        body: ChangeEmailRequest = ChangeEmailRequest.schema().loads(request.body.decode())
         try:
-            body.validate()
-        except SchemaValidationError as e:
+            body = ChangeEmailRequest.from_json_data(loads_json(request.body))
+        except (ValueError, SchemaValidationError) as e:
             logging.error("request validation failed", exc_info=True)
             return JsonResponse(status=HTTPStatus.BAD_REQUEST, data={"message": str(e)})
         response = handler(request, body)
@@ -627,12 +668,13 @@ class ghosts:
     def wrap(
         cls,
         *,
-        get_handler: Callable[[HttpRequest], GhostFilesResponse | tuple[int, GhostFilesResponse]],
+        get_handler: Callable[[HttpRequest, GhostsQuery], GhostFilesResponse | tuple[int, GhostFilesResponse]],
+        get_version: Callable[[HttpRequest], Optional[ResourceVersion]],
         post_handler: Callable[[HttpRequest, dict[str, UploadedFile]], SuccessResponse | tuple[int, SuccessResponse]],
     ):
         def dispatch(request: HttpRequest) -> HttpResponseBase:
             if request.method == "GET":
-                return cls.do_get(request, get_handler)
+                return conditional_response(request, get_version(request), lambda: cls.do_get(request, get_handler))
             if request.method == "POST":
                 return cls.do_post(request, post_handler)
             return JsonResponse(data={}, status=HTTPStatus.METHOD_NOT_ALLOWED)
@@ -642,9 +684,23 @@ class ghosts:
     @validated_response
     @staticmethod
     def do_get(
-        request: HttpRequest, handler: Callable[[HttpRequest], GhostFilesResponse | tuple[int, GhostFilesResponse]]
+        request: HttpRequest,
+        handler: Callable[[HttpRequest, GhostsQuery], GhostFilesResponse | tuple[int, GhostFilesResponse]],
     ) -> GhostFilesResponse | tuple[int, GhostFilesResponse] | JsonResponse:
-        response = handler(request)
+        try:
+            query = GhostsQuery(
+                cursor=parse_query_value(request.GET.get("cursor"), str),
+                finish_type=parse_query_value(request.GET.get("finish_type"), str),
+                level_id=parse_query_value(request.GET.get("level_id"), int),
+                limit=parse_query_value(request.GET.get("limit"), int),
+                tags=[int(value) for value in request.GET.getlist("tags")],
+                username=parse_query_value(request.GET.get("username"), str),
+            )
+            query.validate()
+        except (ValueError, SchemaValidationError) as e:
+            logging.error("request validation failed", exc_info=True)
+            return JsonResponse(status=HTTPStatus.BAD_REQUEST, data={"message": str(e)})
+        response = handler(request, query)
         if isinstance(response, tuple):
             code, response = response
         else:
@@ -736,10 +792,9 @@ class single_ghost:
         handler: Callable[[HttpRequest, int, GhostInfoRequest], SuccessResponse | tuple[int, SuccessResponse]],
         id: int,
     ) -> SuccessResponse | tuple[int, SuccessResponse] | JsonResponse:
-        body: GhostInfoRequest = GhostInfoRequest.schema().loads(request.body.decode())
         try:
-            body.validate()
-        except SchemaValidationError as e:
+            body = GhostInfoRequest.from_json_data(loads_json(request.body))
+        except (ValueError, SchemaValidationError) as e:
             logging.error("request validation failed", exc_info=True)
             return JsonResponse(status=HTTPStatus.BAD_REQUEST, data={"message": str(e)})
         response = handler(request, id, body)
@@ -824,6 +879,37 @@ class quota:
         return code, response
 
 
+class ghost_levels:
+    path = "api/v0/ghosts/levels"
+    name = "ghost_levels"
+
+    @classmethod
+    def wrap(
+        cls,
+        *,
+        get_handler: Callable[[HttpRequest], LevelsResponse | tuple[int, LevelsResponse]],
+        get_version: Callable[[HttpRequest], Optional[ResourceVersion]],
+    ):
+        def dispatch(request: HttpRequest) -> HttpResponseBase:
+            if request.method == "GET":
+                return conditional_response(request, get_version(request), lambda: cls.do_get(request, get_handler))
+            return JsonResponse(data={}, status=HTTPStatus.METHOD_NOT_ALLOWED)
+
+        return path(cls.path, dispatch, name=cls.name)
+
+    @validated_response
+    @staticmethod
+    def do_get(
+        request: HttpRequest, handler: Callable[[HttpRequest], LevelsResponse | tuple[int, LevelsResponse]]
+    ) -> LevelsResponse | tuple[int, LevelsResponse] | JsonResponse:
+        response = handler(request)
+        if isinstance(response, tuple):
+            code, response = response
+        else:
+            code = HTTPStatus.OK
+        return code, response
+
+
 class levels:
     path = "api/v0/levels/<str:identifier>"
     name = "levels"
@@ -833,10 +919,13 @@ class levels:
         cls,
         *,
         get_handler: Callable[[HttpRequest, str], LevelsResponse | tuple[int, LevelsResponse]],
+        get_version: Callable[[HttpRequest, str], Optional[ResourceVersion]],
     ):
         def dispatch(request: HttpRequest, identifier: str) -> HttpResponseBase:
             if request.method == "GET":
-                return cls.do_get(request, get_handler, identifier)
+                return conditional_response(
+                    request, get_version(request, identifier), lambda: cls.do_get(request, get_handler, identifier)
+                )
             return JsonResponse(data={}, status=HTTPStatus.METHOD_NOT_ALLOWED)
 
         return path(cls.path, dispatch, name=cls.name)
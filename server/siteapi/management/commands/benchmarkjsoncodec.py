@@ -0,0 +1,103 @@
+import json
+import time
+from typing import Callable
+
+from django.core.management.base import BaseCommand, CommandError
+
+from hsutils.json_codec import dumps_json, loads_json
+from hsutils.viewmodels import (
+    GhostFileResponseEntry,
+    GhostFilesResponse,
+    Session,
+    SessionsResponse,
+    Tag,
+    TimeSpan,
+)
+
+
+def _sessions_response(count: int) -> SessionsResponse:
+    return SessionsResponse(
+        sessions=[
+            Session(
+                id=f"{i:032x}",
+                description=f"session {i}",
+                owner=f"user{i}",
+                players=[f"player{j}" for j in range(5)],
+                private=i % 2 == 0,
+                tags=[Tag(id=j, name=f"tag{j}", description="") for j in range(3)],
+                time=TimeSpan(start="2024-01-01T12:00:00Z", end="2024-01-01T14:00:00Z") if i % 3 == 0 else None,
+            )
+            for i in range(count)
+        ],
+    )
+
+
+def _ghost_files_response(count: int) -> GhostFilesResponse:
+    return GhostFilesResponse(
+        files=[
+            GhostFileResponseEntry(
+                id=i,
+                username=f"user{i}",
+                description=f"ghost {i}",
+                tags=[Tag(id=j, name=f"tag{j}", description="") for j in range(3)],
+                level_display="Gameflow - Level",
+                level_identifier="LEVEL1",
+                level_id=1,
+                duration=300,
+                size=2**20,
+                finish_type="Completed",
+                downloads=i,
+                published=True,
+            )
+            for i in range(count)
+        ],
+        next_cursor=None,
+    )
+
+
+def _best_cpu_time(repeat: int, run: Callable[[], None]) -> float:
+    best = None
+    for _ in range(repeat):
+        started = time.process_time()
+        run()
+        elapsed = time.process_time() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+class Command(BaseCommand):
+    help = "Compares the CPU time of the generated JSON converters with the dataclasses_json schemas"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--count", type=int, default=500, help="Number of entries per response")
+        parser.add_argument("--repeat", type=int, default=5, help="Runs of which the fastest one is reported")
+
+    def handle(self, *args, count: int, repeat: int, **options):
+        for response in (_sessions_response(count), _ghost_files_response(count)):
+            response_class = type(response)
+            encoded = dumps_json(response.to_json_data())
+            # both paths must agree, or comparing them is pointless
+            if response_class.from_json_data(loads_json(encoded)) != response_class.schema().loads(encoded.decode()):
+                raise CommandError(f"{response_class.__name__} is decoded differently by the schema")
+
+            def schema_decode():
+                response_class.schema().loads(encoded.decode()).validate()
+
+            def converter_decode():
+                response_class.from_json_data(loads_json(encoded))
+
+            def schema_encode():
+                response.validate()
+                json.dumps(response.to_dict())
+
+            def converter_encode():
+                dumps_json(response.to_json_data())
+
+            timings = {
+                run.__name__: _best_cpu_time(repeat, run)
+                for run in (schema_decode, converter_decode, schema_encode, converter_encode)
+            }
+            self.stdout.write(
+                f"{response_class.__name__} with {count} entries: "
+                + ", ".join(f"{name} {elapsed * 1000:.2f} ms" for name, elapsed in timings.items()),
+            )
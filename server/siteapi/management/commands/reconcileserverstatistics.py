@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from siteapi.models import ServerStatistics
+
+
+class Command(BaseCommand):
+    help = "Recomputes the server statistics from scratch"
+
+    def handle(self, *args, **options):
+        statistics = ServerStatistics.reconcile()
+        self.stdout.write(
+            f"{statistics.total_users} users, {statistics.total_sessions} sessions, {statistics.total_ghosts} ghosts,"
+            f" {statistics.total_ghost_duration} total ghost duration",
+        )
@@ -0,0 +1,27 @@
+# Generated by Django 5.2.18 on 2026-10-18 13:24
+
+import datetime
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("siteapi", "0005_alter_announcement_message"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ServerStatistics",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("total_users", models.PositiveIntegerField(default=0)),
+                ("total_sessions", models.PositiveIntegerField(default=0)),
+                ("total_ghosts", models.PositiveIntegerField(default=0)),
+                ("total_ghost_duration", models.DurationField(default=datetime.timedelta)),
+                ("reconciled_at", models.DateTimeField(default=django.utils.timezone.now)),
+            ],
+        ),
+    ]
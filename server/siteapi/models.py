@@ -1,11 +1,29 @@
+from datetime import timedelta
+from functools import partial
+
+from django.conf import settings
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from django.db import models
+from django.db.models import F, Sum, Value
+from django.db.models.functions import Greatest
+from django.db.models.signals import post_delete, post_init, post_save, pre_save
+from django.db.transaction import atomic, on_commit
+from django.dispatch import receiver
+from django.utils import timezone
 from django_ckeditor_5.fields import CKEditor5Field
 
+from ghost_sharing.models import Ghost
+from haunted_auth.models import get_stored_user_state
+from haunted_sessions.models import Session
 from hsutils import TimestampedModel
 
 User = get_user_model()
 
+_RECONCILE_LOCK_KEY = "server-statistics-reconcile"
+# in case the reconciling request dies without releasing the lock
+_RECONCILE_LOCK_TIMEOUT = 300
+
 
 class BootstrapBackgroundColor(models.TextChoices):
     primary = "primary"
@@ -37,3 +55,125 @@ class Announcement(TimestampedModel):
         choices=BootstrapTextColor.choices,
         default=BootstrapTextColor.black,
     )
+
+
+class ServerStatistics(models.Model):
+    # a single row that is kept up to date by the receivers below, so reading the statistics is O(1);
+    # anything bypassing model signals (e.g. QuerySet.update()) is corrected by reconcile()
+    total_users = models.PositiveIntegerField(default=0)
+    total_sessions = models.PositiveIntegerField(default=0)
+    total_ghosts = models.PositiveIntegerField(default=0)
+    total_ghost_duration = models.DurationField(default=timedelta)
+    reconciled_at = models.DateTimeField(default=timezone.now)
+
+    SINGLETON_ID = 1
+
+    @classmethod
+    def current(cls) -> "ServerStatistics":
+        statistics = cls.objects.filter(id=cls.SINGLETON_ID).first()
+        if statistics is None:
+            return cls.reconcile()
+        # only a single request refreshes expired statistics, all others serve them as they are meanwhile
+        if statistics.reconciled_at < timezone.now() - settings.SERVER_STATISTICS_MAX_AGE and cache.add(
+            _RECONCILE_LOCK_KEY,
+            True,
+            timeout=_RECONCILE_LOCK_TIMEOUT,
+        ):
+            try:
+                return cls.reconcile()
+            finally:
+                cache.delete(_RECONCILE_LOCK_KEY)
+        return statistics
+
+    @classmethod
+    @atomic
+    def reconcile(cls) -> "ServerStatistics":
+        statistics, _ = cls.objects.update_or_create(
+            id=cls.SINGLETON_ID,
+            defaults={
+                "total_users": User.objects.filter(is_active=True).count(),
+                "total_sessions": Session.objects.count(),
+                "total_ghosts": Ghost.objects.filter(published=True).count(),
+                "total_ghost_duration": Ghost.objects.aggregate(Sum("duration"))["duration__sum"] or timedelta(),
+                "reconciled_at": timezone.now(),
+            },
+        )
+        return statistics
+
+    @classmethod
+    def apply(cls, **deltas):
+        # the row is shared by all writes, so it is only updated once the triggering transaction has committed instead
+        # of staying locked until then
+        if any(deltas.values()):
+            on_commit(partial(cls._apply_now, deltas))
+
+    @classmethod
+    def _apply_now(cls, deltas: dict):
+        # drifted statistics must not fail the update, so they stop at zero until reconciled
+        cls.objects.filter(id=cls.SINGLETON_ID).update(
+            **{
+                field: Greatest(F(field) + delta, Value(type(delta)(), output_field=cls._meta.get_field(field)))
+                for field, delta in deltas.items()
+            },
+        )
+
+
+@receiver(post_save, sender=User)
+def count_saved_user(sender, instance: User, **kwargs):
+    stored = get_stored_user_state(instance) or {"is_active": False}
+    ServerStatistics.apply(total_users=int(instance.is_active) - int(stored["is_active"]))
+
+
+@receiver(post_delete, sender=User)
+def count_deleted_user(sender, instance: User, **kwargs):
+    ServerStatistics.apply(total_users=-int(instance.is_active))
+
+
+@receiver(post_save, sender=Session)
+def count_saved_session(sender, instance: Session, created: bool, **kwargs):
+    if created:
+        ServerStatistics.apply(total_sessions=1)
+
+
+@receiver(post_delete, sender=Session)
+def count_deleted_session(sender, instance: Session, **kwargs):
+    ServerStatistics.apply(total_sessions=-1)
+
+
+def _ghost_statistics(ghost: Ghost) -> dict:
+    return {"published": ghost.published, "duration": ghost.duration}
+
+
+@receiver(post_init, sender=Ghost)
+def remember_loaded_ghost_statistics(sender, instance: Ghost, **kwargs):
+    # the values as loaded are what a later save changes, so saving does not need to read them again; ghosts loaded
+    # without them look them up when saved
+    if instance.pk is not None and {"published", "duration"} <= instance.__dict__.keys():
+        instance._loaded_statistics = _ghost_statistics(instance)
+
+
+@receiver(pre_save, sender=Ghost)
+def remember_ghost_statistics(sender, instance: Ghost, update_fields=None, **kwargs):
+    if instance.pk is None:
+        instance._stored_statistics = None
+    elif update_fields is not None and not {"published", "duration"} & set(update_fields):
+        instance._stored_statistics = _ghost_statistics(instance)
+    elif hasattr(instance, "_loaded_statistics"):
+        instance._stored_statistics = instance._loaded_statistics
+    else:
+        instance._stored_statistics = sender.objects.filter(pk=instance.pk).values("published", "duration").first()
+
+
+@receiver(post_save, sender=Ghost)
+def count_saved_ghost(sender, instance: Ghost, **kwargs):
+    stored = instance._stored_statistics or {"published": False, "duration": timedelta()}
+    ServerStatistics.apply(
+        total_ghosts=int(instance.published) - int(stored["published"]),
+        total_ghost_duration=instance.duration - stored["duration"],
+    )
+    instance._loaded_statistics = _ghost_statistics(instance)
+
+
+@receiver(post_delete, sender=Ghost)
+def count_deleted_ghost(sender, instance: Ghost, **kwargs):
+    ServerStatistics.apply(total_ghosts=-int(instance.published), total_ghost_duration=-instance.duration)
@@ -1,16 +1,24 @@
+from datetime import timedelta
 from http import HTTPStatus
+from io import StringIO
 
 import pytest
 from django.conf import settings
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
 from django.test import Client
+from django.test.utils import CaptureQueriesContext
 
+from ghost_sharing.models import Gameflow, Ghost, GhostFinishType, Level
 from haunted_sessions.models import Session
 from hsutils.test_utils import get_test_url
 from hsutils.viewmodels import ServerInfoResponse, server_info
+from siteapi.models import _RECONCILE_LOCK_KEY, ServerStatistics
 
 
 @pytest.mark.django_db
-def test_server_info(client: Client, django_user_model):
+def test_server_info(client: Client, django_user_model, django_capture_on_commit_callbacks):
     assert django_user_model.objects.count() == 0
     assert Session.objects.count() == 0
 
@@ -21,11 +29,12 @@ def test_server_info(client: Client, django_user_model):
     assert response.total_sessions == 0
     assert response.total_users == 0
 
-    user = django_user_model.objects.create_user(
-        username="user",
-        email="user@example.com",
-        password="password123",
-    )
+    with django_capture_on_commit_callbacks(execute=True):
+        user = django_user_model.objects.create_user(
+            username="user",
+            email="user@example.com",
+            password="password123",
+        )
     code, response = get_test_url(client, server_info.path, ServerInfoResponse)
     assert code == HTTPStatus.OK
     assert response is not None
@@ -33,11 +42,161 @@ def test_server_info(client: Client, django_user_model):
     assert response.total_sessions == 0
     assert response.total_users == 1
 
-    for _ in range(3):
-        Session.objects.create(owner=user, description="", private=False)
+    with django_capture_on_commit_callbacks(execute=True):
+        for _ in range(3):
+            Session.objects.create(owner=user, description="", private=False)
     code, response = get_test_url(client, server_info.path, ServerInfoResponse)
     assert code == HTTPStatus.OK
     assert response is not None
     assert response.coop_url == settings.COOP_SERVER_URL
     assert response.total_sessions == 3
     assert response.total_users == 1
+
+
+def _create_ghost(owner, published: bool, seconds: int) -> Ghost:
+    gameflow, _ = Gameflow.objects.get_or_create(identifier="gameflow", title="Gameflow")
+    level, _ = Level.objects.get_or_create(gameflow=gameflow, identifier="LEVEL", title="Level")
+    return Ghost.objects.create(
+        owner=owner,
+        level=level,
+        published=published,
+        data_size=1,
+        duration=timedelta(seconds=seconds),
+        finish_type=GhostFinishType.completed,
+        original_filename="ghost.tar.xz",
+        description="ghost",
+    )
+
+
+def _get_server_info(client: Client) -> ServerInfoResponse:
+    code, response = get_test_url(client, server_info.path, ServerInfoResponse)
+    assert code == HTTPStatus.OK
+    return response
+
+
+@pytest.mark.django_db
+def test_server_info_is_maintained_incrementally(
+    client: Client,
+    django_user_model,
+    django_assert_num_queries,
+    django_capture_on_commit_callbacks,
+):
+    _get_server_info(client)
+    with django_assert_num_queries(1):
+        response = _get_server_info(client)
+    assert (response.total_users, response.total_sessions, response.total_ghosts) == (0, 0, 0)
+
+    with django_capture_on_commit_callbacks(execute=True):
+        users = [
+            django_user_model.objects.create(is_active=True, username=f"user{i}", email=f"user{i}@example.com")
+            for i in range(3)
+        ]
+        users[2].is_active = False
+        users[2].save()
+        users[1].delete()
+        Session.objects.create(owner=users[0], private=False)
+        Session.objects.create(owner=users[0], private=False).delete()
+        published = _create_ghost(users[0], True, 30)
+        staging = _create_ghost(users[0], False, 20)
+        _create_ghost(users[0], True, 10).delete()
+        staging.published = True
+        staging.duration = timedelta(seconds=25)
+        staging.save()
+        published.published = False
+        published.save()
+
+    with django_assert_num_queries(1):
+        response = _get_server_info(client)
+    assert response.total_users == 1
+    assert response.total_sessions == 1
+    assert response.total_ghosts == 1
+    assert response.total_ghost_duration == 55
+
+
+@pytest.mark.django_db
+def test_server_info_is_reconciled(client: Client, django_user_model, settings):
+    user = django_user_model.objects.create(is_active=True, username="user", email="user@example.com")
+    _create_ghost(user, True, 30)
+    _get_server_info(client)
+
+    # bypasses the signals
+    Ghost.objects.update(published=False)
+    assert _get_server_info(client).total_ghosts == 1
+
+    call_command("reconcileserverstatistics", stdout=StringIO())
+    assert _get_server_info(client).total_ghosts == 0
+
+    Ghost.objects.update(published=True)
+    settings.SERVER_STATISTICS_MAX_AGE = timedelta()
+    assert _get_server_info(client).total_ghosts == 1
+
+
+@pytest.mark.django_db
+def test_drifted_statistics_stop_at_zero(client: Client, django_user_model, django_capture_on_commit_callbacks):
+    user = django_user_model.objects.create(is_active=True, username="user", email="user@example.com")
+    ghost = _create_ghost(user, True, 30)
+    _get_server_info(client)
+
+    # bypasses the signals, so the statistics still count the ghost when it is deleted later
+    Ghost.objects.update(published=False, duration=timedelta(seconds=60))
+    ServerStatistics.reconcile()
+    Ghost.objects.filter(id=ghost.id).update(published=True)
+    with django_capture_on_commit_callbacks(execute=True):
+        Ghost.objects.get(id=ghost.id).delete()
+        user.delete()
+        django_user_model.objects.create(is_active=False, username="other", email="other@example.com").delete()
+
+    response = _get_server_info(client)
+    assert (response.total_users, response.total_ghosts, response.total_ghost_duration) == (0, 0, 0)
+
+
+@pytest.mark.django_db
+def test_saving_a_loaded_ghost_does_not_read_it_again(django_user_model, django_capture_on_commit_callbacks):
+    user = django_user_model.objects.create(is_active=True, username="user", email="user@example.com")
+    ghost = _create_ghost(user, False, 30)
+    ServerStatistics.reconcile()
+
+    loaded = Ghost.objects.get(id=ghost.id)
+    loaded.published = True
+    with django_capture_on_commit_callbacks(execute=True):
+        with CaptureQueriesContext(connection) as context:
+            loaded.save()
+        assert not [query for query in context.captured_queries if query["sql"].startswith("SELECT")]
+        # saved values are what the next save changes
+        loaded.duration = timedelta(seconds=40)
+        loaded.save()
+
+    statistics = ServerStatistics.current()
+    assert (statistics.total_ghosts, statistics.total_ghost_duration) == (1, timedelta(seconds=40))
+
+
+@pytest.mark.django_db
+def test_statistics_are_updated_after_commit(django_user_model, django_capture_on_commit_callbacks):
+    ServerStatistics.reconcile()
+    with django_capture_on_commit_callbacks() as callbacks:
+        with CaptureQueriesContext(connection) as context:
+            django_user_model.objects.create(is_active=True, username="user", email="user@example.com")
+    # the shared row is not locked by the transaction creating the user
+    assert not [query for query in context.captured_queries if "siteapi_serverstatistics" in query["sql"]]
+    assert ServerStatistics.current().total_users == 0
+
+    for callback in callbacks:
+        callback()
+    assert ServerStatistics.current().total_users == 1
+
+
+@pytest.mark.django_db
+def test_expired_statistics_are_refreshed_once(client: Client, django_user_model, settings, django_assert_num_queries):
+    user = django_user_model.objects.create(is_active=True, username="user", email="user@example.com")
+    _create_ghost(user, True, 30)
+    ServerStatistics.reconcile()
+    Ghost.objects.update(published=False)
+    settings.SERVER_STATISTICS_MAX_AGE = timedelta()
+
+    # another request is refreshing them already, so the expired ones are served meanwhile
+    cache.add(_RECONCILE_LOCK_KEY, True)
+    with django_assert_num_queries(1):
+        assert _get_server_info(client).total_ghosts == 1
+
+    cache.delete(_RECONCILE_LOCK_KEY)
+    assert _get_server_info(client).total_ghosts == 0
@@ -3,6 +3,6 @@ from hsutils.viewmodels import announcements, server_info
 from . import views
 
 urlpatterns = [
-    announcements.wrap(get_handler=views.get_announcements),
+    announcements.wrap(get_handler=views.get_announcements, get_version=views.get_announcements_version),
     server_info.wrap(get_handler=views.get_server_info),
 ]
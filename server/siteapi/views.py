@@ -1,18 +1,18 @@
-from datetime import timedelta
-
 from django.conf import settings
-from django.db.models import Sum
 from django.http import HttpRequest
 
-from ghost_sharing.models import Ghost
-from haunted_sessions.models import Session
+from hsutils.conditional import ResourceVersion, queryset_version
 from hsutils.viewmodels import (
     AnnouncementEntry,
     AnnouncementsResponse,
     ServerInfoResponse,
 )
 
-from .models import Announcement, User
+from .models import Announcement, ServerStatistics
+
+
+def get_announcements_version(request: HttpRequest) -> ResourceVersion:
+    return queryset_version(Announcement.objects.all())
 
 
 def get_announcements(request: HttpRequest) -> AnnouncementsResponse:
@@ -29,12 +29,11 @@ def get_announcements(request: HttpRequest) -> AnnouncementsResponse:
 
 
 def get_server_info(request: HttpRequest) -> ServerInfoResponse:
+    statistics = ServerStatistics.current()
     return ServerInfoResponse(
-        total_users=User.objects.filter(is_active=True).count(),
-        total_sessions=Session.objects.count(),
-        total_ghosts=Ghost.objects.filter(published=True).count(),
-        total_ghost_duration=int(
-            (Ghost.objects.all().aggregate(Sum("duration"))["duration__sum"] or timedelta(seconds=0)).total_seconds(),
-        ),
+        total_users=statistics.total_users,
+        total_sessions=statistics.total_sessions,
+        total_ghosts=statistics.total_ghosts,
+        total_ghost_duration=int(statistics.total_ghost_duration.total_seconds()),
         coop_url=settings.COOP_SERVER_URL,
     )
@@ -18,6 +18,23 @@ function getCsrfHeader(): Headers {
   return headers;
 }
 
+function toQueryString(query: object): string {
+  const params = new URLSearchParams();
+  for (const [name, value] of Object.entries(query)) {
+    if (value === null || value === undefined) {
+      continue;
+    }
+    if (Array.isArray(value)) {
+      for (const entry of value) {
+        params.append(name, String(entry));
+      }
+    } else {
+      params.append(name, String(value));
+    }
+  }
+  return params.toString();
+}
+
 export async function doGet(url: string): Promise<object> {
   return await fetch(`${process.env.VUE_APP_SERVER_URL}${url}`, {
     credentials: "include",
@@ -18,6 +18,9 @@ class Endpoint:
     operation_name: str
     response: Compound | FileResponse
     body: Optional[Compound | FilesBody] = None
+    query: Optional[Compound] = None
+    # answer with 304 Not Modified if the version reported for the resource matches the one the client has
+    conditional: bool = False
 
 
 @dataclass(frozen=True, unsafe_hash=True, order=True)
@@ -47,6 +50,8 @@ def gather_compounds(endpoints: dict[ApiPath, dict[HttpMethod, Endpoint]]) -> li
                 all_compounds |= gather_dependencies(type(endpoint.response))
             if endpoint.body is not None and not isinstance(endpoint.body, FilesBody):
                 all_compounds |= gather_dependencies(type(endpoint.body))
+            if endpoint.query is not None:
+                all_compounds |= gather_dependencies(type(endpoint.query))
     return sorted(all_compounds, key=lambda x: x.typename())
 
 
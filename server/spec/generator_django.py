@@ -46,25 +46,9 @@ def _gen_check(context: str, indent: str, field: BaseField, accessor: str) -> tu
         output += f"{indent}if {accessor} is not None:\n"
         indent += base_indent
 
-    def gen_check(condition: str, message: str):
-        nonlocal output
-        output += f"{indent}if {condition}:\n"
-        output += f'{indent + base_indent}raise SchemaValidationError("{context} {message}")\n'
-
     has_constraints = False
-    if isinstance(field, StringField):
-        if field.min_length is not None:
-            gen_check(f"len({accessor}) < {field.min_length}", "is too short")
-        if field.max_length is not None:
-            gen_check(f"len({accessor}) > {field.max_length}", "is too long")
-        if field.regex is not None:
-            gen_check(f'not re.fullmatch(r"{field.regex}", {accessor})', "has an invalid format")
-        has_constraints = field.has_constraints
-    elif isinstance(field, (IntegerField, FloatField)):
-        if field.min is not None:
-            gen_check(f"{accessor} < {field.min}", "has a value below minimum")
-        if field.max is not None:
-            gen_check(f"{accessor} > {field.max}", "has a value above maximum")
+    if isinstance(field, (StringField, IntegerField, FloatField)):
+        output += _gen_constraint_checks(context, indent, field, accessor)
         has_constraints = field.has_constraints
     elif isinstance(field, ArrayField):
         varname = re.sub(r"[^a-zA-Z0-9]", "_", accessor) + "_entry"
@@ -87,6 +71,102 @@ def _gen_check(context: str, indent: str, field: BaseField, accessor: str) -> tu
     return output, has_constraints
 
 
+def _gen_type_check(context: str, indent: str, field: BaseField, accessor: str) -> str:
+    if isinstance(field, StringField):
+        condition = f"not isinstance({accessor}, str)"
+    elif isinstance(field, IntegerField):
+        condition = f"not isinstance({accessor}, int) or isinstance({accessor}, bool)"
+    elif isinstance(field, FloatField):
+        condition = f"not isinstance({accessor}, (int, float)) or isinstance({accessor}, bool)"
+    elif isinstance(field, BooleanField):
+        condition = f"not isinstance({accessor}, bool)"
+    elif isinstance(field, ArrayField):
+        condition = f"not isinstance({accessor}, list)"
+    else:
+        return ""
+    output = f"{indent}if {condition}:\n"
+    output += f'{indent + base_indent}raise SchemaValidationError("{context} has an invalid type")\n'
+    return output
+
+
+def _gen_constraint_checks(context: str, indent: str, field: BaseField, accessor: str) -> str:
+    output = ""
+
+    def gen_check(condition: str, message: str):
+        nonlocal output
+        output += f"{indent}if {condition}:\n"
+        output += f'{indent + base_indent}raise SchemaValidationError("{context} {message}")\n'
+
+    if isinstance(field, StringField):
+        if field.min_length is not None:
+            gen_check(f"len({accessor}) < {field.min_length}", "is too short")
+        if field.max_length is not None:
+            gen_check(f"len({accessor}) > {field.max_length}", "is too long")
+        if field.regex is not None:
+            gen_check(f'not re.fullmatch(r"{field.regex}", {accessor})', "has an invalid format")
+    elif isinstance(field, (IntegerField, FloatField)):
+        if field.min is not None:
+            gen_check(f"{accessor} < {field.min}", "has a value below minimum")
+        if field.max is not None:
+            gen_check(f"{accessor} > {field.max}", "has a value above maximum")
+
+    return output
+
+
+def _gen_conversion(context: str, indent: str, field: BaseField, accessor: str, decode: bool) -> str:
+    # validates the local variable named by accessor and replaces its value in the same pass; decoding turns
+    # parsed JSON data into schema instances, encoding turns schema instances into JSON-serializable data
+    body_indent = indent + base_indent if field.nullable else indent
+    body = _gen_type_check(context, body_indent, field, accessor) if decode else ""
+    if isinstance(field, ArrayField):
+        varname = re.sub(r"[^a-zA-Z0-9]", "_", accessor) + "_entry"
+        entry_conversion = _gen_conversion(context, body_indent + base_indent, field.items, varname, decode)
+        if isinstance(field.items, (ArrayField, Compound)) or (decode and isinstance(field.items, FloatField)):
+            body += f"{body_indent}{accessor}_converted = []\n"
+            body += f"{body_indent}for {varname} in {accessor}:\n"
+            body += entry_conversion
+            body += f"{body_indent + base_indent}{accessor}_converted.append({varname})\n"
+            body += f"{body_indent}{accessor} = {accessor}_converted\n"
+        elif entry_conversion:
+            body += f"{body_indent}for {varname} in {accessor}:\n"
+            body += entry_conversion
+    elif isinstance(field, Compound):
+        if decode:
+            body += f"{body_indent}{accessor} = {field.typename()}.from_json_data({accessor})\n"
+        else:
+            body += f"{body_indent}{accessor} = {accessor}.to_json_data()\n"
+    else:
+        body += _gen_constraint_checks(context, body_indent, field, accessor)
+        if decode and isinstance(field, FloatField):
+            body += f"{body_indent}{accessor} = float({accessor})\n"
+
+    if not field.nullable:
+        output = f"{indent}if {accessor} is None:\n"
+        output += f'{indent + base_indent}raise SchemaValidationError("{context} is null")\n'
+        return output + body
+    elif body:
+        return f"{indent}if {accessor} is not None:\n" + body
+    return ""
+
+
+def _gen_query_value_parser(field: BaseField) -> str:
+    if isinstance(field, StringField):
+        return "str"
+    elif isinstance(field, IntegerField):
+        return "int"
+    elif isinstance(field, FloatField):
+        return "float"
+    elif isinstance(field, BooleanField):
+        return "parse_bool"
+    raise RuntimeError(f"unsupported query parameter type {field.typename()}")
+
+
+def _gen_query_param_parser(field_name: str, field: BaseField) -> str:
+    if isinstance(field, ArrayField):
+        return f'[{_gen_query_value_parser(field.items)}(value) for value in request.GET.getlist("{field_name}")]'
+    return f'parse_query_value(request.GET.get("{field_name}"), {_gen_query_value_parser(field)})'
+
+
 def _gen_django_field_checks(
     context: str,
     accessor: str,
@@ -114,7 +194,7 @@ def gen_django(
         schema_output = "import re\n"
         schema_output += "from dataclasses_json import DataClassJsonMixin, dataclass_json\n"
         schema_output += "from dataclasses import dataclass\n"
-        schema_output += "from typing import List, Optional\n"
+        schema_output += "from typing import Any, List, Optional\n"
         schema_output += "from django.core.files.uploadedfile import UploadedFile\n"
         for dependency in dependencies:
             schema_output += f"from .{dependency} import {dependency}\n"
@@ -143,6 +223,41 @@ def gen_django(
         if not any_constraints:
             schema_output += "        return\n"
 
+        schema_output += "    @classmethod\n"
+        schema_output += f'    def from_json_data(cls, data: Any) -> "{schema.typename()}":\n'
+        schema_output += "        if not isinstance(data, dict):\n"
+        schema_output += f'            raise SchemaValidationError("{schema.typename()} has an invalid type")\n'
+        for field_name, field in schema.subfields():
+            schema_output += f'        {field_name}_value = data.get("{field_name}")\n'
+            schema_output += _gen_conversion(
+                f"{schema.typename()}.{field_name}",
+                base_indent * 2,
+                field,
+                f"{field_name}_value",
+                decode=True,
+            )
+        schema_output += (
+            "        return cls("
+            + ", ".join(f"{field_name}={field_name}_value" for field_name, _ in schema.subfields())
+            + ")\n"
+        )
+
+        schema_output += "    def to_json_data(self) -> dict[str, Any]:\n"
+        for field_name, field in schema.subfields():
+            schema_output += f"        {field_name}_value = self.{field_name}\n"
+            schema_output += _gen_conversion(
+                f"{schema.typename()}.{field_name}",
+                base_indent * 2,
+                field,
+                f"{field_name}_value",
+                decode=False,
+            )
+        schema_output += (
+            "        return {"
+            + ", ".join(f'"{field_name}": {field_name}_value' for field_name, _ in schema.subfields())
+            + "}\n"
+        )
+
         schema_outputs[schema.typename()] = schema_output
 
     output = "from typing import Callable, Optional, List\n"
@@ -154,8 +269,11 @@ def gen_django(
     output += "from enum import Enum\n"
     output += "from http import HTTPStatus\n"
     output += "from .validated_response import validated_response\n"
+    output += "from .rest_helper import parse_bool, parse_query_value\n"
+    output += "from .json_codec import loads_json\n"
     output += "from .error import SchemaValidationError\n"
     output += "from .validated_response import Validatable\n"
+    output += "from .conditional import ResourceVersion, conditional_response\n"
 
     for schema_name in schema_outputs.keys():
         output += f"from .schemas.{schema_name} import {schema_name}\n"
@@ -200,17 +318,34 @@ def gen_django(
         for method, endpoint in methods_endpoints.items():
             handler_signature = make_handler_signature(url_arg_types, endpoint, method)
             output += f"        {method.name.lower()}_handler: {handler_signature},\n"
+            if endpoint.conditional:
+                if method != HttpMethod.GET:
+                    raise RuntimeError("only GET endpoints can be conditional")
+                version_signature = ", ".join(["HttpRequest"] + url_arg_types)
+                output += (
+                    f"        {method.name.lower()}_version: "
+                    f"Callable[[{version_signature}], Optional[ResourceVersion]],\n"
+                )
         output += "    ):\n"
         output += (
             "        def dispatch(" + ", ".join(["request: HttpRequest"] + url_args_in) + ") -> HttpResponseBase:\n"
         )
         for method, endpoint in methods_endpoints.items():
             output += f'            if request.method == "{method.value}":\n'
-            output += (
-                f"                return cls.do_{method.value.lower()}("
+            do_call = (
+                f"cls.do_{method.value.lower()}("
                 + ", ".join(["request", f"{method.value.lower()}_handler", *url_args_out])
-                + ")\n"
+                + ")"
             )
+            if endpoint.conditional:
+                output += (
+                    "                return conditional_response(request, "
+                    + f"{method.value.lower()}_version("
+                    + ", ".join(["request", *url_args_out])
+                    + f"), lambda: {do_call})\n"
+                )
+            else:
+                output += f"                return {do_call}\n"
         output += "            return JsonResponse(data={}, status=HTTPStatus.METHOD_NOT_ALLOWED)\n"
         output += "        return path(cls.path, dispatch, name=cls.name)\n"
 
@@ -236,20 +371,32 @@ def gen_django(
                     output += "        files: dict[str, UploadedFile] = request.FILES\n"
                     output += "        response = handler(" + ", ".join(["request", *url_args_out, "files"]) + ")\n"
                 else:
+                    output += "        try:\n"
                     output += (
-                        f"        body: {endpoint.body.typename()} = {endpoint.body.typename()}"
-                        f".schema().loads(request.body.decode())\n"
+                        f"            body = {endpoint.body.typename()}.from_json_data(loads_json(request.body))\n"
                     )
-                    output += "        try:\n"
-                    output += "            body.validate()\n"
-                    output += "        except SchemaValidationError as e:\n"
+                    output += "        except (ValueError, SchemaValidationError) as e:\n"
                     output += '            logging.error("request validation failed", exc_info=True)\n'
                     output += (
                         '            return JsonResponse(status=HTTPStatus.BAD_REQUEST, data={"message": str(e)})\n'
                     )
                     output += "        response = handler(" + ", ".join(["request", *url_args_out, "body"]) + ")\n"
             elif method in (HttpMethod.GET, HttpMethod.DELETE):
-                output += "        response = handler(" + ", ".join(["request", *url_args_out]) + ")\n"
+                if endpoint.query is not None:
+                    output += "        try:\n"
+                    output += f"            query = {endpoint.query.typename()}(\n"
+                    for field_name, field in endpoint.query.subfields():
+                        output += f"                {field_name}={_gen_query_param_parser(field_name, field)},\n"
+                    output += "            )\n"
+                    output += "            query.validate()\n"
+                    output += "        except (ValueError, SchemaValidationError) as e:\n"
+                    output += '            logging.error("request validation failed", exc_info=True)\n'
+                    output += (
+                        '            return JsonResponse(status=HTTPStatus.BAD_REQUEST, data={"message": str(e)})\n'
+                    )
+                    output += "        response = handler(" + ", ".join(["request", *url_args_out, "query"]) + ")\n"
+                else:
+                    output += "        response = handler(" + ", ".join(["request", *url_args_out]) + ")\n"
             else:
                 raise RuntimeError
 
@@ -276,12 +423,16 @@ def make_handler_signature(arg_types: list[str], endpoint: Endpoint, method: Htt
 
     if method == HttpMethod.POST:
         assert endpoint.body is not None
+        assert endpoint.query is None
         if isinstance(endpoint.body, FilesBody):
             handler_signature = f"Callable[[{input_signature}, dict[str, UploadedFile]]," f" {result_signature}]"
         else:
             handler_signature = f"Callable[[{input_signature}, {endpoint.body.typename()}]," f" {result_signature}]"
     elif method in (HttpMethod.GET, HttpMethod.DELETE):
-        handler_signature = f"Callable[[{input_signature}]," f" {result_signature}]"
+        if endpoint.query is not None:
+            handler_signature = f"Callable[[{input_signature}, {endpoint.query.typename()}]," f" {result_signature}]"
+        else:
+            handler_signature = f"Callable[[{input_signature}]," f" {result_signature}]"
     else:
         raise RuntimeError
     return handler_signature
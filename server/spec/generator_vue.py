@@ -127,6 +127,10 @@ def gen_vue(schemas: list[BaseField | Compound], endpoints: dict[ApiPath, dict[H
                     output += "files: File[]"
                 else:
                     output += f"body: I{endpoint.body.typename()}"
+            if endpoint.query is not None:
+                if args_str or endpoint.body is not None:
+                    output += ", "
+                output += f"query: I{endpoint.query.typename()}"
             result_type = (
                 "ReadableStream<Uint8Array> | null"
                 if isinstance(endpoint.response, FileResponse)
@@ -135,11 +139,14 @@ def gen_vue(schemas: list[BaseField | Compound], endpoints: dict[ApiPath, dict[H
             output += f"): Promise<{result_type}> {{\n"
             if endpoint.body is not None and not isinstance(endpoint.body, FilesBody):
                 output += f"  validate{endpoint.body.typename()}(body);\n"
+            if endpoint.query is not None:
+                output += f"  validate{endpoint.query.typename()}(query);\n"
+            query_str = "?${toQueryString(query)}" if endpoint.query is not None else ""
             if isinstance(endpoint.body, FilesBody):
-                output += f"  const result = (await do{method.value.capitalize()}Files(`{ts_url}`"
+                output += f"  const result = (await do{method.value.capitalize()}Files(`{ts_url}{query_str}`"
             else:
                 file_suffix = "File" if isinstance(endpoint.response, FileResponse) else ""
-                output += f"  const result = (await do{method.value.capitalize()}{file_suffix}(`{ts_url}`"
+                output += f"  const result = (await do{method.value.capitalize()}{file_suffix}(`{ts_url}{query_str}`"
             if endpoint.body is not None:
                 if isinstance(endpoint.body, FilesBody):
                     output += ", files"
@@ -120,6 +120,21 @@ class SessionAccessRequest(Compound):
     api_key = StringField(min_length=1)
 
 
+class SessionAccessEntry(Compound):
+    username = StringField(min_length=1)
+    auth_token = StringField(min_length=1)
+    session_id = StringField(min_length=1)
+
+
+class BulkSessionAccessRequest(Compound):
+    entries = ArrayField(items=SessionAccessEntry())
+    api_key = StringField(min_length=1)
+
+
+class BulkSessionAccessResponse(Compound):
+    results = ArrayField(items=SuccessResponse())
+
+
 class SessionPlayers(Compound):
     session_id = StringField(min_length=1)
     usernames = ArrayField(items=StringField(min_length=1))
@@ -161,6 +176,16 @@ class GhostFileResponseEntry(Compound):
 
 class GhostFilesResponse(Compound):
     files = ArrayField(items=GhostFileResponseEntry())
+    next_cursor = StringField(nullable=True, min_length=1)
+
+
+class GhostsQuery(Compound):
+    cursor = StringField(nullable=True, min_length=1)
+    limit = IntegerField(nullable=True, min=1, max=100)
+    tags = ArrayField(items=IntegerField())
+    level_id = IntegerField(nullable=True)
+    finish_type = StringField(nullable=True, min_length=1)
+    username = StringField(nullable=True, min_length=1)
 
 
 class GhostFileResponse(Compound):
@@ -226,12 +251,14 @@ def main():
             HttpMethod.GET: Endpoint(
                 operation_name="getTags",
                 response=TagsResponse(),
+                conditional=True,
             ),
         },
         ApiPath("/api/v0/sessions", "sessions"): {
             HttpMethod.GET: Endpoint(
                 operation_name="getSessions",
                 response=SessionsResponse(),
+                conditional=True,
             ),
             HttpMethod.POST: Endpoint(
                 operation_name="createSession",
@@ -261,6 +288,13 @@ def main():
                 body=SessionAccessRequest(),
             ),
         },
+        ApiPath("/api/v0/sessions/check-access-bulk", "bulkSessionAccess"): {
+            HttpMethod.POST: Endpoint(
+                operation_name="checkBulkSessionAccess",
+                response=BulkSessionAccessResponse(),
+                body=BulkSessionAccessRequest(),
+            ),
+        },
         ApiPath("/api/v0/sessions/session-players", "sessionPlayers"): {
             HttpMethod.POST: Endpoint(
                 operation_name="updateSessionsPlayers",
@@ -272,6 +306,7 @@ def main():
             HttpMethod.GET: Endpoint(
                 operation_name="getAnnouncements",
                 response=AnnouncementsResponse(),
+                conditional=True,
             ),
         },
         ApiPath("/api/v0/auth/profile", "profile"): {
@@ -331,6 +366,8 @@ def main():
             HttpMethod.GET: Endpoint(
                 operation_name="getGhosts",
                 response=GhostFilesResponse(),
+                query=GhostsQuery(),
+                conditional=True,
             ),
             HttpMethod.POST: Endpoint(
                 operation_name="uploadGhost",
@@ -371,10 +408,18 @@ def main():
                 response=QuotaResponse(),
             ),
         },
+        ApiPath("/api/v0/ghosts/levels", "ghost_levels"): {
+            HttpMethod.GET: Endpoint(
+                operation_name="getGhostLevels",
+                response=LevelsResponse(),
+                conditional=True,
+            ),
+        },
         ApiPath("/api/v0/levels/<str:identifier>", "levels"): {
             HttpMethod.GET: Endpoint(
                 operation_name="getAlternativeLevels",
                 response=LevelsResponse(),
+                conditional=True,
             ),
         },
     }
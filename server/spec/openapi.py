@@ -113,6 +113,21 @@ def _get_type_of(field: BaseField | Compound) -> dict:
         raise RuntimeError(f"unexpected type {field}")
 
 
+def _make_query_parameters(query: Compound | None) -> list[dict]:
+    if query is None:
+        return []
+    return [
+        {
+            "name": field_name,
+            "in": "query",
+            "required": not isinstance(field_type, ArrayField) and not field_type.nullable,
+            "schema": _get_type_of(field_type),
+            **({"style": "form", "explode": True} if isinstance(field_type, ArrayField) else {}),
+        }
+        for field_name, field_type in query.subfields()
+    ]
+
+
 def gen_openapi(schemas: list[BaseField | Compound], endpoints: dict[ApiPath, dict[HttpMethod, Endpoint]]) -> str:
     document = {
         "openapi": "3.0.0",
@@ -137,7 +152,13 @@ def gen_openapi(schemas: list[BaseField | Compound], endpoints: dict[ApiPath, di
                             },
                         }
                         for p_name, p_spec in get_url_params(path.path).items()
-                    ],
+                    ]
+                    + _make_query_parameters(ep.query)
+                    + (
+                        [{"name": "If-None-Match", "in": "header", "required": False, "schema": {"type": "string"}}]
+                        if ep.conditional
+                        else []
+                    ),
                     **(
                         {
                             "requestBody": {
@@ -164,6 +185,7 @@ def gen_openapi(schemas: list[BaseField | Compound], endpoints: dict[ApiPath, di
                                 },
                             },
                         },
+                        **({"304": {"description": "not modified"}} if ep.conditional else {}),
                     },
                 }
                 for method, ep in methods_endpoints.items()